@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Catalog Benchmark Tool
+Builds synthetic solution trees and times the catalog and validation tools against them
+
+Each run creates a throwaway repository layout containing a copy of
+support/tools, the solution-template and N generated solutions under
+solutions/<provider>/<category>/<solution>, then runs every tool as a
+subprocess and records wall and CPU time per phase as JSON so runs can be
+compared over time.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+import yaml
+from pathlib import Path
+from datetime import datetime
+
+RESULTS_SCHEMA_VERSION = 1
+
+PROVIDERS = ['aws', 'azure', 'cisco', 'dell', 'github', 'google', 'hashicorp', 'ibm', 'juniper', 'microsoft', 'nvidia']
+CATEGORIES = ['ai', 'cloud', 'cyber-security', 'devops', 'modern-workspace', 'network']
+COMPLEXITIES = ['basic', 'intermediate', 'advanced', 'enterprise']
+DEPLOYMENT_TIMES = ['1-2 weeks', '2-4 weeks', '4-8 weeks', '8-12 weeks', '3-6 months']
+STATUSES = ['Draft', 'In Review', 'Active', 'Beta']
+VOCABULARY = [
+    'automation', 'analytics', 'backup', 'compliance', 'container', 'data', 'disaster-recovery',
+    'edge', 'firewall', 'gpu', 'governance', 'hybrid', 'identity', 'inference', 'kubernetes',
+    'landing-zone', 'migration', 'monitoring', 'network', 'observability', 'pipeline', 'platform',
+    'security', 'serverless', 'siem', 'storage', 'terraform', 'virtual-desktop', 'wan', 'zero-trust'
+]
+
+# Files copied into every solution in "light" mode: metadata, README, raw sources and binaries
+LIGHT_CONTENT_SUFFIXES = ('.csv', '.docx', '.xlsx', '.pptx')
+
+PHASES = [
+    ('generate-catalogs', ['generate-catalogs.py', '--full']),
+    ('generate-catalogs-incremental', ['generate-catalogs.py']),
+    ('process-catalogs', ['process-catalogs.py']),
+    ('validate-catalogs', ['validate-catalogs.py']),
+    ('validate-template-all', ['validate-template.py', '--all']),
+    ('export-templates-csv', ['export-templates-csv.py', '--output-type', 'public', '--git-based']),
+]
+
+def parse_size(value):
+    """Parse a corpus size such as 1000, 10k or 0.1m"""
+    value = value.strip().lower()
+    multiplier = 1
+    if value.endswith('k'):
+        multiplier, value = 1000, value[:-1]
+    elif value.endswith('m'):
+        multiplier, value = 1000000, value[:-1]
+    try:
+        size = int(float(value) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid corpus size: {value}")
+    if size <= 0:
+        raise argparse.ArgumentTypeError("corpus size must be positive")
+    return size
+
+def link_or_copy(source, target):
+    """Hard link a file into the corpus, copying when linking is not possible"""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+def generate_metadata(rng, provider, category, solution_name):
+    """Build a realistic metadata.yml document for a synthetic solution"""
+    tags = rng.sample(VOCABULARY, rng.randint(3, 7)) + [provider, category]
+    title = solution_name.replace('-', ' ').title()
+    sentences = [
+        f"{title} helps teams adopt {rng.choice(VOCABULARY).replace('-', ' ')} on {provider.upper()}.",
+        f"It combines {', '.join(t.replace('-', ' ') for t in tags[:3])} into a repeatable delivery.",
+        f"The solution ships presales material, automation and runbooks for {category.replace('-', ' ')} teams."
+    ]
+    return {
+        'provider': provider,
+        'category': category,
+        'solution_name': solution_name,
+        'solution_display_name': title,
+        'description': sentences[0],
+        'long_description': ' '.join(sentences * rng.randint(1, 3)) + '\n',
+        'version': f"1.{rng.randint(0, 9)}.{rng.randint(0, 9)}",
+        'status': rng.choice(STATUSES),
+        'complexity': rng.choice(COMPLEXITIES),
+        'deployment_time': rng.choice(DEPLOYMENT_TIMES),
+        'maintainers': [{
+            'name': f"EO Framework™ {provider.upper()} Solutions Team",
+            'email': f"{provider}-solutions@eoframework.com",
+            'role': 'Solution Architect'
+        }],
+        'tags': tags,
+        'requirements': {
+            'prerequisites': [f"{provider.upper()} Account", 'Administrative Access'],
+            'tools': ['Terraform', 'Python 3.8+', f"{provider.upper()} CLI"],
+            'skills': [f"{provider.upper()} Platform", 'Solution Architecture']
+        }
+    }
+
+def template_files(template_dir, content):
+    """Relative paths of the template files each synthetic solution receives"""
+    files = []
+    for root, dirs, names in os.walk(template_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(names):
+            rel_path = (Path(root) / name).relative_to(template_dir)
+            if name == 'metadata.yml' or name.startswith('.'):
+                continue
+            is_root_readme = name == 'README.md' and rel_path.parent == Path('.')
+            if content == 'full' or is_root_readme or name.endswith(LIGHT_CONTENT_SUFFIXES):
+                files.append(rel_path)
+    return files
+
+def build_corpus(repo_root, corpus_root, size, content='light', seed=0):
+    """Create a synthetic repository with `size` solutions under corpus_root"""
+    rng = random.Random(seed)
+    template_dir = repo_root / 'solution-template' / 'sample-provider' / 'sample-category' / 'sample-solution'
+
+    # Tools resolve the repository from their own location, so they travel with the corpus
+    shutil.copytree(repo_root / 'support' / 'tools', corpus_root / 'support' / 'tools',
+                    ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.cache'))
+    shutil.copytree(repo_root / 'solution-template', corpus_root / 'solution-template')
+    for support_dir in ('catalog', 'exports', 'reports'):
+        (corpus_root / 'support' / support_dir).mkdir(parents=True, exist_ok=True)
+    schemas_dir = repo_root / 'support' / 'catalog' / 'schemas'
+    if schemas_dir.exists():
+        shutil.copytree(schemas_dir, corpus_root / 'support' / 'catalog' / 'schemas')
+
+    files = template_files(template_dir, content)
+    directories = sorted({rel_path.parent for rel_path in files})
+
+    for number in range(size):
+        provider = PROVIDERS[number % len(PROVIDERS)]
+        category = CATEGORIES[(number // len(PROVIDERS)) % len(CATEGORIES)]
+        solution_name = f"{rng.choice(VOCABULARY)}-{rng.choice(VOCABULARY)}-{number:06d}"
+        solution_dir = corpus_root / 'solutions' / provider / category / solution_name
+
+        for rel_dir in directories:
+            (solution_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+        for rel_path in files:
+            link_or_copy(template_dir / rel_path, solution_dir / rel_path)
+
+        metadata = generate_metadata(rng, provider, category, solution_name)
+        with open(solution_dir / 'metadata.yml', 'w') as f:
+            yaml.dump(metadata, f, default_flow_style=False, sort_keys=False)
+
+def run_phase(corpus_root, name, command, timeout):
+    """Run one tool inside the corpus and measure it"""
+    script = corpus_root / 'support' / 'tools' / command[0]
+    argv = [sys.executable, str(script)] + command[1:]
+
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(argv, cwd=corpus_root, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True, timeout=timeout)
+        returncode = result.returncode
+        stderr_tail = result.stderr.strip().splitlines()[-5:]
+    except subprocess.TimeoutExpired:
+        returncode = None
+        stderr_tail = [f"timed out after {timeout}s"]
+    seconds = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    return {
+        'name': name,
+        'command': ' '.join(command),
+        'seconds': round(seconds, 4),
+        'cpu_seconds': round((after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime), 4),
+        'returncode': returncode,
+        'stderr_tail': stderr_tail
+    }
+
+def run_benchmark(repo_root, size, content, seed, phases, workdir=None, keep=False, timeout=None):
+    """Build one corpus, run the selected phases and return the measurements"""
+    corpus_root = Path(tempfile.mkdtemp(prefix=f"eof-bench-{size}-", dir=workdir))
+    print(f"\n🏗️  Building {size} solution corpus ({content}) in {corpus_root}")
+    try:
+        start = time.perf_counter()
+        build_corpus(repo_root, corpus_root, size, content=content, seed=seed)
+        corpus_seconds = time.perf_counter() - start
+        print(f"✓ Corpus ready in {corpus_seconds:.1f}s")
+
+        results = []
+        for name, command in PHASES:
+            if phases and name not in phases:
+                continue
+            result = run_phase(corpus_root, name, command, timeout)
+            status = "✓" if result['returncode'] == 0 else "✗"
+            print(f"{status} {name}: {result['seconds']:.2f}s wall, {result['cpu_seconds']:.2f}s cpu")
+            results.append(result)
+
+        return {
+            'solutions': size,
+            'content': content,
+            'seed': seed,
+            'corpus_seconds': round(corpus_seconds, 4),
+            'phases': results
+        }
+    finally:
+        if keep:
+            print(f"📁 Corpus kept at {corpus_root}")
+        else:
+            shutil.rmtree(corpus_root, ignore_errors=True)
+
+def git_commit(repo_root):
+    """Current commit of the real repository, if available"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(previous, current):
+    """Print per-phase timing ratios against an earlier results file"""
+    print("\n📈 Comparison with previous run:")
+    previous_runs = {run['solutions']: run for run in previous.get('runs', [])}
+    for run in current['runs']:
+        baseline = previous_runs.get(run['solutions'])
+        if not baseline:
+            print(f"  {run['solutions']} solutions: no baseline")
+            continue
+        baseline_phases = {phase['name']: phase for phase in baseline['phases']}
+        print(f"  {run['solutions']} solutions:")
+        for phase in run['phases']:
+            old = baseline_phases.get(phase['name'])
+            if not old or not old['seconds']:
+                print(f"    {phase['name']}: {phase['seconds']:.2f}s (no baseline)")
+                continue
+            ratio = phase['seconds'] / old['seconds']
+            print(f"    {phase['name']}: {old['seconds']:.2f}s → {phase['seconds']:.2f}s ({ratio:.2f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark catalog tools against synthetic solution trees')
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[1000],
+                        help='Corpus sizes to benchmark, e.g. 1k 10k 100k (default: 1k)')
+    parser.add_argument('--content', choices=['light', 'full'], default='light',
+                        help='light: metadata, README, raw CSVs and Office binaries; full: the whole solution-template')
+    parser.add_argument('--phases', nargs='+', choices=[name for name, _ in PHASES],
+                        help='Only run these phases (default: all)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for generated metadata')
+    parser.add_argument('--workdir', help='Directory for temporary corpora (default: system temp)')
+    parser.add_argument('--keep', action='store_true', help='Keep generated corpora for inspection')
+    parser.add_argument('--timeout', type=int, help='Abort a phase after this many seconds')
+    parser.add_argument('--output', help='Results file (default: support/reports/benchmarks/benchmark-<timestamp>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).parent.parent.parent
+
+    report = {
+        'schema_version': RESULTS_SCHEMA_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'git_commit': git_commit(repo_root),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'runs': []
+    }
+
+    for size in args.sizes:
+        report['runs'].append(run_benchmark(
+            repo_root, size, args.content, args.seed, args.phases,
+            workdir=args.workdir, keep=args.keep, timeout=args.timeout
+        ))
+
+    if args.output:
+        output_file = Path(args.output)
+    else:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output_file = repo_root / 'support' / 'reports' / 'benchmarks' / f"benchmark-{stamp}.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results: {output_file}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare_results(json.load(f), report)
+
+    failed = [phase['name'] for run in report['runs'] for phase in run['phases'] if phase['returncode'] != 0]
+    if failed:
+        print(f"⚠️  Phases with non-zero exit: {', '.join(sorted(set(failed)))}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Catalog Pipeline
+Runs catalog generation, processing and CSV export in a single process
+
+The solution tree is scanned once into an in-memory catalog model, which then
+feeds the YAML catalogs, support/exports/solutions.json and both CSV exports.
+Equivalent to running generate-catalogs.py, process-catalogs.py and
+export-templates-csv.py one after another, without re-reading what the
+previous step just wrote.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import argparse
+from pathlib import Path
+
+from catalog_export import EXPORT_COMPRESSIONS, EXPORT_FORMATS
+from catalog_model import load_tool_module
+
+def run_pipeline(repo_root, solution_paths=None, full=False, jobs=None, git_based=True, deterministic=False,
+                 export_format='json', compact=False, compression='none', delta_from=None, public_only=False):
+    """Generate catalogs, exports and CSVs from one scan of the solution tree
+
+    public_only skips the internal CSV, for jobs that publish their workspace.
+    """
+    generate_catalogs = load_tool_module('generate-catalogs')
+    process_catalogs = load_tool_module('process-catalogs')
+    export_templates_csv = load_tool_module('export-templates-csv')
+
+    catalog_dir = repo_root / "support" / "catalog"
+
+    # Step 1: scan metadata and write the YAML catalogs
+    generator = generate_catalogs.CatalogGenerator(
+        providers_dir=repo_root / "solutions",
+        catalog_dir=catalog_dir,
+        jobs=jobs,
+        deterministic=deterministic
+    )
+    has_manifest = not full and generator.load_manifest()
+    if solution_paths and has_manifest:
+        generator.load_manifest_solutions()
+        generator.scan_specific_solutions(solution_paths)
+    else:
+        generator.scan_solutions()
+    generator.generate_catalogs()
+
+    model = generator.to_model()
+
+    # Step 2: unified JSON export and statistics
+    print()
+    processor = process_catalogs.CatalogProcessor(catalog_dir)
+    stats = processor.run_full_processing(
+        model=model, export_format=export_format, compact=compact, compression=compression, delta_from=delta_from
+    )
+
+    # Step 3: website and internal CSV exports
+    print()
+    export_templates_csv.sync_to_csv(output_type='public', git_based=git_based, model=model)
+    if not public_only:
+        export_templates_csv.sync_to_csv(output_type='private', model=model)
+
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate catalogs, JSON and CSV exports in one pass')
+    parser.add_argument('--solutions', type=str, help='Space-separated list of changed solution paths (provider/category/solution)')
+    parser.add_argument('--full', action='store_true', help='Ignore the generation manifest and rebuild every catalog')
+    parser.add_argument('--jobs', type=int, help='Worker processes for parsing metadata (default: CPU count)')
+    parser.add_argument('--deterministic', action='store_true', help='Derive catalog timestamps from source changes and skip identical writes')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='json', help='solutions export format (default: json)')
+    parser.add_argument('--compact', action='store_true', help='Write the JSON export without indentation')
+    parser.add_argument('--compress', choices=EXPORT_COMPRESSIONS, default='none', help='Compress the solutions export (zstd needs the zstandard package)')
+    parser.add_argument('--delta-from', type=str, help='Previously published solutions export to diff against')
+    parser.add_argument('--zip-urls', action='store_true', help='Use legacy ZIP download URLs in the public CSV instead of Git URLs')
+    parser.add_argument('--public-only', action='store_true', help='Write only the public CSV, not the internal one')
+    args = parser.parse_args()
+
+    # Auto-detect paths relative to script location
+    repo_root = Path(__file__).parent.parent.parent
+    solution_paths = args.solutions.strip().split() if args.solutions else None
+
+    stats = run_pipeline(
+        repo_root,
+        solution_paths=solution_paths,
+        full=args.full,
+        jobs=args.jobs,
+        git_based=not args.zip_urls,
+        deterministic=args.deterministic,
+        export_format=args.format,
+        compact=args.compact,
+        compression=args.compress,
+        delta_from=args.delta_from,
+        public_only=args.public_only
+    )
+
+    print("\n✅ Catalog pipeline completed successfully!")
+    print(f"📊 Total solutions: {stats['total_solutions']}")
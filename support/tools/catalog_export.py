@@ -0,0 +1,243 @@
+"""
+Catalog Export
+Streaming writers for the solution exports in support/exports
+
+Solutions are encoded and written one at a time, so the export never holds
+a second full copy of the catalog as one document or string. Output can be
+pretty or compact JSON, or NDJSON (one solution per line), optionally
+compressed with gzip or zstd. Sharded exports split the solutions into one
+small file per provider and per category.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from catalog_model import write_text_if_changed
+
+EXPORT_FORMATS = ('json', 'ndjson')
+EXPORT_COMPRESSIONS = ('none', 'gzip', 'zstd')
+COMPRESSION_SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+SHARD_INDEX_FILENAME = 'index.json'
+SHARD_INDEX_VERSION = 1
+# Shard group -> key naming the group inside each shard
+SHARD_KINDS = {'providers': 'provider', 'categories': 'category'}
+
+
+def export_path(output_file, export_format='json', compression='none'):
+    """Output path with the extension matching the format and compression"""
+    output_file = Path(output_file)
+    stem = output_file.name.split('.', 1)[0]
+    return output_file.with_name(f"{stem}.{export_format}{COMPRESSION_SUFFIXES[compression]}")
+
+
+@contextmanager
+def open_export(path, compression='none'):
+    """Open a text stream for an export file, written atomically on success
+
+    zstd output needs the optional 'zstandard' package; a RuntimeError
+    explains how to install it when it is missing.
+    """
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd compression requires the 'zstandard' package (pip3 install zstandard)")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+
+    raw = open(temp_path, 'wb')
+    try:
+        if compression == 'gzip':
+            # mtime=0 keeps identical exports byte for byte identical
+            binary = gzip.GzipFile(filename='', mode='wb', fileobj=raw, compresslevel=GZIP_LEVEL, mtime=0)
+        elif compression == 'zstd':
+            binary = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+        else:
+            binary = raw
+        stream = io.TextIOWrapper(binary, encoding='utf-8', newline='\n', write_through=False)
+        try:
+            yield stream
+        finally:
+            stream.flush()
+            stream.detach()
+            if binary is not raw:
+                binary.close()
+    except BaseException:
+        raw.close()
+        temp_path.unlink()
+        raise
+    raw.close()
+    os.replace(temp_path, path)
+
+
+def write_json_export(stream, header, solutions, default, compact=False):
+    """Write {**header, "solutions": [...]} encoding one solution at a time
+
+    Pretty output is byte-identical to json.dump(..., indent=2).
+    """
+    if compact:
+        encoder = json.JSONEncoder(separators=(',', ':'), default=default)
+        stream.write('{')
+        for key, value in header.items():
+            stream.write(f"{encoder.encode(key)}:{encoder.encode(value)},")
+        stream.write('"solutions":[')
+        for index, solution in enumerate(solutions):
+            if index:
+                stream.write(',')
+            for chunk in encoder.iterencode(solution):
+                stream.write(chunk)
+        stream.write(']}')
+        return
+
+    encoder = json.JSONEncoder(indent=2, default=default)
+    stream.write('{\n')
+    for key, value in header.items():
+        stream.write(f"  {encoder.encode(key)}: {encoder.encode(value).replace(chr(10), chr(10) + '  ')},\n")
+    stream.write('  "solutions": [')
+    count = 0
+    for solution in solutions:
+        stream.write(',\n    ' if count else '\n    ')
+        # JSON strings escape newlines, so every raw newline is structural
+        stream.write(encoder.encode(solution).replace('\n', '\n    '))
+        count += 1
+    stream.write('\n  ]\n}' if count else ']\n}')
+
+
+def write_ndjson_export(stream, solutions, default):
+    """Write one compact JSON solution per line"""
+    encoder = json.JSONEncoder(separators=(',', ':'), default=default)
+    for solution in solutions:
+        stream.write(encoder.encode(solution))
+        stream.write('\n')
+
+
+def write_shards(shard_dir, groups, default):
+    """Write one compact JSON file per provider and category plus an index
+
+    groups maps 'providers' and 'categories' to {name: (display_name, solutions)}.
+    Shards carry no timestamps, so a shard's sha256 in the index only changes
+    when its solutions do and clients can cache shards by hash. Unchanged
+    files are not rewritten and shards for vanished groups are removed.
+
+    Returns the index document.
+    """
+    shard_dir = Path(shard_dir)
+    encoder = json.JSONEncoder(separators=(',', ':'), default=default)
+    index = {'schema_version': SHARD_INDEX_VERSION, 'total_solutions': 0}
+
+    for kind, kind_groups in groups.items():
+        entries = {}
+        for name, (display_name, solutions) in sorted(kind_groups.items()):
+            solutions = sorted(solutions, key=lambda solution: solution['id'])
+            content = encoder.encode({
+                SHARD_KINDS[kind]: name,
+                'display_name': display_name,
+                'total_solutions': len(solutions),
+                'solutions': solutions
+            })
+            data = content.encode('utf-8')
+            rel_path = f"{kind}/{name}.json"
+            write_text_if_changed(shard_dir / rel_path, content)
+            entries[name] = {
+                'path': rel_path,
+                'display_name': display_name,
+                'count': len(solutions),
+                'bytes': len(data),
+                'sha256': hashlib.sha256(data).hexdigest()
+            }
+        index[kind] = entries
+
+        kind_dir = shard_dir / kind
+        if kind_dir.is_dir():
+            for shard_file in kind_dir.glob('*.json'):
+                if shard_file.stem not in entries:
+                    shard_file.unlink()
+
+    index['total_solutions'] = sum(entry['count'] for entry in index.get('providers', {}).values())
+    write_text_if_changed(shard_dir / SHARD_INDEX_FILENAME, json.dumps(index, indent=2))
+    return index
+
+
+def read_export_solutions(path):
+    """Solutions from an earlier export: JSON document or NDJSON, optionally .gz or .zst"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if path.suffix == '.gz':
+        data = gzip.decompress(data)
+    elif path.suffix == '.zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("Reading .zst exports requires the 'zstandard' package (pip3 install zstandard)")
+        data = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+
+    text = data.decode('utf-8')
+    if '.ndjson' in path.suffixes:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return json.loads(text).get('solutions', [])
+
+
+def field_changes(old, new, prefix=''):
+    """Changed fields between two solution dicts as {dotted.path: {'old', 'new'}}
+
+    Nested mappings are compared key by key; lists and scalars as a whole.
+    """
+    changes = {}
+    for key in sorted(set(old) | set(new), key=str):
+        path = f"{prefix}{key}"
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value == new_value and (key in old) == (key in new):
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changes.update(field_changes(old_value, new_value, prefix=f"{path}."))
+        else:
+            changes[path] = {'old': old_value, 'new': new_value}
+    return changes
+
+
+def solutions_delta(previous, current):
+    """Added, removed and modified solutions between two exports, matched by id
+
+    Both arguments are sequences of plain JSON-compatible solution dicts.
+    """
+    previous_by_id = {solution['id']: solution for solution in previous}
+    current_by_id = {solution['id']: solution for solution in current}
+
+    added = [current_by_id[solution_id] for solution_id in sorted(set(current_by_id) - set(previous_by_id))]
+    removed = sorted(set(previous_by_id) - set(current_by_id))
+    modified = []
+    for solution_id in sorted(set(current_by_id) & set(previous_by_id)):
+        changes = field_changes(previous_by_id[solution_id], current_by_id[solution_id])
+        if changes:
+            modified.append({'id': solution_id, 'changes': changes})
+
+    return {
+        'summary': {
+            'added': len(added),
+            'removed': len(removed),
+            'modified': len(modified),
+            'unchanged': len(current_by_id) - len(added) - len(modified)
+        },
+        'added': added,
+        'removed': removed,
+        'modified': modified
+    }
@@ -0,0 +1,286 @@
+"""
+Catalog Model
+Shared in-memory representation of the solution catalog used by the catalog tools
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import hashlib
+import importlib.util
+import json
+import sys
+import yaml
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+# libyaml's C loader is several times faster; fall back to pure Python when it is missing
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+TOOLS_DIR = Path(__file__).parent
+
+# Compact JSON mirror of the YAML catalogs; bump the version when its layout changes
+CATALOG_INDEX_FILENAME = 'catalog.index.json'
+CATALOG_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SolutionRecord:
+    """A single solution and its metadata.yml content"""
+    provider: str
+    category: str
+    name: str
+    metadata: dict
+
+    @property
+    def key(self):
+        """Path-style key: provider/category/solution"""
+        return f"{self.provider}/{self.category}/{self.name}"
+
+    @property
+    def id(self):
+        """Identifier used in the JSON exports"""
+        return f"{self.provider}-{self.category}-{self.name}"
+
+    @property
+    def repo_path(self):
+        """Solution directory relative to the repository root"""
+        return f"solutions/{self.key}"
+
+
+@dataclass
+class CatalogModel:
+    """Everything the catalog tools derive from one scan of solutions/"""
+    solutions: list = field(default_factory=list)
+    provider_names: dict = field(default_factory=dict)
+    category_names: dict = field(default_factory=dict)
+    category_descriptions: dict = field(default_factory=dict)
+    master_catalog: dict = None
+    provider_catalogs: dict = field(default_factory=dict)
+    category_catalogs: dict = field(default_factory=dict)
+
+    def provider_display_name(self, provider):
+        """Display name for a provider, falling back to its id"""
+        return self.provider_names.get(provider, provider)
+
+    def category_display_name(self, category):
+        """Display name for a category, falling back to its id"""
+        return self.category_names.get(category, category)
+
+
+class CatalogStatistics:
+    """Running solution counts, updated as solutions are added or removed
+
+    Keeps every figure the master catalog reports current in O(1) per change,
+    so writing the catalog does not need another pass over all solutions.
+    """
+
+    COMPLEXITY_LEVELS = ('basic', 'intermediate', 'advanced', 'enterprise')
+
+    def __init__(self):
+        self.total = 0
+        self.by_provider = Counter()
+        self.by_category = Counter()
+        self.by_complexity = Counter()
+        self.by_deployment_time = Counter()
+
+    def add(self, provider, category, metadata):
+        """Count one solution"""
+        self._apply(provider, category, metadata, 1)
+
+    def remove(self, provider, category, metadata):
+        """Uncount a solution previously passed to add()"""
+        self._apply(provider, category, metadata, -1)
+
+    def _apply(self, provider, category, metadata, delta):
+        self.total += delta
+        self.by_provider[provider] += delta
+        self.by_category[category] += delta
+        self.by_complexity[self._count_key(metadata, 'complexity', provider, category, delta)] += delta
+        self.by_deployment_time[self._count_key(metadata, 'deployment_time', provider, category, delta)] += delta
+
+    @staticmethod
+    def _count_key(metadata, field_name, provider, category, delta):
+        """A metadata value usable as a counter key; lists, mappings and other unhashable values count as 'unknown'"""
+        value = metadata.get(field_name, 'unknown')
+        try:
+            hash(value)
+        except TypeError:
+            if delta > 0:
+                print(f"Warning: Counting non-scalar {field_name} of {provider}/{category}/"
+                      f"{metadata.get('solution_name', metadata.get('title', '?'))} as unknown: {value!r}")
+            return 'unknown'
+        return value
+
+    def complexity_distribution(self):
+        """Counts for the standard complexity levels; other values are not reported"""
+        return {level: self.by_complexity[level] for level in self.COMPLEXITY_LEVELS}
+
+    def deployment_time_distribution(self):
+        """Counts for every deployment time seen, in a stable order"""
+        return {
+            time: count
+            for time, count in sorted(self.by_deployment_time.items(), key=lambda item: str(item[0]))
+            if count > 0
+        }
+
+
+def load_yaml(content):
+    """Parse YAML text or bytes with the fastest available safe loader"""
+    return yaml.load(content, Loader=YamlSafeLoader)
+
+
+def parse_metadata_item(item):
+    """Parse one pending (key, digest, content) metadata item
+
+    Lives in an importable module so process pool workers can unpickle it
+    regardless of the multiprocessing start method.
+    """
+    key, digest, content = item
+    try:
+        metadata = load_yaml(content)
+    except Exception as e:
+        return key, digest, None, str(e)
+    if not isinstance(metadata, dict):
+        return key, digest, None, "metadata.yml does not contain a mapping"
+    return key, digest, metadata, None
+
+
+def json_default(value):
+    """Serialise YAML scalar types that JSON has no native form for"""
+    if isinstance(value, (date, datetime)):
+        return {'__date__': value.isoformat(), 'datetime': isinstance(value, datetime)}
+    return str(value)
+
+
+def json_object_hook(obj):
+    """Restore values written by json_default"""
+    if '__date__' in obj:
+        parse = datetime.fromisoformat if obj.get('datetime') else date.fromisoformat
+        return parse(obj['__date__'])
+    return obj
+
+
+def catalog_files(catalog_dir):
+    """Relative paths of every YAML catalog file, master first"""
+    catalog_dir = Path(catalog_dir)
+    files = []
+    if (catalog_dir / 'catalog.yml').exists():
+        files.append('catalog.yml')
+    for subdir in ('providers', 'categories'):
+        if (catalog_dir / subdir).is_dir():
+            files.extend(f"{subdir}/{path.name}" for path in sorted((catalog_dir / subdir).glob('*.yml')))
+    return files
+
+
+def file_sha256(path):
+    """Hex sha256 of a file's bytes"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_catalog_index(entries):
+    """Build the index document from {relative_path: (sha256, data)} entries"""
+    files = {
+        rel_path: {'sha256': digest, 'data': data}
+        for rel_path, (digest, data) in sorted(entries.items())
+    }
+    source_hash = hashlib.sha256(
+        ''.join(f"{rel_path}\0{entry['sha256']}\n" for rel_path, entry in files.items()).encode()
+    ).hexdigest()
+    return {
+        'schema_version': CATALOG_INDEX_VERSION,
+        'source_hash': source_hash,
+        'files': files
+    }
+
+
+def write_catalog_index(catalog_dir, entries):
+    """Write the compact JSON index next to the YAML catalogs
+
+    Returns the index document.
+    """
+    index = build_catalog_index(entries)
+    content = json.dumps(index, separators=(',', ':'), default=json_default)
+    write_text_if_changed(Path(catalog_dir) / CATALOG_INDEX_FILENAME, content)
+    return index
+
+
+def read_catalog_index(catalog_dir):
+    """Read the index without checking it against the YAML files, or None"""
+    index_file = Path(catalog_dir) / CATALOG_INDEX_FILENAME
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f, object_hook=json_object_hook)
+    except (OSError, ValueError):
+        return None
+    if index.get('schema_version') != CATALOG_INDEX_VERSION:
+        return None
+    return index
+
+
+def load_catalog_index(catalog_dir):
+    """Return the index if it still mirrors the YAML catalogs exactly, else None
+
+    Hashing the YAML bytes is far cheaper than parsing them, so a fresh index
+    lets loaders skip YAML entirely; any added, removed or edited catalog file
+    makes the index stale and callers fall back to YAML.
+    """
+    index = read_catalog_index(catalog_dir)
+    if index is None:
+        return None
+
+    catalog_dir = Path(catalog_dir)
+    files = index.get('files', {})
+    current = catalog_files(catalog_dir)
+    if sorted(current) != sorted(files):
+        return None
+    for rel_path in current:
+        if file_sha256(catalog_dir / rel_path) != files[rel_path]['sha256']:
+            return None
+    return index
+
+
+def index_catalogs(index, subdir):
+    """Catalog data for one subdirectory of the index, keyed by file stem"""
+    prefix = f"{subdir}/"
+    return {
+        rel_path[len(prefix):-len('.yml')]: entry['data']
+        for rel_path, entry in index['files'].items()
+        if rel_path.startswith(prefix)
+    }
+
+
+def write_text_if_changed(path, content):
+    """Write text to path unless the file already holds exactly that content
+
+    Returns True when the file was written. Skipping identical writes keeps
+    mtimes stable and avoids churn in git and downstream caches.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def load_tool_module(script_name):
+    """Import one of the hyphenated tool scripts (e.g. 'generate-catalogs') as a module"""
+    module_name = script_name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, TOOLS_DIR / f"{script_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
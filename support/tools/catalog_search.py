@@ -0,0 +1,585 @@
+"""
+Catalog Search
+Inverted-index full-text search over solution metadata with BM25 ranking
+
+The index is built by generate-catalogs.py into support/catalog/search-index.json
+and stamped with the source_hash of the catalog index it was built from, so
+readers can tell whether it still matches the catalogs on disk.
+
+Query syntax:
+    terraform lambda       every term must match, results ranked by BM25
+    serverless*            prefix match
+    "document processing"  phrase match within one field
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import json
+import math
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+from catalog_model import write_text_if_changed
+
+SEARCH_INDEX_FILENAME = 'search-index.json'
+SEARCH_INDEX_VERSION = 1
+
+# Indexed fields, their BM25 weight and the metadata keys they are read from
+SEARCH_FIELDS = ('title', 'tags', 'technologies', 'description', 'long_description', 'requirements')
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'technologies': 1.5,
+    'description': 1.5,
+    'long_description': 1.0,
+    'requirements': 0.5
+}
+FIELD_SOURCES = {
+    'title': ('title', 'solution_display_name'),
+    'tags': ('tags',),
+    'technologies': ('technologies',),
+    'description': ('description',),
+    'long_description': ('long_description',),
+    'requirements': ('requirements',)
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Short prefixes can match a large part of the vocabulary; cap the expansion,
+# keeping the terms that occur in the most documents
+MAX_PREFIX_EXPANSIONS = 64
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens of a string"""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def field_values(value):
+    """Flatten a metadata value (string, list or nested mapping) into strings"""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in field_values(item)]
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in field_values(item)]
+    return [str(value)]
+
+
+def field_tokens(solution, field_name):
+    """Tokens of one field with their positions
+
+    Separate values (e.g. two tags) are one position apart so a phrase query
+    never matches across them.
+    """
+    tokens = []
+    position = 0
+    for key in FIELD_SOURCES[field_name]:
+        for text in field_values(solution.get(key)):
+            for token in tokenize(text):
+                tokens.append((position, token))
+                position += 1
+            position += 1
+    return tokens
+
+
+class SearchIndex:
+    """Positional inverted index over solution documents
+
+    postings maps each term to [doc, field, position, ...] entries, one per
+    document field the term occurs in.
+    """
+
+    def __init__(self, doc_ids, doc_lengths, postings, source_hash=None):
+        self.doc_ids = doc_ids
+        self.doc_lengths = doc_lengths
+        self.postings = postings
+        self.source_hash = source_hash
+
+        # Terms are stored sorted, which keeps prefix lookups a bisect away
+        self.terms = list(postings)
+        if any(a > b for a, b in zip(self.terms, self.terms[1:])):
+            self.terms.sort()
+
+        doc_count = len(doc_ids) or 1
+        self.avg_lengths = [
+            (sum(lengths[field] for lengths in doc_lengths) / doc_count) or 1.0
+            for field in range(len(SEARCH_FIELDS))
+        ]
+        self.field_weights = [FIELD_WEIGHTS[field_name] for field_name in SEARCH_FIELDS]
+
+    @classmethod
+    def build(cls, solutions, source_hash=None):
+        """Index solution dicts, each carrying an 'id' plus its metadata"""
+        doc_ids = []
+        doc_lengths = []
+        postings = {}
+
+        for doc, solution in enumerate(sorted(solutions, key=lambda item: item['id'])):
+            doc_ids.append(solution['id'])
+            lengths = []
+            for field, field_name in enumerate(SEARCH_FIELDS):
+                tokens = field_tokens(solution, field_name)
+                lengths.append(len(tokens))
+                entries = {}
+                for position, token in tokens:
+                    entry = entries.get(token)
+                    if entry is None:
+                        entry = entries[token] = [doc, field]
+                        postings.setdefault(token, []).append(entry)
+                    entry.append(position)
+            doc_lengths.append(lengths)
+
+        return cls(doc_ids, doc_lengths, dict(sorted(postings.items())), source_hash=source_hash)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['doc_ids'], data['doc_lengths'], data['postings'], source_hash=data.get('source_hash'))
+
+    def to_dict(self):
+        return {
+            'schema_version': SEARCH_INDEX_VERSION,
+            'source_hash': self.source_hash,
+            'fields': list(SEARCH_FIELDS),
+            'doc_ids': self.doc_ids,
+            'doc_lengths': self.doc_lengths,
+            'postings': self.postings
+        }
+
+    def expand_prefix(self, prefix):
+        """Indexed terms starting with prefix, in sorted order
+
+        Beyond MAX_PREFIX_EXPANSIONS matches, the terms found in the most
+        documents are kept, so a short prefix still reaches most of its hits.
+        """
+        start = end = bisect_left(self.terms, prefix)
+        while end < len(self.terms) and self.terms[end].startswith(prefix):
+            end += 1
+        matches = self.terms[start:end]
+        if len(matches) > MAX_PREFIX_EXPANSIONS:
+            matches = sorted(sorted(matches, key=lambda term: -self.doc_frequency(term))[:MAX_PREFIX_EXPANSIONS])
+        return matches
+
+    def doc_frequency(self, term):
+        """Number of documents a term occurs in"""
+        return len({entry[0] for entry in self.postings.get(term, ())})
+
+    def term_scores(self, term):
+        """BM25 score per document for one term, summed over weighted fields"""
+        entries = self.postings.get(term)
+        if not entries:
+            return {}
+
+        doc_count = len(self.doc_ids)
+        doc_freq = self.doc_frequency(term)
+        idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+        scores = {}
+        for entry in entries:
+            doc, field = entry[0], entry[1]
+            tf = len(entry) - 2
+            norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc][field] / self.avg_lengths[field]
+            score = self.field_weights[field] * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+            scores[doc] = scores.get(doc, 0.0) + score
+        return scores
+
+    def phrase_scores(self, tokens):
+        """Scores for documents containing the tokens consecutively in one field"""
+        first = self.postings.get(tokens[0])
+        if not first:
+            return {}
+
+        following = []
+        for token in tokens[1:]:
+            positions = {}
+            for entry in self.postings.get(token, ()):
+                positions[(entry[0], entry[1])] = set(entry[2:])
+            if not positions:
+                return {}
+            following.append(positions)
+
+        matched = set()
+        for entry in first:
+            location = (entry[0], entry[1])
+            if entry[0] in matched:
+                continue
+            later = [positions.get(location) for positions in following]
+            if None in later:
+                continue
+            for start in entry[2:]:
+                if all(start + offset + 1 in positions for offset, positions in enumerate(later)):
+                    matched.add(entry[0])
+                    break
+
+        scores = dict.fromkeys(matched, 0.0)
+        for token in tokens:
+            for doc, score in self.term_scores(token).items():
+                if doc in scores:
+                    scores[doc] += score
+        return scores
+
+    def parse_query(self, query, prefix=False):
+        """Split a query into ('term' | 'prefix' | 'phrase', tokens) clauses"""
+        clauses = []
+        parts = QUERY_PATTERN.findall(query)
+        for index, (quoted, bare) in enumerate(parts):
+            tokens = tokenize(quoted or bare)
+            if not tokens:
+                continue
+            is_last = index == len(parts) - 1
+            if quoted or len(tokens) > 1:
+                clauses.append(('phrase', tokens))
+            elif bare.endswith('*') or (prefix and is_last):
+                clauses.append(('prefix', tokens))
+            else:
+                clauses.append(('term', tokens))
+        return clauses
+
+    def search(self, query, limit=None, prefix=False):
+        """Rank documents matching every clause of the query
+
+        Returns (solution_id, score) pairs, best first. With prefix=True the
+        last bare term also matches as a prefix, for search-as-you-type.
+        """
+        clauses = self.parse_query(query, prefix=prefix)
+        if not clauses:
+            return []
+
+        combined = None
+        for kind, tokens in clauses:
+            if kind == 'phrase':
+                scores = self.phrase_scores(tokens)
+            elif kind == 'prefix':
+                scores = {}
+                for term in self.expand_prefix(tokens[0]):
+                    for doc, score in self.term_scores(term).items():
+                        scores[doc] = scores.get(doc, 0.0) + score
+            else:
+                scores = self.term_scores(tokens[0])
+
+            if combined is None:
+                combined = scores
+            else:
+                combined = {doc: combined[doc] + score for doc, score in scores.items() if doc in combined}
+            if not combined:
+                return []
+
+        ranked = sorted(combined.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.doc_ids[doc], score) for doc, score in ranked]
+
+
+def write_search_index(catalog_dir, solutions, source_hash=None):
+    """Build the search index and write it next to the catalogs; returns the index"""
+    index = SearchIndex.build(solutions, source_hash=source_hash)
+    content = json.dumps(index.to_dict(), separators=(',', ':'))
+    write_text_if_changed(Path(catalog_dir) / SEARCH_INDEX_FILENAME, content)
+    return index
+
+
+def load_search_index(catalog_dir, source_hash=None):
+    """Load the persisted search index, or None if missing, outdated or built from other catalogs"""
+    index_file = Path(catalog_dir) / SEARCH_INDEX_FILENAME
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('schema_version') != SEARCH_INDEX_VERSION or data.get('fields') != list(SEARCH_FIELDS):
+        return None
+    if source_hash is not None and data.get('source_hash') != source_hash:
+        return None
+    return SearchIndex.from_dict(data)
+
+
+# Fields matched by fuzzy search and the weight of a match in each
+FUZZY_FIELDS = {
+    'solution_name': 3.0,
+    'solution_display_name': 3.0,
+    'title': 2.0,
+    'tags': 1.5
+}
+# Prefix-matched terms rank just below terms matched in full
+FUZZY_PREFIX_PENALTY = 0.9
+MIN_FUZZY_TERM_LENGTH = 2
+
+
+def allowed_edits(length):
+    """Edit budget for a query term: none for very short terms, at most two"""
+    if length <= 2:
+        return 0
+    if length <= 4:
+        return 1
+    return 2
+
+
+def trigrams(term, prefix=False):
+    """Padded character trigrams; prefix queries leave the end open"""
+    padded = f"  {term}" if prefix else f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(query, term, max_edits, prefix=False):
+    """Optimal string alignment distance (adjacent transpositions count once)
+
+    Returns max_edits + 1 as soon as the distance is known to exceed the
+    budget. With prefix=True the query is compared to the closest prefix of
+    term, for search-as-you-type.
+    """
+    if not prefix and abs(len(query) - len(term)) > max_edits:
+        return max_edits + 1
+
+    previous_previous = None
+    previous = list(range(len(term) + 1))
+    for i in range(1, len(query) + 1):
+        current = [i] + [0] * len(term)
+        for j in range(1, len(term) + 1):
+            cost = 0 if query[i - 1] == term[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and query[i - 1] == term[j - 2]
+                    and query[i - 2] == term[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+        if min(current) > max_edits:
+            return max_edits + 1
+        previous_previous, previous = previous, current
+
+    distance = min(previous) if prefix else previous[-1]
+    return distance if distance <= max_edits else max_edits + 1
+
+
+class FuzzyIndex:
+    """Trigram index over solution names, display names, titles and tags
+
+    Terms are the words of each field plus adjacent words run together
+    ("vx rail" -> "vxrail"), so spacing differences match as well as typos.
+    Candidates come from shared trigrams, and only those are checked with a
+    bounded edit distance, so a lookup never scans the whole vocabulary.
+    """
+
+    def __init__(self, solutions):
+        self.doc_ids = []
+        self.terms = []
+        self.term_ids = {}
+        self.term_docs = []
+        self.trigram_postings = {}
+
+        for doc, solution in enumerate(solutions):
+            self.doc_ids.append(solution['id'])
+            for field_name, weight in FUZZY_FIELDS.items():
+                for text in field_values(solution.get(field_name)):
+                    for term in self.value_terms(tokenize(text)):
+                        self.add_term(term, doc, weight)
+
+    @staticmethod
+    def value_terms(tokens):
+        terms = set(tokens)
+        terms.update(a + b for a, b in zip(tokens, tokens[1:]))
+        if len(tokens) > 2:
+            terms.add(''.join(tokens))
+        return [term for term in terms if len(term) >= MIN_FUZZY_TERM_LENGTH]
+
+    def add_term(self, term, doc, weight):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = self.term_ids[term] = len(self.terms)
+            self.terms.append(term)
+            self.term_docs.append({})
+            for gram in trigrams(term):
+                self.trigram_postings.setdefault(gram, []).append(term_id)
+        docs = self.term_docs[term_id]
+        if weight > docs.get(doc, 0.0):
+            docs[doc] = weight
+
+    def match_term(self, query, prefix=False, max_edits=None):
+        """Indexed terms within the edit budget of query, as {term_id: similarity}"""
+        if max_edits is None:
+            max_edits = allowed_edits(len(query))
+
+        # Each edit destroys at most three trigrams (q-gram lemma)
+        grams = trigrams(query, prefix=prefix)
+        min_shared = max(1, len(grams) - 3 * max_edits)
+        shared = {}
+        for gram in grams:
+            for term_id in self.trigram_postings.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        matches = {}
+        for term_id, count in shared.items():
+            if count < min_shared:
+                continue
+            term = self.terms[term_id]
+            if prefix and len(term) < len(query) - max_edits:
+                continue
+            distance = bounded_edit_distance(query, term, max_edits, prefix=prefix)
+            if distance > max_edits:
+                continue
+            similarity = 1.0 - distance / max(len(query), 1)
+            if prefix and len(term) > len(query):
+                similarity *= FUZZY_PREFIX_PENALTY
+            matches[term_id] = similarity
+        return matches
+
+    def search(self, query, limit=20, prefix=True):
+        """Rank solutions whose names or tags approximately match every query word
+
+        The query is tried word by word, with each pair of adjacent words
+        run together and with all words run together; each solution keeps its
+        best score. With prefix=True words may be incomplete. Returns
+        (solution_id, score) pairs, best first.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        plans = [tokens]
+        if len(tokens) > 1:
+            plans.extend(tokens[:i] + [tokens[i] + tokens[i + 1]] + tokens[i + 2:] for i in range(len(tokens) - 1))
+        if len(tokens) > 2:
+            plans.append([''.join(tokens)])
+
+        best = {}
+        for plan in plans:
+            plan_scores = None
+            for token in plan:
+                matches = self.match_term(token, prefix=prefix)
+                token_scores = {}
+                for term_id, similarity in matches.items():
+                    for doc, weight in self.term_docs[term_id].items():
+                        score = similarity * weight
+                        if score > token_scores.get(doc, 0.0):
+                            token_scores[doc] = score
+                if plan_scores is None:
+                    plan_scores = token_scores
+                else:
+                    plan_scores = {doc: plan_scores[doc] + score for doc, score in token_scores.items() if doc in plan_scores}
+                if not plan_scores:
+                    break
+            for doc, score in (plan_scores or {}).items():
+                if score > best.get(doc, 0.0):
+                    best[doc] = score
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], self.doc_ids[item[0]]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.doc_ids[doc], score) for doc, score in ranked]
+
+
+# Fields the solution browser can filter and count by; tags hold several values
+FACET_FIELDS = ('provider', 'category', 'complexity', 'status', 'deployment_time', 'tags')
+MULTI_VALUE_FACETS = ('tags',)
+
+
+def popcount(bits):
+    """Number of set bits (int.bit_count needs Python 3.10)"""
+    return bin(bits).count('1')
+
+
+def iter_bits(bits):
+    """Positions of the set bits, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class FacetIndex:
+    """Per-value bitmaps over an ordered sequence of solutions
+
+    Bit i of a bitmap is set when solution i has that facet value, so filters
+    combine with & (across fields) and | (within a field) on Python ints.
+    """
+
+    def __init__(self, solutions):
+        self.solutions = solutions
+        self.positions = {solution['id']: position for position, solution in enumerate(solutions)}
+        self.all_bits = (1 << len(solutions)) - 1
+        self.bitmaps = {field: {} for field in FACET_FIELDS}
+
+        for position, solution in enumerate(solutions):
+            bit = 1 << position
+            for field in FACET_FIELDS:
+                field_bitmaps = self.bitmaps[field]
+                for value in self.facet_values(solution, field):
+                    field_bitmaps[value] = field_bitmaps.get(value, 0) | bit
+
+    @staticmethod
+    def facet_values(solution, field):
+        """Facet values of one solution; missing single-value fields count as 'unknown'"""
+        value = solution.get(field)
+        if field in MULTI_VALUE_FACETS:
+            return [str(item) for item in value] if isinstance(value, (list, tuple)) else []
+        return [str(value) if value is not None else 'unknown']
+
+    def field_bits(self, field, values):
+        """Solutions matching any of the values of one field"""
+        if isinstance(values, (str, int, float)):
+            values = [values]
+        field_bitmaps = self.bitmaps[field]
+        bits = 0
+        for value in values:
+            bits |= field_bitmaps.get(str(value), 0)
+        return bits
+
+    def select(self, filters, base=None):
+        """Bitmap of solutions matching every filtered field
+
+        filters maps a facet field to one value or a list of values; empty or
+        None entries do not filter.
+        """
+        bits = self.all_bits if base is None else base
+        for field, values in (filters or {}).items():
+            if values is None or values == [] or values == ():
+                continue
+            if field not in self.bitmaps:
+                raise ValueError(f"Unknown facet field: {field}")
+            bits &= self.field_bits(field, values)
+        return bits
+
+    def bits_for_ids(self, solution_ids):
+        """Bitmap of the given solution ids"""
+        bits = 0
+        for solution_id in solution_ids:
+            position = self.positions.get(solution_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def facet_counts(self, filters=None, base=None):
+        """Counts per value for every facet field
+
+        Each field is counted against the other fields' filters only, so a
+        sidebar can show how many results picking another value would give.
+        Values with no matches are left out.
+        """
+        base = self.all_bits if base is None else base
+        active = {
+            field: self.field_bits(field, values)
+            for field, values in (filters or {}).items()
+            if values is not None and values != [] and values != ()
+        }
+
+        counts = {}
+        for field in FACET_FIELDS:
+            mask = base
+            for other_field, bits in active.items():
+                if other_field != field:
+                    mask &= bits
+            field_counts = {}
+            for value, bits in self.bitmaps[field].items():
+                count = popcount(bits & mask)
+                if count:
+                    field_counts[value] = count
+            counts[field] = dict(sorted(field_counts.items(), key=lambda item: (-item[1], item[0])))
+        return counts
+
+    def solutions_for(self, bits):
+        """Solutions for a bitmap, in index order"""
+        return [self.solutions[position] for position in iter_bits(bits)]
@@ -0,0 +1,79 @@
+"""
+Catalog Validation
+Schema compilation and per-file validation shared by validate-catalogs and its worker processes
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import hashlib
+import json
+
+import jsonschema
+
+from catalog_model import load_yaml
+
+VALIDATION_CACHE_FILENAME = '.validation-cache.json'
+VALIDATION_CACHE_VERSION = 1
+
+# Validators compiled once per worker process by init_worker
+_worker_validators = {}
+
+
+def schema_sha256(schema):
+    """Hash of a schema's canonical JSON form, independent of file formatting"""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def error_path(error):
+    """JSON path of the instance location a validation error points at"""
+    path = '$'
+    for part in error.absolute_path:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
+
+
+def compile_schema(schema):
+    """Check a schema once and build the validator reused for every file
+
+    The Draft class follows the schema's $schema keyword (latest draft
+    when absent), and formats such as date and uri are checked too.
+    """
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    # FORMAT_CHECKER is per-draft on jsonschema >= 4.5; older releases share one checker
+    format_checker = getattr(validator_class, 'FORMAT_CHECKER', None) or jsonschema.FormatChecker()
+    return validator_class(schema, format_checker=format_checker)
+
+
+def validate_content(validator, content):
+    """Parse and validate YAML catalog bytes, returning (status, errors, data)
+
+    data is the parsed document, or None when the YAML could not be parsed,
+    so callers can reuse it instead of parsing the file again.
+    """
+    try:
+        data = load_yaml(content)
+    except Exception as e:
+        return 'ERROR', [f"File error: {e}"], None
+    status, errors = validate_data(validator, data)
+    return status, errors, data
+
+
+def validate_data(validator, data):
+    """Validate a parsed catalog document, returning (status, errors)"""
+    errors = sorted(validator.iter_errors(data), key=lambda error: list(map(str, error.absolute_path)))
+    return ('FAIL' if errors else 'PASS'), [f"{error_path(error)}: {error.message}" for error in errors]
+
+
+def init_worker(schemas):
+    """Process pool initializer: compile every schema once per worker"""
+    _worker_validators.clear()
+    for schema_name, schema in schemas.items():
+        _worker_validators[schema_name] = compile_schema(schema)
+
+
+def validate_catalog_item(item):
+    """Validate one (schema_name, content) item in a worker process, returning (status, errors, data)"""
+    schema_name, content = item
+    return validate_content(_worker_validators[schema_name], content)
@@ -0,0 +1,224 @@
+"""
+Catalog Watcher
+Filesystem watching for generate-catalogs.py --watch
+
+Reports which solutions under solutions/ changed, using Linux inotify through
+ctypes when available and falling back to polling metadata.yml modification
+times elsewhere. Bursts of events are debounced into a single batch.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct('iIII')
+
+# solutions/<provider>/<category>/<solution>/metadata.yml
+SOLUTION_DEPTH = 3
+
+
+class InotifyBackend:
+    """Recursive inotify watches on solutions/ down to the solution directories"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self.watches = {}
+        self.add_tree(())
+
+    def add_tree(self, parts):
+        """Watch a directory and, down to solution level, everything below it"""
+        path = self.root.joinpath(*parts)
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                print("Warning: inotify watch limit reached; raise fs.inotify.max_user_watches")
+            return
+        self.watches[wd] = parts
+
+        if len(parts) < SOLUTION_DEPTH:
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and not entry.name.startswith('.'):
+                            self.add_tree(parts + (entry.name,))
+            except OSError:
+                pass
+
+    def fileno(self):
+        return self.fd
+
+    def read_changes(self):
+        """Drain pending events; returns changed path prefixes, or None to request a full rescan"""
+        changes = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changes
+            if not data:
+                return changes
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode(sys.getfilesystemencoding(), 'replace')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+
+                parts = self.watches.get(wd)
+                if parts is None:
+                    continue
+                if not name:
+                    # Event on the watched directory itself (e.g. it was deleted)
+                    if parts:
+                        changes.add('/'.join(parts))
+                    continue
+                if name.startswith('.'):
+                    continue
+
+                child = parts + (name,)
+                if len(parts) == SOLUTION_DEPTH:
+                    if name == 'metadata.yml':
+                        changes.add('/'.join(parts))
+                elif mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self.add_tree(child)
+                    changes.add('/'.join(child))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingBackend:
+    """Portable fallback: compare metadata.yml stat results between polls"""
+
+    def __init__(self, root, interval=1.0):
+        self.root = Path(root)
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self):
+        snapshot = {}
+        for metadata_file in self.root.glob('*/*/*/metadata.yml'):
+            try:
+                stat = metadata_file.stat()
+            except OSError:
+                continue
+            key = metadata_file.parent.relative_to(self.root).as_posix()
+            snapshot[key] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def fileno(self):
+        return None
+
+    def read_changes(self):
+        current = self.take_snapshot()
+        changes = {
+            key for key in set(current) | set(self.snapshot)
+            if current.get(key) != self.snapshot.get(key)
+        }
+        self.snapshot = current
+        return changes
+
+    def close(self):
+        pass
+
+
+class SolutionWatcher:
+    """Debounced stream of changed solution paths under solutions/
+
+    batches() yields sets of 'provider', 'provider/category' or
+    'provider/category/solution' prefixes that changed, or None when events
+    were lost and a full rescan is needed.
+    """
+
+    def __init__(self, root, debounce=0.5, poll_interval=1.0):
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        try:
+            self.backend = InotifyBackend(root) if sys.platform.startswith('linux') else None
+        except OSError as e:
+            print(f"Warning: inotify unavailable ({e}); falling back to polling")
+            self.backend = None
+        if self.backend is None:
+            self.backend = PollingBackend(root, poll_interval)
+
+    @property
+    def mode(self):
+        return 'inotify' if isinstance(self.backend, InotifyBackend) else 'polling'
+
+    def wait(self, timeout):
+        """Block until events may be pending or the timeout expires"""
+        fd = self.backend.fileno()
+        if fd is None:
+            time.sleep(timeout if timeout is not None else self.poll_interval)
+            return True
+        ready, _, _ = select.select([fd], [], [], timeout)
+        return bool(ready)
+
+    def batches(self):
+        try:
+            while True:
+                self.wait(None)
+                pending = self.backend.read_changes()
+                if pending is not None and not pending:
+                    continue
+
+                # Keep collecting until the tree has been quiet for the debounce interval
+                while pending is not None:
+                    deadline = time.monotonic() + self.debounce
+                    quiet = True
+                    while time.monotonic() < deadline:
+                        if self.wait(max(0.0, deadline - time.monotonic())):
+                            more = self.backend.read_changes()
+                            if more is None:
+                                pending = None
+                                break
+                            if more:
+                                pending |= more
+                                quiet = False
+                                break
+                    if quiet:
+                        break
+
+                yield pending
+        finally:
+            self.backend.close()
@@ -13,10 +13,24 @@ import yaml
 import argparse
 from pathlib import Path
 
+from catalog_model import index_catalogs, load_catalog_index
+from solution_discovery import discover_solutions
+
 def load_display_names(repo_root):
     """Load provider and category display names from catalog files"""
     provider_names = {}
     category_names = {}
+
+    # Prefer the JSON index written by generate-catalogs.py when it is fresh
+    index = load_catalog_index(repo_root / "support" / "catalog")
+    if index:
+        for catalog in index_catalogs(index, 'providers').values():
+            if catalog.get('provider') and catalog.get('metadata', {}).get('provider_name'):
+                provider_names[catalog['provider']] = catalog['metadata']['provider_name']
+        for catalog in index_catalogs(index, 'categories').values():
+            if catalog.get('category') and catalog.get('metadata', {}).get('category_name'):
+                category_names[catalog['category']] = catalog['metadata']['category_name']
+        return provider_names, category_names
     
     # Load provider display names
     providers_path = repo_root / "support" / "catalog" / "providers"
@@ -48,19 +62,95 @@ def load_display_names(repo_root):
     
     return provider_names, category_names
 
-def sync_to_csv(output_type='private', git_based=False):
+def iter_solution_metadata(repo_root):
+    """Yield (provider, category, solution, metadata) for every solution on disk"""
+    for solution in discover_solutions(repo_root / "solutions", use_cache=True):
+        try:
+            with open(solution.metadata_path, 'r') as f:
+                metadata = yaml.safe_load(f)
+            yield solution.provider, solution.category, solution.name, metadata
+        except Exception as e:
+            print(f"Warning: Could not process {solution.path}: {e}")
+
+def build_csv_row(output_type, git_based, provider_name, category_name, solution_name, metadata,
+                  provider_display, category_display):
+    """Build the CSV row for one solution"""
+    solution_display = metadata.get('solution_display_name', metadata.get('solution_name', solution_name))
+    description = metadata.get('description', '')
+    version = metadata.get('version', '1.0.0')
+    status = metadata.get('status', 'Active')
+
+    if output_type == 'private':
+        # Build URLs for templates - internal repo
+        base_url = "https://github.com/eoframework/solutions/tree/main"
+        solution_url = f"{base_url}/solutions/{provider_name}/{category_name}/{solution_name}"
+
+        return [
+            provider_display,
+            category_display,
+            solution_display,
+            description,
+            solution_url,
+            status
+        ]
+
+    # public
+    website = "https://eoframework.com/solutions"
+    support_email = "support@eoframework.com"
+    solution_path = f"solutions/{provider_name}/{category_name}/{solution_name}"
+
+    if git_based:
+        # Git-based folder publishing
+        # Use Git URLs but keep DownloadUrl column name for website compatibility
+        base_url = "https://github.com/eoframework/solutions"
+        download_url = f"{base_url}/tree/main/{solution_path}"  # Git folder URL
+        raw_url = f"https://raw.githubusercontent.com/eoframework/solutions/main/{solution_path}"
+        tag_name = f"{provider_name}/{category_name}/{solution_name}-v{version}"
+
+        return [
+            provider_display,
+            category_display,
+            solution_display,
+            description,
+            version,
+            download_url,  # DownloadUrl column points to Git folder
+            raw_url,
+            tag_name,
+            website,
+            support_email,
+            status
+        ]
+
+    # ZIP-based publishing (legacy - not used with public solutions repo)
+    base_url = "https://github.com/eoframework/solutions/raw/main"
+    download_url = f"{base_url}/{solution_path}/latest/{solution_name}.zip"
+    manifest_url = f"{base_url}/{solution_path}/manifest.json"
+
+    return [
+        provider_display,
+        category_display,
+        solution_display,
+        description,
+        version,
+        download_url,
+        manifest_url,
+        website,
+        support_email,
+        status
+    ]
+
+def sync_to_csv(output_type='private', git_based=False, model=None):
     """Generate CSV file for website integration
 
     Args:
         output_type: 'private' for internal paths or 'public' for distribution URLs
         git_based: If True, use Git repository URLs instead of ZIP download URLs (for public only)
+        model: Optional CatalogModel; when given, solutions and display names come from
+            memory instead of walking solutions/ and re-reading the catalogs
     """
     repo_root = Path(__file__).parent.parent.parent  # Go up to repository root
     csv_data = []
 
-    # Load display names from catalog files
-    provider_names, category_names = load_display_names(repo_root)
-
     # CSV headers based on output type
     if output_type == 'private':
         headers = ['Provider', 'Category', 'SolutionName', 'Description', 'Templates', 'Status']
@@ -70,98 +160,32 @@ def sync_to_csv(output_type='private', git_based=False):
             headers = ['Provider', 'Category', 'SolutionName', 'Description', 'Version', 'DownloadUrl', 'RawURL', 'LatestTag', 'Website', 'SupportEmail', 'Status']
         else:
             headers = ['Provider', 'Category', 'SolutionName', 'Description', 'Version', 'DownloadUrl', 'ManifestUrl', 'Website', 'SupportEmail', 'Status']
-    
-    # Scan all templates
-    solutions_path = repo_root / "solutions"
-    if solutions_path.exists():
-        for provider_path in solutions_path.iterdir():
-            if provider_path.is_dir():
-                provider_name = provider_path.name
-                
-                for category_path in provider_path.iterdir():
-                    if category_path.is_dir():
-                        category_name = category_path.name
-                        
-                        for solution_path in category_path.iterdir():
-                            if solution_path.is_dir():
-                                solution_name = solution_path.name
-                                metadata_path = solution_path / 'metadata.yml'
-                                
-                                if metadata_path.exists():
-                                    try:
-                                        with open(metadata_path, 'r') as f:
-                                            metadata = yaml.safe_load(f)
-                                        
-                                        # Get display names, fall back to raw names if not found
-                                        provider_display = provider_names.get(provider_name, provider_name)
-                                        category_display = category_names.get(category_name, category_name)
-                                        solution_display = metadata.get('solution_display_name', metadata.get('solution_name', solution_name))
-                                        description = metadata.get('description', '')
-                                        version = metadata.get('version', '1.0.0')
-                                        status = metadata.get('status', 'Active')
-
-                                        if output_type == 'private':
-                                            # Build URLs for templates - internal repo
-                                            base_url = "https://github.com/eoframework/solutions/tree/main"
-                                            solution_url = f"{base_url}/solutions/{provider_name}/{category_name}/{solution_name}"
-
-                                            csv_row = [
-                                                provider_display,
-                                                category_display,
-                                                solution_display,
-                                                description,
-                                                solution_url,
-                                                status
-                                            ]
-                                        else:  # public
-                                            website = "https://eoframework.com/solutions"
-                                            support_email = "support@eoframework.com"
-                                            solution_path = f"solutions/{provider_name}/{category_name}/{solution_name}"
-
-                                            if git_based:
-                                                # Git-based folder publishing
-                                                # Use Git URLs but keep DownloadUrl column name for website compatibility
-                                                base_url = "https://github.com/eoframework/solutions"
-                                                download_url = f"{base_url}/tree/main/{solution_path}"  # Git folder URL
-                                                raw_url = f"https://raw.githubusercontent.com/eoframework/solutions/main/{solution_path}"
-                                                tag_name = f"{provider_name}/{category_name}/{solution_name}-v{version}"
-
-                                                csv_row = [
-                                                    provider_display,
-                                                    category_display,
-                                                    solution_display,
-                                                    description,
-                                                    version,
-                                                    download_url,  # DownloadUrl column points to Git folder
-                                                    raw_url,
-                                                    tag_name,
-                                                    website,
-                                                    support_email,
-                                                    status
-                                                ]
-                                            else:
-                                                # ZIP-based publishing (legacy - not used with public solutions repo)
-                                                base_url = "https://github.com/eoframework/solutions/raw/main"
-                                                download_url = f"{base_url}/{solution_path}/latest/{solution_name}.zip"
-                                                manifest_url = f"{base_url}/{solution_path}/manifest.json"
-
-                                                csv_row = [
-                                                    provider_display,
-                                                    category_display,
-                                                    solution_display,
-                                                    description,
-                                                    version,
-                                                    download_url,
-                                                    manifest_url,
-                                                    website,
-                                                    support_email,
-                                                    status
-                                                ]
-
-                                        csv_data.append(csv_row)
-                                        
-                                    except Exception as e:
-                                        print(f"Warning: Could not process {solution_path}: {e}")
+
+    if model is not None:
+        solutions = ((s.provider, s.category, s.name, s.metadata) for s in model.solutions)
+        provider_display_name = model.provider_display_name
+        category_display_name = model.category_display_name
+    else:
+        # Load display names from catalog files, fall back to raw names if not found
+        provider_names, category_names = load_display_names(repo_root)
+        solutions = iter_solution_metadata(repo_root)
+        provider_display_name = lambda name: provider_names.get(name, name)
+        category_display_name = lambda name: category_names.get(name, name)
+
+    for provider_name, category_name, solution_name, metadata in solutions:
+        try:
+            row = build_csv_row(
+                output_type, git_based, provider_name, category_name, solution_name, metadata,
+                provider_display_name(provider_name), category_display_name(category_name)
+            )
+        except Exception as e:
+            print(f"Warning: Could not process solutions/{provider_name}/{category_name}/{solution_name}: {e}")
+            continue
+        csv_data.append(((provider_name, category_name, solution_name), row))
+
+    # Rows follow the solution directory order whether they came from disk or
+    # from an in-memory model, so both paths write identical files
+    csv_data = [row for _, row in sorted(csv_data, key=lambda item: item[0])]
     
     # Write CSV file to exports directory
     if output_type == 'private':
@@ -9,104 +9,297 @@ Licensed under BSL 1.1 - see LICENSE file for details
 
 import yaml
 import os
+import json
+import hashlib
 import argparse
+import subprocess
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog_model import (
+    CatalogModel, CatalogStatistics, SolutionRecord, file_sha256, index_catalogs, json_default, json_object_hook,
+    load_catalog_index, load_yaml, parse_metadata_item, write_catalog_index, write_text_if_changed
+)
+from catalog_search import SEARCH_INDEX_FILENAME, write_search_index
+from catalog_watch import SolutionWatcher
+from solution_discovery import changed_solutions, scan_solution_tree
+
+# Bump when the manifest layout changes; older manifests are then ignored
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = '.manifest.json'
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 64
+
+# Changes to the catalog tools can alter every catalog, so --changed-since rescans everything
+SHARED_GENERATION_INPUTS = ('support/tools/',)
 
 class CatalogGenerator:
-    def __init__(self, providers_dir, catalog_dir):
+    def __init__(self, providers_dir, catalog_dir, jobs=None, deterministic=False):
         self.providers_dir = Path(providers_dir)
         self.catalog_dir = Path(catalog_dir)
+        self.jobs = jobs or os.cpu_count() or 1
+
+        # Deterministic mode stamps catalogs with the newest source change instead of now()
+        self.deterministic = deterministic
+        self.source_timestamps = None
+        self.timestamps_from_git = False
         self.discovered_solutions = {}
+        self.statistics = CatalogStatistics()
         self.existing_provider_names = {}
         self.existing_category_names = {}
         self.existing_category_descriptions = {}
+
+        # Content-hash manifest: "provider/category/solution" -> {'sha256', 'metadata'}
+        self.manifest_file = self.catalog_dir / MANIFEST_FILENAME
+        self.previous_manifest = {}
+        self.manifest = {}
+        self.incremental = False
+        self.dirty_providers = set()
+        self.dirty_categories = set()
+
+        # Catalogs built by the last write_catalogs() call
+        self.provider_catalogs = {}
+        self.category_catalogs = {}
+        self.master_catalog = None
+
+        # JSON index entries: relative catalog path -> (sha256, data)
+        self.previous_index = None
+        self.index_entries = {}
+
+    def load_manifest(self):
+        """Load the manifest written by the previous run
+
+        Returns True when a usable manifest was found. Without one every
+        provider and category catalog is treated as changed.
+        """
+        if not self.manifest_file.exists():
+            return False
+
+        try:
+            with open(self.manifest_file, 'r') as f:
+                manifest = json.load(f, object_hook=json_object_hook)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable manifest {self.manifest_file}: {e}")
+            return False
+
+        if manifest.get('version') != MANIFEST_VERSION:
+            print(f"Warning: Ignoring manifest with version {manifest.get('version')}")
+            return False
+
+        self.previous_manifest = manifest.get('solutions', {})
+        self.manifest = dict(self.previous_manifest)
+        print(f"📒 Loaded manifest with {len(self.previous_manifest)} solutions")
+
+        # Catalogs stamped by another timestamp source would keep their old
+        # timestamps, so a change of source rewrites every catalog
+        previous_source = manifest.get('timestamps')
+        if previous_source == self.timestamp_source():
+            self.incremental = True
+        else:
+            print(f"ℹ️ Catalog timestamps changed from {previous_source} to {self.timestamp_source()} - rewriting every catalog")
+        return True
+
+    def save_manifest(self):
+        """Persist the manifest so the next run only re-parses changed metadata"""
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'timestamps': self.timestamp_source(),
+            'solutions': dict(sorted(self.manifest.items()))
+        }
+        content = json.dumps(manifest, separators=(',', ':'), default=json_default)
+        write_text_if_changed(self.manifest_file, content)
+
+    def mark_dirty(self, provider_name, category_name):
+        """Record that a provider and category catalog must be rewritten"""
+        self.dirty_providers.add(provider_name)
+        self.dirty_categories.add(category_name)
+
+    def load_solutions(self, entries):
+        """Load metadata for (provider, category, solution, metadata_file) entries
+
+        Files whose hash matches the manifest are reused as is; the rest are
+        parsed, in parallel when there are enough of them. Results are merged
+        into discovered_solutions in the order of the given entries so the
+        outcome does not depend on worker scheduling.
+
+        Returns the number of solutions that were reused unchanged.
+        """
+        resolved = {}
+        pending = []
+
+        for provider_name, category_name, solution_name, metadata_file in entries:
+            key = f"{provider_name}/{category_name}/{solution_name}"
+            try:
+                with open(metadata_file, 'rb') as f:
+                    content = f.read()
+            except Exception as e:
+                print(f"✗ Error reading {metadata_file}: {e}")
+                continue
+
+            digest = hashlib.sha256(content).hexdigest()
+            cached = self.previous_manifest.get(key)
+            if cached and cached.get('sha256') == digest:
+                resolved[key] = (cached['metadata'], False)
+            else:
+                pending.append((key, digest, content))
+
+        for key, digest, raw_metadata, error in self.parse_metadata_batch(pending):
+            if error:
+                print(f"✗ Error reading {self.providers_dir / key / 'metadata.yml'}: {error}")
+                continue
+            self.manifest[key] = {'sha256': digest, 'metadata': raw_metadata}
+            resolved[key] = (raw_metadata, True)
+
+        unchanged_count = 0
+        for provider_name, category_name, solution_name, _ in entries:
+            key = f"{provider_name}/{category_name}/{solution_name}"
+            if key not in resolved:
+                continue
+
+            raw_metadata, changed = resolved[key]
+            metadata = self.with_solution_fields(raw_metadata, provider_name, category_name, solution_name)
+            self.set_solution(provider_name, category_name, solution_name, metadata)
+            if changed:
+                self.mark_dirty(provider_name, category_name)
+                print(f"✓ Found: {key}")
+            else:
+                unchanged_count += 1
+
+        return unchanged_count
+
+    def parse_metadata_batch(self, pending):
+        """Parse (key, digest, content) items, yielding (key, digest, metadata, error)"""
+        if self.jobs > 1 and len(pending) >= PARALLEL_PARSE_THRESHOLD:
+            chunksize = max(1, len(pending) // (self.jobs * 4))
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                yield from executor.map(parse_metadata_item, pending, chunksize=chunksize)
+        else:
+            for item in pending:
+                yield parse_metadata_item(item)
+
+    def with_solution_fields(self, raw_metadata, provider_name, category_name, solution_name):
+        """Return a copy of the metadata with solution path and title filled in"""
+        metadata = dict(raw_metadata)
+        metadata['solution_path'] = f"../../solutions/{provider_name}/{category_name}/{solution_name}/"
+        if 'title' not in metadata:
+            metadata['title'] = metadata.get('solution_name', solution_name.replace('-', ' ').title())
+        return metadata
+
+    def set_solution(self, provider_name, category_name, solution_name, metadata):
+        """Add or replace a discovered solution, keeping the statistics in step"""
+        solutions = self.discovered_solutions.setdefault(provider_name, {}).setdefault(category_name, {})
+        previous = solutions.get(solution_name)
+        if previous is not None:
+            self.statistics.remove(provider_name, category_name, previous)
+        solutions[solution_name] = metadata
+        self.statistics.add(provider_name, category_name, metadata)
+
+    def remove_solution(self, provider_name, category_name, solution_name):
+        """Drop a solution whose metadata no longer exists"""
+        key = f"{provider_name}/{category_name}/{solution_name}"
+        self.manifest.pop(key, None)
+        provider_data = self.discovered_solutions.get(provider_name, {})
+        previous = provider_data.get(category_name, {}).pop(solution_name, None)
+        if previous is not None:
+            self.statistics.remove(provider_name, category_name, previous)
+        self.mark_dirty(provider_name, category_name)
+
+        # Forget categories and providers whose directories were deleted along with it
+        category_dir = self.providers_dir / provider_name / category_name
+        if category_name in provider_data and not provider_data[category_name] and not category_dir.is_dir():
+            del provider_data[category_name]
+        if provider_name in self.discovered_solutions and not provider_data and not category_dir.parent.is_dir():
+            del self.discovered_solutions[provider_name]
+
+    def load_manifest_solutions(self):
+        """Populate discovered solutions from the manifest without touching the tree"""
+        for key in sorted(self.manifest):
+            provider_name, category_name, solution_name = key.split('/')
+            metadata = self.with_solution_fields(self.manifest[key]['metadata'], provider_name, category_name, solution_name)
+            self.set_solution(provider_name, category_name, solution_name, metadata)
+
+        print(f"📒 Restored {len(self.manifest)} solutions from manifest")
         
     def load_existing_display_names(self):
         """Load existing display names from catalog files"""
         print("📖 Loading existing display names from catalogs...")
+
+        # Prefer the JSON index when it still mirrors the YAML catalogs
+        self.previous_index = load_catalog_index(self.catalog_dir)
+        if self.previous_index:
+            provider_catalogs = index_catalogs(self.previous_index, 'providers').values()
+            category_catalogs = index_catalogs(self.previous_index, 'categories').values()
+        else:
+            provider_catalogs = self.read_yaml_catalogs('providers')
+            category_catalogs = self.read_yaml_catalogs('categories')
         
         # Load provider display names
-        providers_path = self.catalog_dir / "providers"
-        if providers_path.exists():
-            for provider_file in providers_path.glob("*.yml"):
-                try:
-                    with open(provider_file, 'r') as f:
-                        catalog = yaml.safe_load(f)
-                        provider_id = catalog.get('provider')
-                        provider_name = catalog.get('metadata', {}).get('provider_name')
-                        if provider_id and provider_name:
-                            self.existing_provider_names[provider_id] = provider_name
-                except Exception as e:
-                    print(f"Warning: Could not load provider catalog {provider_file}: {e}")
+        for catalog in provider_catalogs:
+            provider_id = catalog.get('provider')
+            provider_name = catalog.get('metadata', {}).get('provider_name')
+            if provider_id and provider_name:
+                self.existing_provider_names[provider_id] = provider_name
         
         # Load category display names
-        categories_path = self.catalog_dir / "categories"
-        if categories_path.exists():
-            for category_file in categories_path.glob("*.yml"):
-                try:
-                    with open(category_file, 'r') as f:
-                        catalog = yaml.safe_load(f)
-                        category_id = catalog.get('category')
-                        category_name = catalog.get('metadata', {}).get('category_name')
-                        category_description = catalog.get('metadata', {}).get('description')
-                        if category_id and category_name:
-                            self.existing_category_names[category_id] = category_name
-                        if category_id and category_description:
-                            self.existing_category_descriptions[category_id] = category_description
-                except Exception as e:
-                    print(f"Warning: Could not load category catalog {category_file}: {e}")
+        for catalog in category_catalogs:
+            category_id = catalog.get('category')
+            category_name = catalog.get('metadata', {}).get('category_name')
+            category_description = catalog.get('metadata', {}).get('description')
+            if category_id and category_name:
+                self.existing_category_names[category_id] = category_name
+            if category_id and category_description:
+                self.existing_category_descriptions[category_id] = category_description
         
         print(f"✓ Loaded {len(self.existing_provider_names)} provider names")
         print(f"✓ Loaded {len(self.existing_category_names)} category names")
         print(f"✓ Loaded {len(self.existing_category_descriptions)} category descriptions")
 
+    def read_yaml_catalogs(self, subdir):
+        """Yield parsed provider or category catalogs from their YAML files"""
+        catalogs_path = self.catalog_dir / subdir
+        if not catalogs_path.exists():
+            return
+
+        for catalog_file in catalogs_path.glob("*.yml"):
+            try:
+                with open(catalog_file, 'r') as f:
+                    catalog = load_yaml(f)
+                if isinstance(catalog, dict):
+                    yield catalog
+            except Exception as e:
+                print(f"Warning: Could not load catalog {catalog_file}: {e}")
+
     def scan_solutions(self):
         """Scan providers directory for solution metadata"""
         print("🔍 Scanning for solution metadata files...")
-        
-        for provider_dir in self.providers_dir.iterdir():
-            if not provider_dir.is_dir() or provider_dir.name.startswith('.'):
-                continue
-                
-            provider_name = provider_dir.name
-            self.discovered_solutions[provider_name] = {}
-            
-            for category_dir in provider_dir.iterdir():
-                if not category_dir.is_dir() or category_dir.name.startswith('.'):
-                    continue
-                    
-                category_name = category_dir.name
-                self.discovered_solutions[provider_name][category_name] = {}
-                
-                for solution_dir in category_dir.iterdir():
-                    if not solution_dir.is_dir() or solution_dir.name.startswith('.'):
-                        continue
-                        
-                    solution_name = solution_dir.name
-                    metadata_file = solution_dir / 'metadata.yml'
-                    
-                    if metadata_file.exists():
-                        try:
-                            with open(metadata_file, 'r') as f:
-                                metadata = yaml.safe_load(f)
-                            
-                            # Add solution path and title if missing
-                            metadata['solution_path'] = f"../../solutions/{provider_name}/{category_name}/{solution_name}/"
-                            if 'title' not in metadata:
-                                metadata['title'] = metadata.get('solution_name', solution_name.replace('-', ' ').title())
-                            
-                            self.discovered_solutions[provider_name][category_name][solution_name] = metadata
-                            print(f"✓ Found: {provider_name}/{category_name}/{solution_name}")
-                            
-                        except Exception as e:
-                            print(f"✗ Error reading {metadata_file}: {e}")
-        
-        total_solutions = sum(
-            len(categories.get(cat, {}))
-            for categories in self.discovered_solutions.values()
-            for cat in categories
-        )
+
+        # A full scan rebuilds the in-memory view from scratch
+        self.discovered_solutions = {}
+        self.statistics = CatalogStatistics()
+
+        tree = scan_solution_tree(self.providers_dir, use_cache=True)
+        for provider_name, category_name in tree.categories:
+            self.discovered_solutions.setdefault(provider_name, {})[category_name] = {}
+        entries = [
+            (solution.provider, solution.category, solution.name, solution.metadata_path)
+            for solution in tree.with_metadata()
+        ]
+
+        unchanged_count = self.load_solutions(entries)
+
+        # Solutions present in the previous manifest but gone from disk
+        seen_solutions = {f"{provider}/{category}/{solution}" for provider, category, solution, _ in entries}
+        for key in sorted(set(self.previous_manifest) - seen_solutions):
+            provider_name, category_name, solution_name = key.split('/')
+            self.remove_solution(provider_name, category_name, solution_name)
+            print(f"✗ Removed: {key}")
+
+        if unchanged_count:
+            print(f"✓ {unchanged_count} unchanged solution(s) reused from manifest")
+
+        total_solutions = self.statistics.total
         print(f"📊 Discovered {total_solutions} solutions across {len(self.discovered_solutions)} providers")
 
     def scan_specific_solutions(self, solution_paths):
@@ -116,6 +309,7 @@ class CatalogGenerator:
             solution_paths: List of solution paths in format "provider/category/solution"
         """
         print(f"🔍 Scanning {len(solution_paths)} specific solution(s)...")
+        entries = []
 
         for solution_path in solution_paths:
             parts = solution_path.strip().split('/')
@@ -125,84 +319,78 @@ class CatalogGenerator:
 
             provider_name, category_name, solution_name = parts
 
-            # Initialize nested dict structure if needed
-            if provider_name not in self.discovered_solutions:
-                self.discovered_solutions[provider_name] = {}
-            if category_name not in self.discovered_solutions[provider_name]:
-                self.discovered_solutions[provider_name][category_name] = {}
-
             # Build path to metadata file
             solution_dir = self.providers_dir / provider_name / category_name / solution_name
             metadata_file = solution_dir / 'metadata.yml'
 
             if not metadata_file.exists():
-                print(f"⚠️ Metadata not found: {solution_path}")
+                if solution_name in self.discovered_solutions.get(provider_name, {}).get(category_name, {}):
+                    self.remove_solution(provider_name, category_name, solution_name)
+                    print(f"✗ Removed: {solution_path}")
+                else:
+                    print(f"⚠️ Metadata not found: {solution_path}")
                 continue
 
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = yaml.safe_load(f)
-
-                # Add solution path and title if missing
-                metadata['solution_path'] = f"../../solutions/{provider_name}/{category_name}/{solution_name}/"
-                if 'title' not in metadata:
-                    metadata['title'] = metadata.get('solution_name', solution_name.replace('-', ' ').title())
+            entries.append((provider_name, category_name, solution_name, metadata_file))
 
-                self.discovered_solutions[provider_name][category_name][solution_name] = metadata
-                print(f"✓ Scanned: {provider_name}/{category_name}/{solution_name}")
+        unchanged_count = self.load_solutions(entries)
+        if unchanged_count:
+            print(f"✓ {unchanged_count} listed solution(s) unchanged since last run")
 
-            except Exception as e:
-                print(f"✗ Error reading {metadata_file}: {e}")
-
-        total_solutions = sum(
-            len(cat_data)
-            for provider_data in self.discovered_solutions.values()
-            for cat_data in provider_data.values()
-        )
-        print(f"📊 Scanned {total_solutions} specific solution(s)")
+        print(f"📊 Rescanned {len(entries)} specific solution(s); catalogs now hold {self.statistics.total}")
 
     def generate_provider_catalog(self, provider_name, provider_data):
         """Generate catalog for a single provider"""
+        timestamp = self.catalog_timestamp(
+            f"{provider_name}/{category_name}/{solution_name}"
+            for category_name, solutions in provider_data.items()
+            for solution_name in solutions
+        )
         provider_catalog = {
             'version': '2.0',
             'provider': provider_name,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': timestamp,
             'catalog_type': 'provider',
             'metadata': {
                 'provider_name': self.get_provider_display_name(provider_name),
-                'total_solutions': sum(len(cat_data) for cat_data in provider_data.values()),
-                'last_updated': datetime.now().isoformat(),
+                'total_solutions': self.statistics.by_provider[provider_name],
+                'last_updated': timestamp,
                 'auto_generated': True
             },
             'categories': {}
         }
         
-        for category_name, solutions in provider_data.items():
+        for category_name, solutions in sorted(provider_data.items()):
             if solutions:  # Only include categories with solutions
                 provider_catalog['categories'][category_name] = {
-                    'solutions': solutions
+                    'solutions': dict(sorted(solutions.items()))
                 }
         
         return provider_catalog
     
     def generate_category_catalog(self, category_name, category_solutions):
         """Generate catalog for a single category"""
+        timestamp = self.catalog_timestamp(
+            f"{provider_name}/{category_name}/{solution_name}"
+            for provider_name, solutions in category_solutions.items()
+            for solution_name in solutions
+        )
         category_catalog = {
             'version': '2.0',
             'category': category_name,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': timestamp,
             'catalog_type': 'category',
             'metadata': {
                 'category_name': self.get_category_display_name(category_name),
                 'description': self.get_category_description(category_name),
                 'total_solutions': len(category_solutions),
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': timestamp,
                 'auto_generated': True
             },
             'providers': {}
         }
         
-        for provider_name, solutions in category_solutions.items():
+        for provider_name, solutions in sorted(category_solutions.items()):
             if solutions:  # Only include providers with solutions in this category
                 category_catalog['providers'][provider_name] = {
                     'solutions': [
@@ -212,7 +400,7 @@ class CatalogGenerator:
                             'provider_catalog': f"../providers/{provider_name}.yml",
                             'solution_path': solution_data.get('solution_path', f"../../solutions/{provider_name}/{category_name}/{solution_name}/")
                         }
-                        for solution_name, solution_data in solutions.items()
+                        for solution_name, solution_data in sorted(solutions.items())
                     ]
                 }
         
@@ -220,45 +408,49 @@ class CatalogGenerator:
     
     def generate_master_catalog(self):
         """Generate master catalog from discovered solutions"""
-        # Calculate statistics
-        total_solutions = sum(
-            len(cat_data)
+        # Counts come from the running statistics; only the key sets are walked here
+        total_solutions = self.statistics.total
+        categories = {
+            category_name
             for provider_data in self.discovered_solutions.values()
-            for cat_data in provider_data.values()
+            for category_name in provider_data
+        }
+        provider_stats = {
+            provider_name: self.statistics.by_provider[provider_name]
+            for provider_name in sorted(self.discovered_solutions)
+        }
+        category_stats = {
+            category_name: self.statistics.by_category[category_name]
+            for category_name in sorted(categories)
+        }
+        timestamp = self.catalog_timestamp(
+            f"{provider_name}/{category_name}/{solution_name}"
+            for provider_name, provider_data in self.discovered_solutions.items()
+            for category_name, solutions in provider_data.items()
+            for solution_name in solutions
         )
         
-        provider_stats = {}
-        for provider_name, provider_data in self.discovered_solutions.items():
-            provider_stats[provider_name] = sum(len(cat_data) for cat_data in provider_data.values())
-        
-        category_stats = {}
-        for provider_data in self.discovered_solutions.values():
-            for category_name, solutions in provider_data.items():
-                if category_name not in category_stats:
-                    category_stats[category_name] = 0
-                category_stats[category_name] += len(solutions)
-        
         master_catalog = {
             'version': '2.0',
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': timestamp,
             'catalog_type': 'master',
             'metadata': {
                 'total_providers': len(self.discovered_solutions),
                 'total_categories': len(category_stats),
                 'total_solutions': total_solutions,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': timestamp,
                 'auto_generated': True
             },
             'provider_catalogs': {
                 provider: f"./providers/{provider}.yml"
-                for provider in self.discovered_solutions.keys()
+                for provider in provider_stats.keys()
             },
             'category_catalogs': {
                 category: f"./categories/{category}.yml"
                 for category in category_stats.keys()
             },
             'quick_stats': {
-                'providers_list': list(self.discovered_solutions.keys()),
+                'providers_list': list(provider_stats.keys()),
                 'categories_list': list(category_stats.keys()),
                 'provider_solution_counts': provider_stats,
                 'category_solution_counts': category_stats,
@@ -271,31 +463,11 @@ class CatalogGenerator:
     
     def calculate_complexity_distribution(self):
         """Calculate complexity distribution across all solutions"""
-        distribution = {'basic': 0, 'intermediate': 0, 'advanced': 0, 'enterprise': 0}
-        
-        for provider_data in self.discovered_solutions.values():
-            for solutions in provider_data.values():
-                for solution_data in solutions.values():
-                    complexity = solution_data.get('complexity', 'unknown')
-                    if complexity in distribution:
-                        distribution[complexity] += 1
-        
-        return distribution
+        return self.statistics.complexity_distribution()
     
     def calculate_deployment_time_distribution(self):
         """Calculate deployment time distribution"""
-        distribution = {}
-        
-        for provider_data in self.discovered_solutions.values():
-            for solutions in provider_data.values():
-                for solution_data in solutions.values():
-                    time = solution_data.get('deployment_time', 'unknown')
-                    if time in distribution:
-                        distribution[time] += 1
-                    else:
-                        distribution[time] = 1
-        
-        return distribution
+        return self.statistics.deployment_time_distribution()
     
     def get_provider_display_name(self, provider_name):
         """Get display name for provider from existing catalog or fallback to title case"""
@@ -314,17 +486,28 @@ class CatalogGenerator:
         # Ensure directories exist
         (self.catalog_dir / 'providers').mkdir(parents=True, exist_ok=True)
         (self.catalog_dir / 'categories').mkdir(parents=True, exist_ok=True)
+        self.provider_catalogs = {}
+        self.category_catalogs = {}
+        self.index_entries = {}
         
         # Generate and write provider catalogs
         print("\n📝 Writing provider catalogs:")
+        skipped = 0
+        identical = 0
         for provider_name, provider_data in self.discovered_solutions.items():
-            provider_catalog = self.generate_provider_catalog(provider_name, provider_data)
             provider_file = self.catalog_dir / 'providers' / f"{provider_name}.yml"
+            if self.is_unchanged(provider_name, self.dirty_providers, provider_file):
+                self.provider_catalogs[provider_name] = self.reuse_catalog_file(provider_file)
+                skipped += 1
+                continue
+
+            provider_catalog = self.generate_provider_catalog(provider_name, provider_data)
+            self.provider_catalogs[provider_name] = provider_catalog
             
-            with open(provider_file, 'w') as f:
-                yaml.dump(provider_catalog, f, default_flow_style=False, indent=2, sort_keys=False)
-            
-            print(f"✓ {provider_file}")
+            if self.write_catalog_file(provider_file, provider_catalog):
+                print(f"✓ {provider_file}")
+            else:
+                identical += 1
         
         # Reorganize data by category for category catalogs
         category_data = {}
@@ -338,24 +521,188 @@ class CatalogGenerator:
         # Generate and write category catalogs
         print("\n📝 Writing category catalogs:")
         for category_name, category_solutions in category_data.items():
-            category_catalog = self.generate_category_catalog(category_name, category_solutions)
             category_file = self.catalog_dir / 'categories' / f"{category_name}.yml"
+            if self.is_unchanged(category_name, self.dirty_categories, category_file):
+                self.category_catalogs[category_name] = self.reuse_catalog_file(category_file)
+                skipped += 1
+                continue
+
+            category_catalog = self.generate_category_catalog(category_name, category_solutions)
+            self.category_catalogs[category_name] = category_catalog
             
-            with open(category_file, 'w') as f:
-                yaml.dump(category_catalog, f, default_flow_style=False, indent=2, sort_keys=False)
-            
-            print(f"✓ {category_file}")
+            if self.write_catalog_file(category_file, category_catalog):
+                print(f"✓ {category_file}")
+            else:
+                identical += 1
+
+        # Drop catalogs whose provider or category lost its last solution directory
+        self.remove_stale_catalogs('providers', self.dirty_providers - set(self.discovered_solutions))
+        self.remove_stale_catalogs('categories', self.dirty_categories - set(category_data))
+
+        if skipped:
+            print(f"\n⏭️  Skipped {skipped} unchanged provider/category catalog(s)")
+        if identical:
+            print(f"\n⏭️  {identical} regenerated provider/category catalog(s) were identical and not rewritten")
         
         # Generate and write master catalog
         print("\n📝 Writing master catalog:")
         master_catalog = self.generate_master_catalog()
+        self.master_catalog = master_catalog
         master_file = self.catalog_dir / 'catalog.yml'
         
-        with open(master_file, 'w') as f:
-            yaml.dump(master_catalog, f, default_flow_style=False, indent=2, sort_keys=False)
-        
-        print(f"✓ {master_file}")
+        if self.write_catalog_file(master_file, master_catalog):
+            print(f"✓ {master_file}")
+        else:
+            print(f"= {master_file} (unchanged)")
+
+        # Compact JSON mirror that loaders read instead of parsing YAML
+        index = write_catalog_index(self.catalog_dir, self.index_entries)
+        print(f"✓ {self.catalog_dir / 'catalog.index.json'} ({index['source_hash'][:12]})")
+
+        # Full-text search index, tied to the catalogs it was built from
+        search_index = write_search_index(self.catalog_dir, self.search_documents(), source_hash=index['source_hash'])
+        print(f"✓ {self.catalog_dir / SEARCH_INDEX_FILENAME} ({len(search_index.doc_ids)} solutions, {len(search_index.terms)} terms)")
+
+    def search_documents(self):
+        """Solution documents for the search index, shaped like the JSON export entries"""
+        return [
+            {'id': f"{provider_name}-{category_name}-{solution_name}", **metadata}
+            for provider_name, provider_data in self.discovered_solutions.items()
+            for category_name, solutions in provider_data.items()
+            for solution_name, metadata in solutions.items()
+        ]
     
+    def to_model(self):
+        """Build the shared in-memory catalog model from the last generation run"""
+        solutions = [
+            SolutionRecord(provider_name, category_name, solution_name, metadata)
+            for provider_name, provider_data in sorted(self.discovered_solutions.items())
+            for category_name, solutions in sorted(provider_data.items())
+            for solution_name, metadata in sorted(solutions.items())
+        ]
+        categories = {
+            category_name
+            for provider_data in self.discovered_solutions.values()
+            for category_name in provider_data
+        }
+
+        return CatalogModel(
+            solutions=solutions,
+            provider_names={p: self.get_provider_display_name(p) for p in self.discovered_solutions},
+            category_names={c: self.get_category_display_name(c) for c in categories},
+            category_descriptions={c: self.get_category_description(c) for c in categories},
+            master_catalog=self.master_catalog,
+            provider_catalogs=dict(self.provider_catalogs),
+            category_catalogs=dict(self.category_catalogs)
+        )
+
+    def write_catalog_file(self, catalog_file, catalog):
+        """Serialise a catalog and write it only if the content differs from disk"""
+        content = yaml.dump(catalog, default_flow_style=False, indent=2, sort_keys=False)
+        rel_path = catalog_file.relative_to(self.catalog_dir).as_posix()
+        self.index_entries[rel_path] = (hashlib.sha256(content.encode('utf-8')).hexdigest(), catalog)
+        return write_text_if_changed(catalog_file, content)
+
+    def reuse_catalog_file(self, catalog_file):
+        """Return the data of a catalog file that is kept as is, recording it for the index"""
+        rel_path = catalog_file.relative_to(self.catalog_dir).as_posix()
+        digest = file_sha256(catalog_file)
+
+        entry = (self.previous_index or {}).get('files', {}).get(rel_path)
+        if entry and entry['sha256'] == digest:
+            catalog = entry['data']
+        else:
+            with open(catalog_file, 'r') as f:
+                catalog = load_yaml(f)
+
+        self.index_entries[rel_path] = (digest, catalog)
+        return catalog
+
+    def catalog_timestamp(self, solution_keys):
+        """Timestamp for a catalog built from the given provider/category/solution keys
+
+        In deterministic mode this is the newest source change among those
+        solutions, so regenerating unchanged sources reproduces the same file.
+        """
+        if not self.deterministic:
+            return datetime.now().isoformat()
+
+        self.ensure_source_timestamps()
+        newest = None
+        for key in solution_keys:
+            changed_at = self.source_timestamps.get(key)
+            if changed_at is None:
+                changed_at = self.file_timestamp(self.providers_dir / key / 'metadata.yml')
+                self.source_timestamps[key] = changed_at
+            if changed_at is not None and (newest is None or changed_at > newest):
+                newest = changed_at
+
+        if newest is None:
+            # Catalog without solutions: fall back to the newest change anywhere
+            newest = max(self.source_timestamps.values(), default=None)
+        return newest.isoformat() if newest else datetime.now().isoformat()
+
+    def timestamp_source(self):
+        """Where catalog timestamps come from: 'now', or 'git' / 'mtime' in deterministic mode"""
+        if not self.deterministic:
+            return 'now'
+        self.ensure_source_timestamps()
+        return 'git' if self.timestamps_from_git else 'mtime'
+
+    def ensure_source_timestamps(self):
+        """Load the per-solution source timestamps on first use"""
+        if self.source_timestamps is None:
+            timestamps = self.load_source_timestamps()
+            self.timestamps_from_git = timestamps is not None
+            self.source_timestamps = timestamps or {}
+
+    def load_source_timestamps(self):
+        """Map solution keys to the commit time of their last metadata.yml change
+
+        Uses a single git log pass; solutions git knows nothing about fall back
+        to the file modification time. Returns None when git is unavailable.
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'log', '--relative', '--name-only', '--format=%x00%cI', '--',
+                 ':(glob)*/*/*/metadata.yml'],
+                cwd=self.providers_dir, capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Warning: Could not read git history, using file times: {e}")
+            return None
+
+        timestamps = {}
+        commit_time = None
+        for line in result.stdout.splitlines():
+            if line.startswith('\x00'):
+                commit_time = datetime.fromisoformat(line[1:])
+            elif line and commit_time is not None:
+                key = line.rsplit('/', 1)[0]
+                # git log is newest first; keep the first time each file appears
+                timestamps.setdefault(key, commit_time)
+
+        return timestamps
+
+    def file_timestamp(self, path):
+        """Modification time of a file as an aware datetime, or None if missing"""
+        try:
+            return datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).replace(microsecond=0)
+        except OSError:
+            return None
+
+    def is_unchanged(self, name, dirty_names, catalog_file):
+        """Check whether an existing catalog file can be kept as is"""
+        return self.incremental and name not in dirty_names and catalog_file.exists()
+
+    def remove_stale_catalogs(self, subdir, names):
+        """Delete catalog files for providers or categories that no longer exist"""
+        for name in sorted(names):
+            catalog_file = self.catalog_dir / subdir / f"{name}.yml"
+            if catalog_file.exists():
+                catalog_file.unlink()
+                print(f"✗ Removed stale catalog: {catalog_file}")
+
     def generate_catalogs(self):
         """Generate catalog files from discovered solutions"""
         print("\n🚀 Generating catalog files...")
@@ -363,17 +710,14 @@ class CatalogGenerator:
         # Load existing display names first
         self.load_existing_display_names()
 
-        # Write all catalogs
+        # Write all catalogs, then record what they were built from
         self.write_catalogs()
+        self.save_manifest()
 
         print("\n✅ Catalog generation completed successfully!")
 
         # Display summary
-        total_solutions = sum(
-            len(cat_data)
-            for provider_data in self.discovered_solutions.values()
-            for cat_data in provider_data.values()
-        )
+        total_solutions = self.statistics.total
         print(f"📊 Generated catalogs for {total_solutions} solutions")
         print(f"📊 Across {len(self.discovered_solutions)} providers")
 
@@ -382,11 +726,89 @@ class CatalogGenerator:
             categories.update(provider_data.keys())
         print(f"📊 In {len(categories)} categories")
 
+    def expand_changed_paths(self, changed_paths):
+        """Resolve changed provider, category or solution paths to solution keys
+
+        Covers both the solutions known from the last run and those now on
+        disk, so additions and removals under a moved or deleted directory are
+        both picked up.
+        """
+        solution_keys = set()
+        for changed_path in changed_paths:
+            parts = changed_path.split('/')
+            for provider_name, provider_data in self.discovered_solutions.items():
+                if provider_name != parts[0]:
+                    continue
+                for category_name, solutions in provider_data.items():
+                    if len(parts) > 1 and category_name != parts[1]:
+                        continue
+                    solution_keys.update(
+                        f"{provider_name}/{category_name}/{solution_name}"
+                        for solution_name in solutions
+                        if len(parts) < 3 or solution_name == parts[2]
+                    )
+
+            pattern = '/'.join(parts + ['*'] * (3 - len(parts))) + '/metadata.yml'
+            for metadata_file in self.providers_dir.glob(pattern):
+                key = metadata_file.parent.relative_to(self.providers_dir).as_posix()
+                if not any(part.startswith('.') for part in key.split('/')):
+                    solution_keys.add(key)
+
+            if len(parts) == 3:
+                solution_keys.add(changed_path)
+
+        return sorted(solution_keys)
+
+    def watch(self, debounce=0.5):
+        """Regenerate affected catalogs whenever solution metadata changes, until interrupted
+
+        The parsed solutions, statistics and manifest stay in memory between
+        events, so each round only re-reads the solutions that changed and
+        rewrites their provider and category catalogs plus catalog.yml.
+        """
+        watcher = SolutionWatcher(self.providers_dir, debounce=debounce)
+        print(f"\n👀 Watching {self.providers_dir} for changes ({watcher.mode}, Ctrl+C to stop)...")
+
+        # Everything on disk is now current; later rounds only rewrite dirty catalogs
+        self.incremental = True
+        try:
+            for changed_paths in watcher.batches():
+                self.previous_manifest = dict(self.manifest)
+                self.dirty_providers = set()
+                self.dirty_categories = set()
+                print()
+
+                if changed_paths is None:
+                    print("⚠️ Filesystem events were lost - rescanning all solutions")
+                    self.scan_solutions()
+                else:
+                    solution_paths = self.expand_changed_paths(changed_paths)
+                    if not solution_paths:
+                        continue
+                    if self.source_timestamps is not None:
+                        for key in solution_paths:
+                            self.source_timestamps.pop(key, None)
+                    self.scan_specific_solutions(solution_paths)
+
+                if not (self.dirty_providers or self.dirty_categories):
+                    print("⏭️  No catalog changes")
+                    continue
+                self.generate_catalogs()
+                print("\n👀 Watching for changes...")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+
 if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Generate solution catalogs')
     parser.add_argument('--solutions', type=str, help='Space-separated list of solution paths (provider/category/solution)')
+    parser.add_argument('--changed-since', metavar='REF', help='Process only solutions with files changed since a git ref')
     parser.add_argument('--all', action='store_true', help='Process all solutions (default if --solutions not provided)')
+    parser.add_argument('--full', action='store_true', help='Ignore the manifest and rebuild every catalog')
+    parser.add_argument('--jobs', type=int, help='Worker processes for parsing metadata (default: CPU count)')
+    parser.add_argument('--deterministic', action='store_true', help='Derive timestamps from source changes so unchanged catalogs are reproduced byte for byte')
+    parser.add_argument('--watch', action='store_true', help='Keep running and regenerate affected catalogs when solution metadata changes')
+    parser.add_argument('--debounce', type=float, default=0.5, help='Seconds of quiet to wait for before regenerating in --watch mode (default: 0.5)')
     args = parser.parse_args()
 
     # Auto-detect paths relative to script location
@@ -395,20 +817,40 @@ if __name__ == "__main__":
 
     generator = CatalogGenerator(
         providers_dir=repo_root / "solutions",
-        catalog_dir=repo_root / "support" / "catalog"
+        catalog_dir=repo_root / "support" / "catalog",
+        jobs=args.jobs,
+        deterministic=args.deterministic
     )
+    has_manifest = not args.full and generator.load_manifest()
 
-    # Display which solutions triggered this run
-    if args.solutions:
-        solution_paths = args.solutions.strip().split()
+    solution_paths = args.solutions.strip().split() if args.solutions else None
+    if solution_paths is None and args.changed_since and not args.all:
+        try:
+            changes = changed_solutions(repo_root, args.changed_since, shared_paths=SHARED_GENERATION_INPUTS)
+            if changes.full_run:
+                print(f"🌐 Shared input changed since {args.changed_since}: {changes.full_run_trigger}")
+            else:
+                solution_paths = list(changes.solutions)
+        except RuntimeError as e:
+            print(f"⚠️ Could not determine changes since {args.changed_since}: {e}")
+
+    if solution_paths is not None and not args.all and has_manifest:
+        # Trust the manifest for everything else and only re-read what changed
         print(f"🎯 Triggered by {len(solution_paths)} changed solution(s):")
         for path in solution_paths:
             print(f"   - {path}")
         print()
 
-    # Always scan all solutions to maintain complete catalogs
-    print("🌐 Scanning all solutions to generate complete catalogs...")
-    generator.scan_solutions()
+        generator.load_manifest_solutions()
+        generator.scan_specific_solutions(solution_paths)
+    else:
+        if solution_paths is not None and not has_manifest:
+            print("ℹ️ No manifest found - scanning all solutions")
+        print("🌐 Scanning all solutions to generate complete catalogs...")
+        generator.scan_solutions()
 
     # Generate catalogs from discovered solutions
-    generator.generate_catalogs()
\ No newline at end of file
+    generator.generate_catalogs()
+
+    if args.watch:
+        generator.watch(debounce=args.debounce)
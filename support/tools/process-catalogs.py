@@ -7,12 +7,30 @@ Copyright (c) 2025 EO Framework™
 Licensed under BSL 1.1 - see LICENSE file for details
 """
 
-import yaml
+import copy
 import json
 import os
 import argparse
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+
+from catalog_export import (
+    EXPORT_COMPRESSIONS, EXPORT_FORMATS, export_path, open_export, read_export_solutions, solutions_delta,
+    write_json_export, write_ndjson_export, write_shards
+)
+from catalog_model import index_catalogs, load_catalog_index, load_yaml
+from catalog_search import FacetIndex, FuzzyIndex, SearchIndex, iter_bits, load_search_index, popcount
+
+def export_default(value):
+    """JSON fallback for the export: read-only solution views as objects, anything else as text"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return str(value)
+
+def plain_solution(solution):
+    """Independent plain-dict copy of a solution from the shared view, safe to mutate or serialise"""
+    return copy.deepcopy(dict(solution))
 
 class CatalogProcessor:
     def __init__(self, catalog_dir):
@@ -20,43 +38,141 @@ class CatalogProcessor:
         self.master_catalog = None
         self.provider_catalogs = {}
         self.category_catalogs = {}
+        self._catalog_index = None
+        self._catalog_index_checked = False
+        self._search_index = None
+
+        # Derived from provider_catalogs; cleared whenever they are reloaded
+        self._solutions = None
+        self._solutions_by_id = None
+        self._statistics = None
+        self._facet_index = None
+        self._fuzzy_index = None
+
+    def invalidate_solution_view(self):
+        """Drop everything derived from the loaded catalogs"""
+        self._solutions = None
+        self._solutions_by_id = None
+        self._statistics = None
+        self._search_index = None
+        self._facet_index = None
+        self._fuzzy_index = None
+
+    def get_catalog_index(self, refresh=False):
+        """Return the JSON catalog index if it is fresh
+
+        The check is remembered until the next refresh; every catalog load
+        refreshes it (once for all three loaders in load_catalogs()), so
+        regenerated catalogs are never served from a stale index.
+        """
+        if refresh or not self._catalog_index_checked:
+            self._catalog_index = load_catalog_index(self.catalog_dir)
+            self._catalog_index_checked = True
+        return self._catalog_index
+
+    def get_search_index(self):
+        """Return the full-text search index, loading or building it on first use
+
+        The index written by generate-catalogs.py is used when it was built
+        from the same catalogs as the fresh JSON catalog index; otherwise it is
+        rebuilt in memory from the loaded catalogs.
+        """
+        if self._search_index is None:
+            catalog_index = self.get_catalog_index()
+            if catalog_index:
+                self._search_index = load_search_index(self.catalog_dir, source_hash=catalog_index['source_hash'])
+            if self._search_index is None:
+                self._search_index = SearchIndex.build(self._solution_view())
+        return self._search_index
         
-    def load_master_catalog(self):
-        """Load the master catalog"""
+    def load_catalogs(self):
+        """Load the master, provider and category catalogs
+
+        The JSON index is checked for freshness (hashing every catalog file)
+        once, and the three loaders share that result.
+        """
+        self.get_catalog_index(refresh=True)
+        self.load_master_catalog(refresh_index=False)
+        self.load_provider_catalogs(refresh_index=False)
+        self.load_category_catalogs(refresh_index=False)
+
+    def load_master_catalog(self, refresh_index=True):
+        """Load the master catalog
+
+        refresh_index=False reuses the JSON index checked by the caller (see load_catalogs()).
+        """
+        self.invalidate_solution_view()
+        index = self.get_catalog_index(refresh=refresh_index)
+        if index and 'catalog.yml' in index['files']:
+            self.master_catalog = index['files']['catalog.yml']['data']
+            print("✓ Loaded master catalog (index)")
+            return
+
         master_file = self.catalog_dir / 'catalog.yml'
         if master_file.exists():
             with open(master_file, 'r') as f:
-                self.master_catalog = yaml.safe_load(f)
-            print(f"✓ Loaded master catalog")
+                self.master_catalog = load_yaml(f)
+            print("✓ Loaded master catalog")
         else:
             raise FileNotFoundError("Master catalog not found")
     
-    def load_provider_catalogs(self):
-        """Load all provider catalogs"""
+    def load_provider_catalogs(self, refresh_index=True):
+        """Load all provider catalogs
+
+        refresh_index=False reuses the JSON index checked by the caller (see load_catalogs()).
+        """
+        self.invalidate_solution_view()
+        index = self.get_catalog_index(refresh=refresh_index)
+        if index:
+            self.provider_catalogs = index_catalogs(index, 'providers')
+            print(f"✓ Loaded {len(self.provider_catalogs)} provider catalogs (index)")
+            return
+
+        # Replace rather than update, so catalogs deleted since the last load disappear
+        self.provider_catalogs = {}
         providers_dir = self.catalog_dir / 'providers'
         if not providers_dir.exists():
             return
             
-        for provider_file in providers_dir.glob('*.yml'):
+        for provider_file in sorted(providers_dir.glob('*.yml')):
             provider_name = provider_file.stem
             with open(provider_file, 'r') as f:
-                self.provider_catalogs[provider_name] = yaml.safe_load(f)
+                self.provider_catalogs[provider_name] = load_yaml(f)
         
         print(f"✓ Loaded {len(self.provider_catalogs)} provider catalogs")
     
-    def load_category_catalogs(self):
-        """Load all category catalogs"""
+    def load_category_catalogs(self, refresh_index=True):
+        """Load all category catalogs
+
+        refresh_index=False reuses the JSON index checked by the caller (see load_catalogs()).
+        """
+        self.invalidate_solution_view()
+        index = self.get_catalog_index(refresh=refresh_index)
+        if index:
+            self.category_catalogs = index_catalogs(index, 'categories')
+            print(f"✓ Loaded {len(self.category_catalogs)} category catalogs (index)")
+            return
+
+        self.category_catalogs = {}
         categories_dir = self.catalog_dir / 'categories'
         if not categories_dir.exists():
             return
             
-        for category_file in categories_dir.glob('*.yml'):
+        for category_file in sorted(categories_dir.glob('*.yml')):
             category_name = category_file.stem
             with open(category_file, 'r') as f:
-                self.category_catalogs[category_name] = yaml.safe_load(f)
+                self.category_catalogs[category_name] = load_yaml(f)
         
         print(f"✓ Loaded {len(self.category_catalogs)} category catalogs")
     
+    def load_model(self, model):
+        """Use catalogs already built in memory instead of re-reading the YAML files"""
+        self.master_catalog = model.master_catalog
+        self.provider_catalogs = dict(model.provider_catalogs)
+        self.category_catalogs = dict(model.category_catalogs)
+        self.invalidate_solution_view()
+        print(f"✓ Loaded {len(self.provider_catalogs)} provider and {len(self.category_catalogs)} category catalogs from memory")
+
     def aggregate_all_solutions(self):
         """Aggregate all solutions from provider catalogs"""
         all_solutions = []
@@ -74,43 +190,120 @@ class CatalogProcessor:
                     all_solutions.append(solution)
         
         return all_solutions
+
+    def _solution_view(self):
+        """Shared view of every solution behind the indexes, built once per catalog load
+
+        A tuple of mappingproxy objects whose nested lists and dicts are
+        shared too, so it stays inside the processor: public methods hand out
+        plain copies (see plain_solution()).
+        """
+        if self._solutions is None:
+            self._solutions = tuple(MappingProxyType(solution) for solution in self.aggregate_all_solutions())
+        return self._solutions
+
+    def get_solutions(self):
+        """Every solution as an independent plain dict"""
+        return [plain_solution(solution) for solution in self._solution_view()]
+
+    def get_solution(self, solution_id):
+        """One solution by id as an independent plain dict, or None"""
+        if self._solutions_by_id is None:
+            self._solutions_by_id = {solution['id']: solution for solution in self._solution_view()}
+        solution = self._solutions_by_id.get(solution_id)
+        return plain_solution(solution) if solution is not None else None
     
-    def search_solutions(self, query=None, provider=None, category=None, complexity=None, tags=None):
-        """Search solutions with various filters"""
-        all_solutions = self.aggregate_all_solutions()
-        filtered_solutions = []
-        
-        for solution in all_solutions:
-            # Apply filters
-            if provider and solution['provider'] != provider:
-                continue
-            if category and solution['category'] != category:
-                continue
-            if complexity and solution.get('complexity') != complexity:
-                continue
-            if tags:
-                solution_tags = solution.get('tags', [])
-                if not any(tag in solution_tags for tag in tags):
-                    continue
-            
-            # Apply text search
-            if query:
-                searchable_text = ' '.join([
-                    solution.get('title', ''),
-                    solution.get('description', ''),
-                    ' '.join(solution.get('tags', []))
-                ]).lower()
-                
-                if query.lower() not in searchable_text:
-                    continue
-            
-            filtered_solutions.append(solution)
-        
-        return filtered_solutions
+    def get_facet_index(self):
+        """Facet bitmaps over the solution view, built on first use"""
+        if self._facet_index is None:
+            self._facet_index = FacetIndex(self._solution_view())
+        return self._facet_index
+
+    def get_fuzzy_index(self):
+        """Trigram index over names, display names and tags, built on first use"""
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self._solution_view())
+        return self._fuzzy_index
+
+    def fuzzy_search(self, query, limit=20, prefix=True):
+        """Typo-tolerant lookup by solution name, display name or tag
+
+        Returns (solution, score) pairs, best first; see FuzzyIndex.search().
+        """
+        return [
+            (self.get_solution(solution_id), score)
+            for solution_id, score in self.get_fuzzy_index().search(query, limit=limit, prefix=prefix)
+        ]
+
+    def search_solutions(self, query=None, provider=None, category=None, complexity=None, tags=None, prefix=False):
+        """Search solutions with various filters
+
+        A text query is answered from the inverted index (see catalog_search.py)
+        and the results are ordered by relevance. Filters are resolved through
+        the facet bitmaps; a solution matches tags when it has any of them.
+        """
+        filters = {'provider': provider, 'category': category, 'complexity': complexity, 'tags': tags}
+        return self.faceted_search(query, filters=filters, prefix=prefix, with_counts=False)['solutions']
+
+    def faceted_search(self, query=None, filters=None, prefix=False, limit=None, with_counts=True, fuzzy=True):
+        """Search with facet filters and sidebar counts
+
+        Args:
+            query: Optional full-text query; results are then ordered by relevance
+            filters: {facet field: value or list of values}; values of one field
+                are ORed, fields are ANDed (fields: provider, category,
+                complexity, status, deployment_time, tags)
+            limit: Maximum number of solutions to return; counts cover all matches
+            fuzzy: When the full-text query matches nothing, fall back to
+                typo-tolerant matching on names and tags
+
+        Returns:
+            {'total': int, 'solutions': [...], 'fuzzy': bool, 'facets': {field: {value: count}}}
+        """
+        facet_index = self.get_facet_index()
+        base = None
+        ranked_ids = None
+        used_fuzzy = False
+        if query:
+            ranked_ids = [solution_id for solution_id, _ in self.get_search_index().search(query, prefix=prefix)]
+            if not ranked_ids and fuzzy:
+                ranked_ids = [solution_id for solution_id, _ in self.get_fuzzy_index().search(query, limit=None)]
+                used_fuzzy = bool(ranked_ids)
+            base = facet_index.bits_for_ids(ranked_ids)
+
+        selected = facet_index.select(filters, base=base)
+        if ranked_ids is None:
+            positions = iter_bits(selected)
+        else:
+            positions = (
+                position for position in map(facet_index.positions.get, ranked_ids)
+                if position is not None and selected >> position & 1
+            )
+
+        solutions = []
+        for position in positions:
+            if limit is not None and len(solutions) >= limit:
+                break
+            solutions.append(plain_solution(facet_index.solutions[position]))
+
+        result = {'total': popcount(selected), 'solutions': solutions, 'fuzzy': used_fuzzy}
+        if with_counts:
+            result['facets'] = facet_index.facet_counts(filters, base=base)
+        return result
     
     def get_statistics(self):
-        """Generate comprehensive statistics"""
-        all_solutions = self.aggregate_all_solutions()
+        """Generate comprehensive statistics
+
+        Computed once per catalog load; the returned dict is shared, so treat
+        it as read-only.
+        """
+        if self._statistics is None:
+            self._statistics = self.compute_statistics()
+        return self._statistics
+
+    def compute_statistics(self):
+        """Count solutions by provider, category, complexity, deployment time and tag"""
+        all_solutions = self._solution_view()
         
         stats = {
             'total_solutions': len(all_solutions),
@@ -163,31 +356,99 @@ class CatalogProcessor:
         return stats
     
     
-    def export_solutions_json(self, output_file):
-        """Export all solutions as JSON for API consumption"""
-        all_solutions = self.aggregate_all_solutions()
+    def export_solutions_json(self, output_file, export_format='json', compact=False, compression='none'):
+        """Export all solutions as JSON for API consumption
+
+        Solutions are streamed to the file one at a time (see catalog_export.py).
+
+        Args:
+            output_file: Target path; its extension is adjusted to the format and compression
+            export_format: 'json' for one document, 'ndjson' for one solution per line
+            compact: Write JSON without indentation
+            compression: 'none', 'gzip' or 'zstd'
+
+        Returns:
+            Path of the written file
+        """
+        all_solutions = self._solution_view()
+        output_file = export_path(output_file, export_format, compression)
+
+        with open_export(output_file, compression) as f:
+            if export_format == 'ndjson':
+                write_ndjson_export(f, all_solutions, default=export_default)
+            else:
+                header = {
+                    'generated_at': datetime.now().isoformat(),
+                    'total_solutions': len(all_solutions),
+                    'statistics': self.get_statistics()
+                }
+                write_json_export(f, header, all_solutions, default=export_default, compact=compact)
         
-        export_data = {
+        print(f"✓ Exported solutions as {export_format.upper()}: {output_file} ({output_file.stat().st_size:,} bytes)")
+        return output_file
+    
+    def export_sharded_json(self, shard_dir):
+        """Export one JSON file per provider and per category plus an index with counts and hashes
+
+        Lets clients fetch only the provider or category they render; see
+        catalog_export.write_shards() for the layout.
+        """
+        facet_index = self.get_facet_index()
+        groups = {'providers': {}, 'categories': {}}
+        for kind, field_name, catalogs, name_key in (
+            ('providers', 'provider', self.provider_catalogs, 'provider_name'),
+            ('categories', 'category', self.category_catalogs, 'category_name')
+        ):
+            for name, bits in facet_index.bitmaps[field_name].items():
+                display_name = (catalogs.get(name) or {}).get('metadata', {}).get(name_key, name)
+                groups[kind][name] = (display_name, facet_index.solutions_for(bits))
+
+        index = write_shards(shard_dir, groups, default=export_default)
+        print(f"✓ Exported {len(index['providers'])} provider and {len(index['categories'])} category shards: {shard_dir}")
+        return index
+
+    def export_delta(self, previous_solutions, output_file, previous_file=None):
+        """Write the added, removed and modified solutions since a previous export
+
+        Args:
+            previous_solutions: Solutions of the previously published export
+            output_file: Path of the delta document
+            previous_file: Where the previous export was read from, for reference
+        """
+        current = json.loads(json.dumps(list(self._solution_view()), default=export_default))
+        delta = {
             'generated_at': datetime.now().isoformat(),
-            'total_solutions': len(all_solutions),
-            'statistics': self.get_statistics(),
-            'solutions': all_solutions
+            'from': {
+                'file': str(previous_file) if previous_file else None,
+                'total_solutions': len(previous_solutions)
+            },
+            'to': {'total_solutions': len(current)},
+            **solutions_delta(previous_solutions, current)
         }
-        
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
-        
-        print(f"✓ Exported solutions as JSON: {output_file}")
-        return export_data
-    
-    def run_full_processing(self):
-        """Run complete catalog processing"""
+
+        with open_export(output_file) as f:
+            json.dump(delta, f, indent=2)
+
+        summary = delta['summary']
+        print(f"✓ Exported delta: {output_file} "
+              f"(+{summary['added']} -{summary['removed']} ~{summary['modified']}, {summary['unchanged']} unchanged)")
+        return delta
+
+    def run_full_processing(self, model=None, export_format='json', compact=False, compression='none', delta_from=None):
+        """Run complete catalog processing
+
+        Args:
+            model: Optional CatalogModel from the same process; skips reading catalogs from disk
+            export_format, compact, compression: Passed to export_solutions_json()
+            delta_from: Previously published export to diff against; writes solutions.delta.json
+        """
         print("🔄 Starting catalog processing...")
         
         # Load all catalogs
-        self.load_master_catalog()
-        self.load_provider_catalogs()
-        self.load_category_catalogs()
+        if model is not None:
+            self.load_model(model)
+        else:
+            self.load_catalogs()
         
         # Generate outputs
         stats = self.get_statistics()
@@ -196,7 +457,14 @@ class CatalogProcessor:
         # Export JSON for API consumption
         exports_dir = self.catalog_dir.parent / 'exports'
         json_file = exports_dir / 'solutions.json'
-        self.export_solutions_json(json_file)
+
+        # Read the previous export before it may be overwritten below
+        previous_solutions = read_export_solutions(delta_from) if delta_from else None
+
+        self.export_solutions_json(json_file, export_format=export_format, compact=compact, compression=compression)
+        self.export_sharded_json(exports_dir / 'shards')
+        if previous_solutions is not None:
+            self.export_delta(previous_solutions, exports_dir / 'solutions.delta.json', previous_file=delta_from)
         
         print("✅ Catalog processing completed successfully!")
         print(f"📊 Total solutions: {stats['total_solutions']}")
@@ -210,6 +478,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Process solution catalogs')
     parser.add_argument('--solutions', type=str, help='Space-separated list of solution paths (provider/category/solution) - for incremental mode info only')
     parser.add_argument('--all', action='store_true', help='Process all solutions (default behavior)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='json', help='solutions export format: one JSON document or NDJSON lines (default: json)')
+    parser.add_argument('--compact', action='store_true', help='Write the JSON export without indentation')
+    parser.add_argument('--compress', choices=EXPORT_COMPRESSIONS, default='none', help='Compress the export (zstd needs the zstandard package)')
+    parser.add_argument('--delta-from', type=str, help='Previously published solutions export to diff against; writes solutions.delta.json')
     args = parser.parse_args()
 
     # Auto-detect paths relative to script location
@@ -225,7 +497,9 @@ if __name__ == "__main__":
         print("🌐 Full mode: Processing all catalogs")
 
     processor = CatalogProcessor(catalog_dir)
-    stats = processor.run_full_processing()
+    stats = processor.run_full_processing(
+        export_format=args.format, compact=args.compact, compression=args.compress, delta_from=args.delta_from
+    )
 
     # Display some statistics
     print("\n📈 Solution Statistics:")
@@ -0,0 +1,279 @@
+"""
+Secret Scanner
+Single-pass multi-pattern scanning of solution files for potential secrets
+
+Every detector is folded into one compiled bytes regex of lookahead
+alternatives, so a file is scanned once however many detectors there are.
+Hits at different offsets may overlap (api_key= also contains key=), and
+where several detectors match at the same offset each one is reported.
+Allowlisted values, such as the project's own email addresses, are not. Large
+files are memory-mapped instead of read, and binary files are skipped.
+
+Office documents (.docx, .xlsx, .pptx) are zip containers: only the XML
+parts that carry text are decompressed, streamed through iterparse and
+scanned paragraph by paragraph for secrets and personal data, without
+extracting anything to disk.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import mmap
+import os
+import re
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+# (group name, label shown in reports, bytes regex)
+SECRET_DETECTORS = (
+    ('password', 'password=', rb'password='),
+    ('secret', 'secret=', rb'secret='),
+    ('key', 'key=', rb'key='),
+    ('token', 'token=', rb'token='),
+    ('credential', 'credential=', rb'credential='),
+    ('aws_access_key', 'aws_access_key=', rb'aws_access_key='),
+    ('aws_secret_key', 'aws_secret_key=', rb'aws_secret_key='),
+    ('api_key', 'api_key=', rb'api_key='),
+)
+
+# Personal data, anchored so a match is reported once rather than at every offset inside it
+PII_DETECTORS = (
+    ('email', 'email address', rb'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}'),
+    ('ssn', 'US social security number', rb'(?<![0-9])[0-9]{3}-[0-9]{2}-[0-9]{4}(?![0-9])'),
+    ('card_number', 'payment card number', rb'(?<![0-9])(?:[0-9]{4}[ -]){3}[0-9]{4}(?![0-9])'),
+)
+PII_DETECTOR_NAMES = frozenset(name for name, _, _ in PII_DETECTORS)
+
+# Matched values that are never reported, per detector: the project's own
+# addresses (every template lists eoframework.com maintainers), the reserved
+# example domains and the non-public .local/.test/.example/.invalid names
+ALLOWED_VALUES = {
+    'email': rb'(?:@(?:[a-z0-9-]+\.)*(?:eoframework\.com|example\.(?:com|org|net))|\.(?:local|test|example|invalid))\Z',
+}
+
+SECRET_SCAN_EXTENSIONS = ('.py', '.sh', '.ps1', '.yml', '.yaml', '.json', '.tf')
+OFFICE_SCAN_EXTENSIONS = ('.docx', '.xlsx', '.pptx')
+
+# Zip parts holding document, spreadsheet and slide text
+OFFICE_TEXT_PARTS = re.compile(
+    r'^(?:word/(?:document|header[0-9]*|footer[0-9]*|comments|footnotes|endnotes)\.xml'
+    r'|xl/sharedStrings\.xml'
+    r'|ppt/(?:slides/slide|notesSlides/notesSlide)[0-9]+\.xml)$'
+)
+# Elements whose end closes a paragraph (w:p, a:p) or a shared string (si)
+OFFICE_PARAGRAPH_TAGS = frozenset({'p', 'si'})
+
+# Everything a damaged, truncated, encrypted or unsupported zip part can raise
+# while it is opened, decompressed or parsed
+OFFICE_READ_ERRORS = (
+    OSError, EOFError, ValueError, RuntimeError, NotImplementedError,
+    zlib.error, zipfile.BadZipFile, zipfile.LargeZipFile, ET.ParseError
+)
+
+# Below this many documents a process pool costs more than it saves
+PARALLEL_OFFICE_THRESHOLD = 4
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 1024 * 1024
+# A NUL byte in the first block marks a file as binary
+BINARY_SNIFF_BYTES = 8192
+
+
+@dataclass(frozen=True)
+class SecretHit:
+    """One detector match, with a 1-based line and column (in bytes)"""
+    path: str
+    line: int
+    column: int
+    detector: str
+    label: str
+
+    def __str__(self):
+        return f"{self.path}:{self.line}:{self.column}: contains '{self.label}'"
+
+    @property
+    def kind(self):
+        """'personal data' for PII detectors, otherwise 'secret'"""
+        return 'personal data' if self.detector in PII_DETECTOR_NAMES else 'secret'
+
+
+class SecretScanner:
+    """Compiled set of detectors, matched case-insensitively in one pass"""
+
+    def __init__(self, detectors=SECRET_DETECTORS, allowed=ALLOWED_VALUES):
+        self.labels = {name: label for name, label, _ in detectors}
+        alternatives = b'|'.join(b'(?P<' + name.encode('ascii') + b'>' + pattern + b')'
+                                 for name, _, pattern in detectors)
+        # Zero-width lookahead lets matches starting at different offsets overlap
+        self.pattern = re.compile(b'(?=' + alternatives + b')', re.IGNORECASE)
+        # Alternation stops at the first detector matching at an offset; these
+        # find the others there, and only run where the combined pattern hit
+        self.detectors = tuple((name, re.compile(pattern, re.IGNORECASE)) for name, _, pattern in detectors)
+        self.allowed = {name: re.compile(pattern, re.IGNORECASE)
+                        for name, pattern in allowed.items() if name in self.labels}
+        # When every detector is a plain literal, a substring check on the
+        # lowercased file rules most files out far faster than the regex
+        patterns = [pattern for _, _, pattern in detectors]
+        self.literals = tuple(pattern.lower() for pattern in patterns) \
+            if all(re.escape(pattern) == pattern for pattern in patterns) else None
+
+    def scan(self, data):
+        """Yield (offset, detector name) for every hit in a bytes-like buffer
+
+        Every detector matching at an offset is reported, in detector order,
+        except for values on the detector's allowlist.
+        """
+        for match in self.pattern.finditer(data):
+            offset = match.start()
+            if not self.is_allowed(match.lastgroup, match.group(match.lastgroup)):
+                yield offset, match.lastgroup
+            for name, pattern in self.detectors:
+                if name == match.lastgroup:
+                    continue
+                other = pattern.match(data, offset)
+                if other and not self.is_allowed(name, other.group()):
+                    yield offset, name
+
+    def may_match(self, data):
+        """False when no detector can match the bytes; True when the regex has to decide"""
+        if self.literals is None:
+            return True
+        lowered = data.lower()
+        return any(literal in lowered for literal in self.literals)
+
+    def is_allowed(self, name, value):
+        """Whether a matched value is allowlisted for its detector"""
+        allowed = self.allowed.get(name)
+        return allowed is not None and allowed.search(value) is not None
+
+    def scan_bytes(self, data, path=''):
+        """Hits in a bytes-like buffer with line and column numbers"""
+        hits = []
+        line = 1
+        line_start = 0
+        position = 0
+        for offset, name in self.scan(data):
+            newlines = count_newlines(data, position, offset)
+            if newlines:
+                line += newlines
+                line_start = data.rfind(b'\n', position, offset) + 1
+            position = offset
+            hits.append(SecretHit(path=path, line=line, column=offset - line_start + 1,
+                                  detector=name, label=self.labels[name]))
+        return hits
+
+    def scan_file(self, path, display_path=None):
+        """Hits in a file; binary and unreadable files yield none"""
+        display_path = str(display_path if display_path is not None else path)
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0 or is_binary(f.read(BINARY_SNIFF_BYTES)):
+                    return []
+                if size < MMAP_THRESHOLD:
+                    f.seek(0)
+                    data = f.read()
+                    return self.scan_bytes(data, display_path) if self.may_match(data) else []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self.scan_bytes(data, display_path)
+        except (OSError, ValueError):
+            return []
+
+    def scan_office_file(self, path, display_path=None):
+        """Hits in the text parts of an Office document, plus the parts that could not be read
+
+        Hits are reported as document[part]:paragraph:column, counting
+        paragraphs (or shared strings) from 1 within each part. Runs of a
+        paragraph are joined first, so a secret split across formatting runs
+        is still found. A corrupt, truncated or unsupported part is recorded
+        as unscannable, keeping the hits found before the damage, and the
+        remaining parts are still scanned.
+
+        Returns (hits, problems), problems being "document[part]: reason" strings.
+        """
+        display_path = str(display_path if display_path is not None else path)
+        hits = []
+        problems = []
+        try:
+            archive = zipfile.ZipFile(path)
+        except OFFICE_READ_ERRORS as e:
+            return hits, [f"{display_path}: {describe_error(e)}"]
+
+        with archive:
+            for part in sorted(name for name in archive.namelist() if OFFICE_TEXT_PARTS.match(name)):
+                part_path = f"{display_path}[{part}]"
+                try:
+                    with archive.open(part) as stream:
+                        for paragraph, text in iter_office_paragraphs(stream):
+                            for offset, name in self.scan(text):
+                                hits.append(SecretHit(path=part_path, line=paragraph, column=offset + 1,
+                                                      detector=name, label=self.labels[name]))
+                except OFFICE_READ_ERRORS as e:
+                    problems.append(f"{part_path}: {describe_error(e)}")
+        return hits, problems
+
+
+def describe_error(error):
+    """Short reason for an unreadable document or part"""
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+
+def iter_office_paragraphs(stream):
+    """Yield (number, UTF-8 text) for every non-empty paragraph of an OOXML part
+
+    Elements are cleared as soon as their paragraph ends, so memory stays
+    bounded however large the part is.
+    """
+    number = 0
+    runs = []
+    for _, element in ET.iterparse(stream, events=('end',)):
+        local_name = element.tag.rpartition('}')[2]
+        if local_name == 't':
+            if element.text:
+                runs.append(element.text)
+        elif local_name in OFFICE_PARAGRAPH_TAGS:
+            number += 1
+            if runs:
+                yield number, ''.join(runs).encode('utf-8')
+                runs = []
+            element.clear()
+
+
+# Scanner used by office scan workers; PII detectors run alongside the secret ones
+_office_scanner = None
+
+
+def _scan_office_item(item):
+    global _office_scanner
+    if _office_scanner is None:
+        _office_scanner = SecretScanner(SECRET_DETECTORS + PII_DETECTORS)
+    path, display_path = item
+    return _office_scanner.scan_office_file(path, display_path)
+
+
+def scan_office_files(items, jobs=1):
+    """Scan (path, display_path) Office documents, in a process pool when jobs > 1
+
+    Returns one (hits, problems) pair per item, in the order given.
+    """
+    items = list(items)
+    if jobs > 1 and len(items) >= PARALLEL_OFFICE_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+            return list(executor.map(_scan_office_item, items))
+    return [_scan_office_item(item) for item in items]
+
+
+def count_newlines(data, start, end):
+    """Newlines in data[start:end], counted in blocks so mmaps are never copied whole"""
+    count = 0
+    for block_start in range(start, end, MMAP_THRESHOLD):
+        count += data[block_start:min(block_start + MMAP_THRESHOLD, end)].count(b'\n')
+    return count
+
+
+def is_binary(head):
+    """Whether a file's leading bytes look binary"""
+    return b'\0' in head
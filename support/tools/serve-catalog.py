@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Catalog Query Service
+Serves search, facets, statistics and solution lookups over HTTP
+
+A small asyncio HTTP/1.1 server over the processed catalogs. Responses carry
+an ETag derived from the catalog version and the request, so clients can
+revalidate with If-None-Match and get 304 Not Modified; larger bodies are
+gzip-compressed when the client accepts it. The catalog files are polled and
+reloaded in the background when generate-catalogs.py rewrites them.
+
+Endpoints (GET or HEAD):
+    /health                 service and catalog version
+    /search?q=...           ranked solutions; supports the facet filters below
+    /facets                 facet counts for the given filters
+    /suggest?q=...          typo-tolerant name and tag matches for search-as-you-type
+    /stats                  catalog statistics
+    /solutions/<id>         one solution, e.g. /solutions/aws-ai-intelligent-document-processing
+
+Filters: provider, category, complexity, status, deployment_time, tag
+(repeat a parameter or separate values with commas), plus limit, offset and
+prefix=1 for search-as-you-type.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from catalog_model import CATALOG_INDEX_FILENAME, catalog_files, load_tool_module
+from catalog_search import FACET_FIELDS, SEARCH_INDEX_FILENAME
+
+process_catalogs = load_tool_module('process-catalogs')
+
+# Bodies smaller than this are sent uncompressed; gzip would barely help
+GZIP_MIN_SIZE = 1024
+DEFAULT_SEARCH_LIMIT = 20
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SEARCH_LIMIT = 500
+MAX_REQUEST_HEAD = 16 * 1024
+
+# Query parameters accepted as facet filters, and the facet field they map to
+FILTER_PARAMETERS = {field_name: field_name for field_name in FACET_FIELDS}
+FILTER_PARAMETERS['tag'] = 'tags'
+
+
+@dataclass
+class Response:
+    """An HTTP response, independent of how it is sent"""
+    status: int
+    body: bytes = b''
+    headers: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """One loaded version of the catalogs; replaced as a whole on reload"""
+    processor: object
+    version: str
+    fingerprint: tuple
+    loaded_at: str
+
+
+class CatalogService:
+    """Request handling over the current catalog snapshot, free of any transport code"""
+
+    def __init__(self, catalog_dir):
+        self.catalog_dir = Path(catalog_dir)
+        self.snapshot = None
+
+    def fingerprint(self):
+        """Size and mtime of every catalog file, to detect rewrites cheaply"""
+        names = catalog_files(self.catalog_dir) + [CATALOG_INDEX_FILENAME, SEARCH_INDEX_FILENAME]
+        stats = []
+        for name in names:
+            try:
+                stat = os.stat(self.catalog_dir / name)
+            except OSError:
+                continue
+            stats.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(stats)
+
+    def load(self):
+        """Load the catalogs into a new snapshot and make it current"""
+        fingerprint = self.fingerprint()
+        processor = process_catalogs.CatalogProcessor(self.catalog_dir)
+        processor.load_catalogs()
+
+        # Warm the caches so the first requests after a reload stay fast
+        processor.get_statistics()
+        processor.get_facet_index()
+        processor.get_search_index()
+        processor.get_fuzzy_index()
+
+        catalog_index = processor.get_catalog_index()
+        if catalog_index:
+            version = catalog_index['source_hash']
+        else:
+            version = hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+        self.snapshot = CatalogSnapshot(
+            processor=processor,
+            version=version,
+            fingerprint=fingerprint,
+            loaded_at=datetime.now().isoformat()
+        )
+        return self.snapshot
+
+    def reload_if_changed(self):
+        """Reload when the catalog files changed since the last load; returns True if reloaded"""
+        if self.snapshot is not None and self.fingerprint() == self.snapshot.fingerprint:
+            return False
+        self.load()
+        return True
+
+    def handle(self, method, target, headers):
+        """Answer one request
+
+        Args:
+            method: HTTP method
+            target: Request target (path and query string)
+            headers: Request headers with lowercase names
+        """
+        if method not in ('GET', 'HEAD'):
+            response = self.json_response(HTTPStatus.METHOD_NOT_ALLOWED, {'error': 'Only GET and HEAD are supported'})
+            response.headers['Allow'] = 'GET, HEAD'
+            return response
+
+        snapshot = self.snapshot
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip('/') or '/'
+        params = parse_qs(url.query)
+
+        try:
+            status, payload = self.route(snapshot, path, params)
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {'error': str(e)}
+        except Exception as e:
+            print(f"✗ Error handling {target}: {e}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal server error'}
+
+        response = self.json_response(status, payload)
+        accept_encoding = headers.get('accept-encoding', '')
+        if status != HTTPStatus.OK:
+            return self.encode(response, accept_encoding)
+
+        # The body only depends on the catalog version and the request, so
+        # the validator is derived from those; only successful responses get one
+        canonical_query = '&'.join(f"{key}={','.join(values)}" for key, values in sorted(params.items()))
+        etag = '"' + hashlib.sha256(f"{snapshot.version}\0{path}\0{canonical_query}".encode()).hexdigest()[:32] + '"'
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'no-cache'
+
+        if etag_matches(headers.get('if-none-match'), etag):
+            # Same validators and Vary as the 200 this stands in for, without compressing anything
+            if self.use_gzip(response, accept_encoding):
+                etag = gzip_etag(etag)
+            return Response(HTTPStatus.NOT_MODIFIED, headers={
+                'ETag': etag,
+                'Cache-Control': 'no-cache',
+                'Vary': 'Accept-Encoding'
+            })
+        return self.encode(response, accept_encoding)
+
+    def route(self, snapshot, path, params):
+        """Return (status, payload) for a request path"""
+        processor = snapshot.processor
+
+        if path == '/health':
+            return HTTPStatus.OK, {
+                'status': 'ok',
+                'catalog_version': snapshot.version,
+                'loaded_at': snapshot.loaded_at,
+                'total_solutions': processor.get_statistics()['total_solutions']
+            }
+
+        if path == '/stats':
+            return HTTPStatus.OK, processor.get_statistics()
+
+        if path == '/search':
+            query = ' '.join(params.get('q', [])).strip() or None
+            limit = bounded_int(params, 'limit', DEFAULT_SEARCH_LIMIT, 0, MAX_SEARCH_LIMIT)
+            offset = bounded_int(params, 'offset', 0, 0, None)
+            prefix = params.get('prefix', ['0'])[-1] in ('1', 'true', 'yes')
+            result = processor.faceted_search(
+                query, filters=parse_filters(params), prefix=prefix, limit=offset + limit, with_counts=False
+            )
+            return HTTPStatus.OK, {
+                'query': query,
+                'fuzzy': result['fuzzy'],
+                'total': result['total'],
+                'offset': offset,
+                'limit': limit,
+                'solutions': result['solutions'][offset:]
+            }
+
+        if path == '/suggest':
+            query = ' '.join(params.get('q', [])).strip()
+            limit = bounded_int(params, 'limit', DEFAULT_SUGGEST_LIMIT, 0, MAX_SEARCH_LIMIT)
+            return HTTPStatus.OK, {
+                'query': query,
+                'suggestions': [
+                    {
+                        'id': solution['id'],
+                        'title': solution.get('solution_display_name', solution.get('title')),
+                        'score': round(score, 4)
+                    }
+                    for solution, score in processor.fuzzy_search(query, limit=limit)
+                ]
+            }
+
+        if path == '/facets':
+            query = ' '.join(params.get('q', [])).strip() or None
+            result = processor.faceted_search(query, filters=parse_filters(params), limit=0)
+            return HTTPStatus.OK, {'query': query, 'total': result['total'], 'facets': result['facets']}
+
+        if path.startswith('/solutions/'):
+            solution_id = path[len('/solutions/'):]
+            solution = processor.get_solution(solution_id)
+            if solution is None:
+                return HTTPStatus.NOT_FOUND, {'error': f"Solution not found: {solution_id}"}
+            return HTTPStatus.OK, solution
+
+        return HTTPStatus.NOT_FOUND, {'error': f"Unknown endpoint: {path}"}
+
+    def json_response(self, status, payload):
+        body = json.dumps(payload, separators=(',', ':'), default=process_catalogs.export_default).encode('utf-8')
+        return Response(status, body, {'Content-Type': 'application/json; charset=utf-8'})
+
+    def use_gzip(self, response, accept_encoding):
+        """Whether the client accepts gzip and the body is large enough to be worth it"""
+        return len(response.body) >= GZIP_MIN_SIZE and accepts_gzip(accept_encoding)
+
+    def encode(self, response, accept_encoding):
+        """Gzip the body when the client accepts it and it is worth it"""
+        response.headers['Vary'] = 'Accept-Encoding'
+        if self.use_gzip(response, accept_encoding):
+            response.body = gzip.compress(response.body, compresslevel=6)
+            response.headers['Content-Encoding'] = 'gzip'
+            if 'ETag' in response.headers:
+                # A different representation needs a different strong validator
+                response.headers['ETag'] = gzip_etag(response.headers['ETag'])
+        return response
+
+
+def gzip_etag(etag):
+    """ETag of the gzip-encoded variant of a representation"""
+    return etag[:-1] + '-gzip"'
+
+
+def etag_matches(if_none_match, etag):
+    """Check an If-None-Match header against an ETag, ignoring the gzip variant suffix"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate.replace('-gzip"', '"') == etag:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip (q=0 rules it out)"""
+    for coding in accept_encoding.lower().split(','):
+        name, _, parameters = coding.strip().partition(';')
+        if name.strip() in ('gzip', '*'):
+            return parameters.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+def parse_filters(params):
+    """Facet filters from query parameters; repeated or comma-separated values are ORed"""
+    filters = {}
+    for parameter, field_name in FILTER_PARAMETERS.items():
+        values = [value for raw in params.get(parameter, []) for value in raw.split(',') if value]
+        if values:
+            filters.setdefault(field_name, []).extend(values)
+    return filters
+
+
+def bounded_int(params, name, default, minimum, maximum):
+    """Integer query parameter clamped to [minimum, maximum]"""
+    raw = params.get(name, [None])[-1]
+    if raw is None or raw == '':
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"Parameter '{name}' must be an integer")
+    value = max(minimum, value)
+    return min(value, maximum) if maximum is not None else value
+
+
+class CatalogServer:
+    """asyncio HTTP/1.1 transport for a CatalogService"""
+
+    def __init__(self, service, host='127.0.0.1', port=8765, reload_interval=2.0):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.reload_interval = reload_interval
+
+    async def handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, 'HTTP/1.1', Response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE), False, False)
+                    break
+
+                try:
+                    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                    method, target, version = request_line.split(' ')
+                except ValueError:
+                    await self.send(writer, 'HTTP/1.1', Response(HTTPStatus.BAD_REQUEST), False, False)
+                    break
+
+                headers = {}
+                for line in header_lines:
+                    name, separator, value = line.partition(':')
+                    if separator:
+                        headers[name.strip().lower()] = value.strip()
+
+                # Request bodies are not used by any endpoint; drain them to keep the connection in sync.
+                # Chunked bodies are refused rather than parsed, and the connection closed.
+                if 'transfer-encoding' in headers:
+                    await self.send(writer, version, Response(HTTPStatus.LENGTH_REQUIRED), False, False)
+                    break
+                content_length = int(headers.get('content-length', '0') or 0)
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                # Search, facet counting and gzip are CPU-bound; run them off the event loop
+                response = await loop.run_in_executor(None, self.service.handle, method, target, headers)
+                await self.send(writer, version, response, method == 'HEAD', keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, version, response, head_only, keep_alive):
+        status = HTTPStatus(response.status)
+        headers = dict(response.headers)
+        headers['Content-Length'] = str(len(response.body))
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        head = f"{'HTTP/1.1' if version == 'HTTP/1.1' else 'HTTP/1.0'} {status.value} {status.phrase}\r\n"
+        head += ''.join(f"{name}: {value}\r\n" for name, value in headers.items()) + '\r\n'
+
+        writer.write(head.encode('latin-1'))
+        if not head_only and status != HTTPStatus.NOT_MODIFIED:
+            writer.write(response.body)
+        await writer.drain()
+
+    async def watch_catalogs(self):
+        """Poll the catalog files and swap in a fresh snapshot when they change"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                if await loop.run_in_executor(None, self.service.reload_if_changed):
+                    print(f"🔄 Reloaded catalogs (version {self.service.snapshot.version[:12]})")
+            except Exception as e:
+                # Keep serving the previous snapshot, e.g. while files are half written
+                print(f"⚠️ Catalog reload failed, keeping previous version: {e}")
+
+    async def start(self):
+        """Start listening and return the asyncio server (port=0 picks a free port)"""
+        return await asyncio.start_server(self.handle_connection, self.host, self.port, limit=MAX_REQUEST_HEAD)
+
+    async def serve(self):
+        server = await self.start()
+        reloader = asyncio.ensure_future(self.watch_catalogs()) if self.reload_interval > 0 else None
+        print(f"🌐 Serving catalog on http://{self.host}:{self.port} (Ctrl+C to stop)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if reloader:
+                reloader.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve catalog search, facets and statistics over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--reload-interval', type=float, default=2.0, help='Seconds between catalog change checks; 0 disables hot reload (default: 2)')
+    args = parser.parse_args()
+
+    # Auto-detect paths relative to script location
+    catalog_dir = Path(__file__).parent.parent / "catalog"
+
+    service = CatalogService(catalog_dir)
+    snapshot = service.load()
+    print(f"✓ Catalog version {snapshot.version[:12]} with {snapshot.processor.get_statistics()['total_solutions']} solutions")
+
+    try:
+        asyncio.run(CatalogServer(service, args.host, args.port, args.reload_interval).serve())
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
@@ -15,6 +15,8 @@ import yaml
 import argparse
 from pathlib import Path
 
+from solution_discovery import discover_solutions
+
 VALID_STATUSES = ["Draft", "In Review", "Active", "Beta", "Deprecated"]
 
 def update_solution_status(solution_path, new_status):
@@ -80,28 +82,19 @@ def main():
             print(f"❌ Error: Provider not found: {args.provider}")
             return 1
 
-        for category_path in provider_path.iterdir():
-            if category_path.is_dir():
-                for solution_path in category_path.iterdir():
-                    if solution_path.is_dir() and (solution_path / 'metadata.yml').exists():
-                        total_count += 1
-                        if update_solution_status(solution_path, args.status):
-                            success_count += 1
+        for solution in discover_solutions(repo_root / 'solutions', provider=args.provider, use_cache=True):
+            total_count += 1
+            if update_solution_status(solution.path, args.status):
+                success_count += 1
 
     else:
         # Update all solutions
         repo_root = Path(__file__).parent.parent.parent
-        solutions_path = repo_root / 'solutions'
-
-        for provider_path in solutions_path.iterdir():
-            if provider_path.is_dir():
-                for category_path in provider_path.iterdir():
-                    if category_path.is_dir():
-                        for solution_path in category_path.iterdir():
-                            if solution_path.is_dir() and (solution_path / 'metadata.yml').exists():
-                                total_count += 1
-                                if update_solution_status(solution_path, args.status):
-                                    success_count += 1
+
+        for solution in discover_solutions(repo_root / 'solutions', use_cache=True):
+            total_count += 1
+            if update_solution_status(solution.path, args.status):
+                success_count += 1
 
     print("=" * 50)
     print(f"\n📊 Summary: {success_count}/{total_count} solutions updated")
@@ -0,0 +1,240 @@
+"""
+Solution Discovery
+Shared enumeration of solutions/<provider>/<category>/<solution> for the support tools
+
+Walks the tree with os.scandir, which reports entry types from the directory
+listing itself, so discovering N solutions costs one listing per directory
+plus at most one stat per solution for its metadata.yml. An optional JSON
+cache keyed on directory mtimes lets repeated runs skip the listings too.
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import json
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from catalog_model import TOOLS_DIR, write_text_if_changed
+
+DISCOVERY_CACHE_FILE = TOOLS_DIR / '.cache' / 'solution-discovery.json'
+DISCOVERY_CACHE_VERSION = 1
+
+# Directories modified this recently may change again within the same mtime
+# tick, so they are never trusted from the cache
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class SolutionLocation:
+    """A solution directory found under solutions/"""
+    provider: str
+    category: str
+    name: str
+    path: Path
+    has_metadata: bool
+
+    @property
+    def key(self):
+        """Path-style key: provider/category/solution"""
+        return f"{self.provider}/{self.category}/{self.name}"
+
+    @property
+    def metadata_path(self):
+        return self.path / 'metadata.yml'
+
+
+@dataclass(frozen=True)
+class SolutionTree:
+    """Every provider/category pair and solution directory, in sorted order"""
+    categories: tuple
+    solutions: tuple
+
+    def with_metadata(self):
+        """Solutions that have a metadata.yml"""
+        return [solution for solution in self.solutions if solution.has_metadata]
+
+
+class _DirectoryCache:
+    """mtime-validated directory listings and metadata.yml presence"""
+
+    def __init__(self, solutions_root, cache_file):
+        self.root_key = str(Path(solutions_root).resolve())
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.listings = {}
+        self.metadata = {}
+        self.new_listings = {}
+        self.new_metadata = {}
+
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if cache.get('version') != DISCOVERY_CACHE_VERSION or cache.get('root') != self.root_key:
+            return
+        self.listings = cache.get('listings', {})
+        self.metadata = cache.get('metadata', {})
+
+    def subdirectories(self, path, rel_path):
+        """Sorted names of the non-hidden subdirectories of path"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self.listings.get(rel_path)
+        if cached and cached[0] == mtime_ns:
+            names = cached[1]
+        else:
+            with os.scandir(path) as entries:
+                names = sorted(entry.name for entry in entries if not entry.name.startswith('.') and entry.is_dir())
+        self.new_listings[rel_path] = [mtime_ns, names]
+        return names
+
+    def has_metadata(self, path, rel_path):
+        """Whether a solution directory contains metadata.yml
+
+        Creating, deleting or renaming metadata.yml updates the directory
+        mtime, so a matching mtime means the cached answer still holds.
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self.metadata.get(rel_path)
+        if cached and cached[0] == mtime_ns:
+            present = cached[1]
+        else:
+            present = os.path.isfile(os.path.join(path, 'metadata.yml'))
+        self.new_metadata[rel_path] = [mtime_ns, present]
+        return present
+
+    def save(self):
+        if self.cache_file is None:
+            return
+
+        cutoff = time.time_ns() - RACY_MTIME_WINDOW_NS
+        cache = {
+            'version': DISCOVERY_CACHE_VERSION,
+            'root': self.root_key,
+            'listings': {rel: entry for rel, entry in sorted(self.new_listings.items()) if entry[0] < cutoff},
+            'metadata': {rel: entry for rel, entry in sorted(self.new_metadata.items()) if entry[0] < cutoff}
+        }
+        try:
+            write_text_if_changed(self.cache_file, json.dumps(cache, separators=(',', ':')))
+        except OSError as e:
+            print(f"Warning: Could not write discovery cache {self.cache_file}: {e}")
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Solutions touched since a git ref, or the shared input that forces a full run"""
+    solutions: tuple
+    full_run_trigger: str = None
+
+    @property
+    def full_run(self):
+        return self.full_run_trigger is not None
+
+
+def run_git(repo_root, *args):
+    """stdout of a git command run in repo_root; raises RuntimeError when git fails"""
+    command = ['git', *args]
+    try:
+        result = subprocess.run(command, cwd=repo_root, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        message = getattr(e, 'stderr', '') or str(e)
+        raise RuntimeError(f"{' '.join(command)} failed: {message.strip()}")
+    return result.stdout
+
+
+def git_changed_files(repo_root, ref):
+    """Repository-relative paths changed since ref, including uncommitted work
+
+    Changes are taken from the merge-base of ref and HEAD, as a pull request
+    diff is, so commits that landed on ref after the branch point do not
+    count as changed. Diffing the merge-base against the working tree covers
+    both the branch's commits and uncommitted edits.
+
+    Untracked files are only picked up under solutions/, since generated
+    catalogs and reports elsewhere are never committed. Renames are listed as
+    a deletion plus an addition, so both locations are reported. Raises
+    RuntimeError when git fails.
+    """
+    base = run_git(repo_root, 'merge-base', ref, 'HEAD').strip()
+    changed = set()
+    for output in (
+        run_git(repo_root, 'diff', '--name-only', '--no-renames', base, '--'),
+        run_git(repo_root, 'ls-files', '--others', '--exclude-standard', '--', 'solutions'),
+    ):
+        changed.update(line for line in output.splitlines() if line)
+    return sorted(changed)
+
+
+def changed_solutions(repo_root, ref, shared_paths=()):
+    """Map files changed since ref to the provider/category/solution keys owning them
+
+    A change to any of shared_paths (a file, or a directory prefix ending in
+    '/') affects every solution, so the result asks for a full run instead.
+    """
+    solutions = set()
+    for rel_path in git_changed_files(repo_root, ref):
+        for shared_path in shared_paths:
+            if rel_path == shared_path or (shared_path.endswith('/') and rel_path.startswith(shared_path)):
+                return ChangeSet(solutions=(), full_run_trigger=rel_path)
+
+        parts = rel_path.split('/')
+        # Only files inside a solution directory belong to a solution
+        if len(parts) > 4 and parts[0] == 'solutions' and not any(part.startswith('.') for part in parts[1:4]):
+            solutions.add('/'.join(parts[1:4]))
+
+    return ChangeSet(solutions=tuple(sorted(solutions)))
+
+
+def scan_solution_tree(solutions_root, provider=None, use_cache=False, cache_file=DISCOVERY_CACHE_FILE):
+    """Enumerate providers, categories and solution directories under solutions_root
+
+    Hidden entries are skipped. With use_cache, directory listings are reused
+    from cache_file whenever the directory mtime is unchanged.
+    """
+    solutions_root = Path(solutions_root)
+    cache = _DirectoryCache(solutions_root, cache_file if use_cache else None)
+    categories = []
+    solutions = []
+
+    if not solutions_root.is_dir():
+        return SolutionTree(categories=(), solutions=())
+
+    if provider is None:
+        providers = cache.subdirectories(solutions_root, '')
+    else:
+        providers = [provider] if (solutions_root / provider).is_dir() else []
+
+    for provider_name in providers:
+        provider_path = os.path.join(solutions_root, provider_name)
+        for category_name in cache.subdirectories(provider_path, provider_name):
+            categories.append((provider_name, category_name))
+            category_rel = f"{provider_name}/{category_name}"
+            category_path = os.path.join(provider_path, category_name)
+
+            for solution_name in cache.subdirectories(category_path, category_rel):
+                solution_path = os.path.join(category_path, solution_name)
+                solutions.append(SolutionLocation(
+                    provider=provider_name,
+                    category=category_name,
+                    name=solution_name,
+                    path=Path(solution_path),
+                    has_metadata=cache.has_metadata(solution_path, f"{category_rel}/{solution_name}")
+                ))
+
+    # A provider-filtered walk only saw part of the tree; keep the cache as it was
+    if provider is None:
+        cache.save()
+
+    return SolutionTree(categories=tuple(categories), solutions=tuple(solutions))
+
+
+def discover_solutions(solutions_root, provider=None, require_metadata=True, use_cache=False,
+                       cache_file=DISCOVERY_CACHE_FILE):
+    """List solution directories in sorted order, by default only those with metadata.yml"""
+    tree = scan_solution_tree(solutions_root, provider=provider, use_cache=use_cache, cache_file=cache_file)
+    return tree.with_metadata() if require_metadata else list(tree.solutions)
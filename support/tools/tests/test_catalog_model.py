@@ -0,0 +1,49 @@
+"""
+Catalog Model Tests
+Incremental statistics over metadata with unexpected value types
+
+Run with: python3 -m unittest discover support/tools/tests
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalog_model import CatalogStatistics
+
+
+class CatalogStatisticsTests(unittest.TestCase):
+    def test_unhashable_values_count_as_unknown(self):
+        statistics = CatalogStatistics()
+        metadata = {'solution_name': 'demo', 'complexity': ['basic', 'advanced'], 'deployment_time': {'weeks': 2}}
+        output = io.StringIO()
+        with redirect_stdout(output):
+            statistics.add('aws', 'ai', metadata)
+            statistics.add('aws', 'ai', {'complexity': 'basic', 'deployment_time': '2 weeks'})
+
+        self.assertIn('aws/ai/demo', output.getvalue())
+        self.assertEqual(statistics.total, 2)
+        self.assertEqual(statistics.complexity_distribution()['basic'], 1)
+        self.assertEqual(statistics.deployment_time_distribution(), {'2 weeks': 1, 'unknown': 1})
+
+    def test_remove_reverses_add(self):
+        statistics = CatalogStatistics()
+        metadata = {'complexity': ['basic'], 'deployment_time': '1 week'}
+        with redirect_stdout(io.StringIO()):
+            statistics.add('aws', 'ai', metadata)
+        statistics.remove('aws', 'ai', metadata)
+
+        self.assertEqual(statistics.total, 0)
+        self.assertEqual(+statistics.by_complexity, {})
+        self.assertEqual(statistics.deployment_time_distribution(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
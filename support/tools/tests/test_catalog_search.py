@@ -0,0 +1,51 @@
+"""
+Catalog Search Tests
+Prefix expansion over a vocabulary larger than the expansion cap
+
+Run with: python3 -m unittest discover support/tools/tests
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalog_search import MAX_PREFIX_EXPANSIONS, SearchIndex
+
+RARE_TERMS = MAX_PREFIX_EXPANSIONS + 16
+COMMON_DOCS = 30
+
+
+def build_index():
+    """One rare 'ax...' term per document, and 'azure' (sorting after all of them) in many"""
+    solutions = [{'id': f"rare-{i:03d}", 'tags': [f"ax{i:03d}"]} for i in range(RARE_TERMS)]
+    solutions += [{'id': f"common-{i:03d}", 'tags': ['azure']} for i in range(COMMON_DOCS)]
+    return SearchIndex.build(solutions)
+
+
+class PrefixExpansionTests(unittest.TestCase):
+    def setUp(self):
+        self.index = build_index()
+
+    def test_expansion_is_capped(self):
+        terms = self.index.expand_prefix('a')
+        self.assertEqual(len(terms), MAX_PREFIX_EXPANSIONS)
+        self.assertEqual(terms, sorted(terms))
+
+    def test_frequent_terms_survive_the_cap(self):
+        self.assertIn('azure', self.index.expand_prefix('a'))
+        ids = {solution_id for solution_id, _ in self.index.search('a*')}
+        self.assertTrue({f"common-{i:03d}" for i in range(COMMON_DOCS)} <= ids)
+        self.assertEqual(len(ids), MAX_PREFIX_EXPANSIONS - 1 + COMMON_DOCS)
+
+    def test_short_expansion_is_complete(self):
+        self.assertEqual(self.index.expand_prefix('ax00'), [f"ax{i:03d}" for i in range(10)])
+        self.assertEqual(self.index.expand_prefix('zz'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Catalog Processor Tests
+Solutions handed out by CatalogProcessor are plain, independent dicts
+
+Run with: python3 -m unittest discover support/tools/tests
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalog_model import CatalogModel, load_tool_module
+
+process_catalogs = load_tool_module('process-catalogs')
+
+PROVIDER_CATALOGS = {
+    'aws': {
+        'metadata': {'provider_name': 'AWS'},
+        'categories': {
+            'ai': {
+                'solutions': {
+                    'document-processing': {
+                        'solution_display_name': 'Intelligent Document Processing',
+                        'complexity': 'medium',
+                        'tags': ['ai', 'documents'],
+                        'maintainers': [{'name': 'Jane Doe'}]
+                    },
+                    'chatbot': {
+                        'solution_display_name': 'Customer Chatbot',
+                        'complexity': 'low',
+                        'tags': ['ai', 'chat']
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+class SolutionBoundaryTests(unittest.TestCase):
+    def setUp(self):
+        self.processor = process_catalogs.CatalogProcessor(Path(__file__).parent)
+        self.processor.load_model(CatalogModel(master_catalog={}, provider_catalogs=PROVIDER_CATALOGS))
+
+    def test_results_serialise_without_a_default(self):
+        json.dumps(self.processor.get_solutions())
+        json.dumps(self.processor.search_solutions('documents'))
+        json.dumps(self.processor.faceted_search(filters={'tags': 'ai'}))
+        json.dumps(self.processor.fuzzy_search('chatbot'))
+        json.dumps(self.processor.get_solution('aws-ai-chatbot'))
+
+    def test_results_are_plain_dicts(self):
+        for solution in self.processor.search_solutions(tags=['ai']):
+            self.assertIs(type(solution), dict)
+
+    def test_mutating_results_leaves_the_processor_intact(self):
+        solution = self.processor.get_solution('aws-ai-document-processing')
+        solution['tags'].append('mutated')
+        solution['maintainers'][0]['name'] = 'mutated'
+        solution['complexity'] = 'mutated'
+
+        fresh = self.processor.get_solution('aws-ai-document-processing')
+        self.assertEqual(fresh['tags'], ['ai', 'documents'])
+        self.assertEqual(fresh['maintainers'], [{'name': 'Jane Doe'}])
+        self.assertEqual(len(self.processor.search_solutions(complexity='medium')), 1)
+        self.assertEqual(self.processor.search_solutions('mutated'), [])
+
+    def test_missing_solution(self):
+        self.assertIsNone(self.processor.get_solution('aws-ai-missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Secret Scanner Tests
+Regression tests for scanning damaged Office documents
+
+Run with: python3 -m unittest discover support/tools/tests
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from secret_scanner import SECRET_DETECTORS, PII_DETECTORS, SecretScanner, scan_office_files
+
+DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    + ''.join(f'<w:p><w:r><w:t>Paragraph {i} filler text to compress</w:t></w:r></w:p>' for i in range(2000))
+    + '<w:p><w:r><w:t>password=</w:t></w:r><w:r><w:t>hunter2</w:t></w:r></w:p>'
+    '</w:body></w:document>'
+)
+HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:p><w:r><w:t>Contact jane.doe@acme-corp.com</w:t></w:r></w:p></w:hdr>'
+)
+
+
+class OfficeScanTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.scanner = SecretScanner(SECRET_DETECTORS + PII_DETECTORS)
+
+    def write_docx(self, name):
+        path = Path(self.temp_dir.name) / name
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('word/document.xml', DOCUMENT_XML)
+            archive.writestr('word/header1.xml', HEADER_XML)
+        return path
+
+    def corrupt_part(self, path, part, keep_bytes=None):
+        """Overwrite (or cut short) the compressed data of one part"""
+        data = bytearray(path.read_bytes())
+        with zipfile.ZipFile(path) as archive:
+            info = archive.getinfo(part)
+        # Local header: 30 fixed bytes plus file name and extra field lengths
+        name_length = int.from_bytes(data[info.header_offset + 26:info.header_offset + 28], 'little')
+        extra_length = int.from_bytes(data[info.header_offset + 28:info.header_offset + 30], 'little')
+        start = info.header_offset + 30 + name_length + extra_length
+        if keep_bytes is None:
+            # BFINAL=1 with the reserved block type 3 makes zlib reject the stream
+            data[start] = 0xff
+        else:
+            data[start + keep_bytes:start + info.compress_size] = b'\0' * (info.compress_size - keep_bytes)
+        path.write_bytes(bytes(data))
+
+    def test_intact_document(self):
+        hits, problems = self.scanner.scan_office_file(self.write_docx('intact.docx'))
+        self.assertEqual(problems, [])
+        self.assertEqual({hit.detector for hit in hits}, {'password', 'email'})
+
+    def test_corrupt_deflate_stream_is_reported_not_raised(self):
+        path = self.write_docx('corrupt.docx')
+        self.corrupt_part(path, 'word/document.xml')
+        hits, problems = self.scanner.scan_office_file(path)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('[word/document.xml]: error:', problems[0])
+        # Parts after the damaged one are still scanned
+        self.assertIn('email', {hit.detector for hit in hits})
+
+    def test_truncated_part_is_reported_not_raised(self):
+        path = self.write_docx('truncated.docx')
+        self.corrupt_part(path, 'word/document.xml', keep_bytes=100)
+        _, problems = self.scanner.scan_office_file(path)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('[word/document.xml]', problems[0])
+
+    def test_not_a_zip_file(self):
+        path = Path(self.temp_dir.name) / 'plain.docx'
+        path.write_text('not a zip archive')
+        hits, problems = self.scanner.scan_office_file(path, display_path='plain.docx')
+        self.assertEqual(hits, [])
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].startswith('plain.docx: '))
+
+    def test_project_and_reserved_addresses_are_allowed(self):
+        text = (b'jane@eoframework.com ops@support.eoframework.com user@example.org admin@client.local '
+                b'bob@acme.com jane@eoframework.com.attacker.io')
+        hits = self.scanner.scan_bytes(text)
+        self.assertEqual([hit.column for hit in hits if hit.detector == 'email'], [86, 99])
+
+    def test_literal_prefilter_keeps_case_insensitive_hits(self):
+        scanner = SecretScanner()
+        path = Path(self.temp_dir.name) / 'settings.py'
+        path.write_bytes(b'# config\nAPI_Key="x"\n')
+        self.assertEqual([(hit.line, hit.column, hit.detector) for hit in scanner.scan_file(path)],
+                         [(2, 1, 'api_key'), (2, 5, 'key')])
+        path.write_bytes(b'nothing to see here\n')
+        self.assertEqual(scanner.scan_file(path), [])
+
+    def test_pool_survives_corrupt_documents(self):
+        paths = [self.write_docx(f"doc{i}.docx") for i in range(4)]
+        self.corrupt_part(paths[1], 'word/document.xml')
+        results = scan_office_files([(path, path.name) for path in paths], jobs=2)
+        self.assertEqual([len(problems) for _, problems in results], [0, 1, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
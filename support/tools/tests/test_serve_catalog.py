@@ -0,0 +1,176 @@
+"""
+Catalog Query Service Tests
+Exercises serve-catalog.py over real sockets with a minimal HTTP/1.1 client
+
+Run with: python3 -m unittest discover support/tools/tests
+
+Copyright (c) 2025 EO Framework™
+Licensed under BSL 1.1 - see LICENSE file for details
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalog_model import load_tool_module
+
+serve_catalog = load_tool_module('serve-catalog')
+
+SOLUTIONS = {
+    'document-processing': {
+        'solution_display_name': 'Intelligent Document Processing',
+        'description': 'Extract data from scanned documents ' * 20,
+        'complexity': 'medium',
+        'tags': ['ai', 'documents']
+    },
+    'chatbot': {
+        'solution_display_name': 'Customer Chatbot',
+        'description': 'Conversational assistant for customer support',
+        'complexity': 'low',
+        'tags': ['ai', 'chat']
+    }
+}
+
+
+def write_catalogs(catalog_dir):
+    """Minimal master, provider and category catalogs for one provider"""
+    (catalog_dir / 'providers').mkdir()
+    (catalog_dir / 'categories').mkdir()
+    catalogs = {
+        'catalog.yml': {'metadata': {'total_solutions': len(SOLUTIONS)}},
+        'providers/aws.yml': {'metadata': {'provider_name': 'AWS'}, 'categories': {'ai': {'solutions': SOLUTIONS}}},
+        'categories/ai.yml': {'metadata': {'category_name': 'AI'}, 'providers': {'aws': {'solutions': SOLUTIONS}}}
+    }
+    for name, catalog in catalogs.items():
+        (catalog_dir / name).write_text(yaml.dump(catalog))
+
+
+async def read_response(reader):
+    """Read one response: (status, lowercase headers, body)"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').rstrip('\r\n').split('\r\n')
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length', '0')))
+    return int(status_line.split(' ')[1]), headers, body
+
+
+async def request(port, target, headers=None, method='GET', raw=None):
+    """Send one request on a new connection and return (status, headers, body)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        if raw is None:
+            lines = [f"{method} {target} HTTP/1.1", 'Host: localhost', 'Connection: close']
+            lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+            raw = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        writer.write(raw)
+        await writer.drain()
+        return await read_response(reader)
+    finally:
+        writer.close()
+
+
+class SlowService(serve_catalog.CatalogService):
+    """Takes a while to answer /slow, like an expensive query"""
+
+    def handle(self, method, target, headers):
+        if target == '/slow':
+            time.sleep(0.5)
+        return super().handle(method, target, headers)
+
+
+class CatalogServerTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        catalog_dir = Path(temp_dir.name)
+        write_catalogs(catalog_dir)
+        self.service = SlowService(catalog_dir)
+        self.service.load()
+
+    def run_with_server(self, scenario):
+        """Run scenario(port) against a server on a free port"""
+        async def main():
+            server = await serve_catalog.CatalogServer(self.service, port=0, reload_interval=0).start()
+            async with server:
+                return await scenario(server.sockets[0].getsockname()[1])
+        return asyncio.run(main())
+
+    def test_search_and_lookup(self):
+        async def scenario(port):
+            status, _, body = await request(port, '/search?q=documents')
+            self.assertEqual(status, 200)
+            self.assertEqual([s['id'] for s in json.loads(body)['solutions']], ['aws-ai-document-processing'])
+
+            status, _, body = await request(port, '/solutions/aws-ai-chatbot')
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body)['complexity'], 'low')
+
+            status, _, _ = await request(port, '/solutions/aws-ai-missing')
+            self.assertEqual(status, 404)
+        self.run_with_server(scenario)
+
+    def test_etag_revalidation_and_gzip(self):
+        async def scenario(port):
+            status, headers, body = await request(port, '/search', {'Accept-Encoding': 'gzip'})
+            self.assertEqual(status, 200)
+            self.assertEqual(headers['content-encoding'], 'gzip')
+            self.assertEqual(json.loads(gzip.decompress(body))['total'], 2)
+
+            status, headers_304, body = await request(
+                port, '/search', {'Accept-Encoding': 'gzip', 'If-None-Match': headers['etag']})
+            self.assertEqual(status, 304)
+            self.assertEqual(body, b'')
+            self.assertEqual(headers_304['etag'], headers['etag'])
+            self.assertEqual(headers_304['vary'], 'Accept-Encoding')
+        self.run_with_server(scenario)
+
+    def test_chunked_body_is_refused(self):
+        async def scenario(port):
+            raw = (b'GET /health HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: chunked\r\n\r\n'
+                   b'5\r\nhello\r\n0\r\n\r\n')
+            status, headers, _ = await request(port, None, raw=raw)
+            self.assertEqual(status, 411)
+            self.assertEqual(headers['connection'], 'close')
+        self.run_with_server(scenario)
+
+    def test_keep_alive_with_content_length_body(self):
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'GET /health HTTP/1.1\r\nHost: localhost\r\nContent-Length: 5\r\n\r\nhello'
+                         b'GET /stats HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+            first, second = await read_response(reader), await read_response(reader)
+            writer.close()
+            self.assertEqual(json.loads(first[2])['status'], 'ok')
+            self.assertEqual(json.loads(second[2])['total_solutions'], 2)
+        self.run_with_server(scenario)
+
+    def test_slow_request_does_not_block_others(self):
+        async def scenario(port):
+            finished = []
+
+            async def fetch(target):
+                status, _, _ = await request(port, target)
+                finished.append((target, status))
+
+            slow = asyncio.ensure_future(fetch('/slow'))
+            await asyncio.sleep(0.05)
+            await asyncio.gather(fetch('/health'), slow)
+            return finished
+        self.assertEqual(self.run_with_server(scenario), [('/health', 200), ('/slow', 404)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,8 @@ Updates:
 import yaml
 from pathlib import Path
 
+from solution_discovery import discover_solutions
+
 SOLUTIONS_ROOT = Path(__file__).parent.parent.parent / "solutions"
 
 
@@ -496,8 +498,7 @@ def main():
     update_presales = args.presales_only or args.all or not (args.root_only or args.delivery_only)
     update_delivery = args.delivery_only or args.all or not (args.root_only or args.presales_only)
 
-    solutions = list(SOLUTIONS_ROOT.glob("*/*/*"))
-    solutions = [s for s in solutions if s.is_dir() and (s / "metadata.yml").exists()]
+    solutions = [solution.path for solution in discover_solutions(SOLUTIONS_ROOT, use_cache=True)]
 
     root_updated = 0
     presales_updated = 0
@@ -7,18 +7,46 @@ Copyright (c) 2025 EO Framework™
 Licensed under BSL 1.1 - see LICENSE file for details
 """
 
-import yaml
+import argparse
+import hashlib
+import os
+import posixpath
 import json
-import jsonschema
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import SchemaError
+
+from catalog_model import load_yaml, write_text_if_changed
+from catalog_validation import (
+    VALIDATION_CACHE_FILENAME, VALIDATION_CACHE_VERSION,
+    compile_schema, init_worker, schema_sha256, validate_catalog_item, validate_content
+)
+from solution_discovery import scan_solution_tree
+
+# Below this many uncached files, worker start-up costs more than it saves
+PARALLEL_VALIDATION_THRESHOLD = 16
+
 
 class CatalogValidator:
-    def __init__(self, catalog_dir):
+    def __init__(self, catalog_dir, jobs=None, use_cache=True):
         self.catalog_dir = Path(catalog_dir)
         self.schemas_dir = self.catalog_dir / 'schemas'
+        # Catalog paths such as ../../solutions/... are relative to the catalog directory
+        self.repo_root = self.catalog_dir.resolve().parent.parent
+        self.catalog_rel = self.catalog_dir.resolve().relative_to(self.repo_root).as_posix()
+        self.reports_dir = self.catalog_dir.parent / 'reports'
+        self.cache_file = self.reports_dir / VALIDATION_CACHE_FILENAME
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_cache = use_cache
         self.schemas = {}
+        self.schema_hashes = {}
+        self.validators = {}
         self.validation_results = []
+        self.previous_cache = {}
+        self.cache = {}
+        self.documents = {}
+        self.contents = {}
+        self.existing_paths = None
         
     def load_schemas(self):
         """Load JSON schemas for validation"""
@@ -32,61 +60,115 @@ class CatalogValidator:
             schema_file = self.schemas_dir / filename
             if schema_file.exists():
                 with open(schema_file, 'r') as f:
-                    self.schemas[schema_name] = json.load(f)
+                    schema = json.load(f)
+                try:
+                    self.validators[schema_name] = compile_schema(schema)
+                except SchemaError as e:
+                    print(f"✗ Invalid {schema_name} schema: {e.message}")
+                    continue
+                self.schemas[schema_name] = schema
+                self.schema_hashes[schema_name] = schema_sha256(schema)
                 print(f"✓ Loaded {schema_name} schema")
             else:
                 print(f"⚠️ Schema not found: {filename}")
-    
-    def validate_file(self, file_path, schema_name):
-        """Validate a single file against schema"""
+
+    def load_cache(self):
+        """Load results of earlier runs, keyed by content hash and schema hash"""
+        if not self.use_cache or not self.cache_file.exists():
+            return
         try:
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
-            
-            if schema_name in self.schemas:
-                validate(instance=data, schema=self.schemas[schema_name])
-                result = {
-                    'file': str(file_path),
-                    'schema': schema_name,
-                    'status': 'PASS',
-                    'errors': []
-                }
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable validation cache: {e}")
+            return
+        if cache.get('version') == VALIDATION_CACHE_VERSION:
+            self.previous_cache = cache.get('results', {})
+
+    def save_cache(self):
+        """Persist the results of this run; entries for files no longer seen are dropped"""
+        if not self.use_cache:
+            return
+        content = json.dumps({
+            'version': VALIDATION_CACHE_VERSION,
+            'results': dict(sorted(self.cache.items()))
+        }, indent=2)
+        write_text_if_changed(self.cache_file, content)
+
+    def validate_files(self, file_paths, schema_name):
+        """Validate files against one schema, reusing cached results
+
+        Files whose (content hash, schema hash) pair was validated before are
+        answered from the cache; the rest are validated in a worker pool when
+        there are enough of them. Results come back in the order of file_paths.
+        """
+        results = [None] * len(file_paths)
+        pending = []
+
+        for index, file_path in enumerate(file_paths):
+            result = {'file': str(file_path), 'schema': schema_name}
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+            except OSError as e:
+                results[index] = {**result, 'status': 'ERROR', 'errors': [f"File error: {e}"], 'cached': False}
+                continue
+
+            # Kept for the reference checks, which parse it at most once instead of re-reading it
+            self.contents[str(file_path)] = content
+
+            if schema_name not in self.validators:
+                results[index] = {**result, 'status': 'SKIP', 'errors': [f"Schema {schema_name} not available"],
+                                  'cached': False}
+                continue
+
+            cache_key = f"{hashlib.sha256(content).hexdigest()}:{self.schema_hashes[schema_name]}"
+            cached = self.previous_cache.get(cache_key)
+            if cached is not None:
+                self.cache[cache_key] = cached
+                results[index] = {**result, 'status': cached['status'], 'errors': cached['errors'], 'cached': True}
             else:
-                result = {
-                    'file': str(file_path),
-                    'schema': schema_name,
-                    'status': 'SKIP',
-                    'errors': [f"Schema {schema_name} not available"]
-                }
-            
-        except ValidationError as e:
-            result = {
-                'file': str(file_path),
-                'schema': schema_name,
-                'status': 'FAIL',
-                'errors': [str(e)]
-            }
-        except Exception as e:
-            result = {
-                'file': str(file_path),
-                'schema': schema_name,
-                'status': 'ERROR',
-                'errors': [f"File error: {str(e)}"]
-            }
-        
-        self.validation_results.append(result)
-        return result
+                pending.append((index, cache_key, content))
+                results[index] = result
+
+        items = [(schema_name, content) for _, _, content in pending]
+        if self.jobs > 1 and len(items) >= PARALLEL_VALIDATION_THRESHOLD:
+            chunksize = max(1, len(items) // (self.jobs * 4))
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker,
+                                     initargs=({schema_name: self.schemas[schema_name]},)) as executor:
+                outcomes = list(executor.map(validate_catalog_item, items, chunksize=chunksize))
+        else:
+            outcomes = [validate_content(self.validators[schema_name], content) for _, content in items]
+
+        # Serial or pooled, the parsed documents come back for the reference checks
+        for (index, cache_key, _), (status, errors, data) in zip(pending, outcomes):
+            key = str(file_paths[index])
+            self.documents[key] = data
+            self.contents.pop(key, None)
+            self.cache[cache_key] = {'status': status, 'errors': errors}
+            results[index].update(status=status, errors=errors, cached=False)
+
+        self.validation_results.extend(results)
+        return results
+
+    def validate_file(self, file_path, schema_name):
+        """Validate a single file against schema"""
+        return self.validate_files([file_path], schema_name)[0]
+
+    def print_result(self, label, result):
+        status_icon = "✓" if result['status'] == 'PASS' else "✗"
+        cached_note = " (cached)" if result.get('cached') else ""
+        print(f"{status_icon} {label}: {result['status']}{cached_note}")
+        if result['errors']:
+            for error in result['errors']:
+                print(f"    Error: {error}")
     
     def validate_master_catalog(self):
         """Validate master catalog"""
         master_file = self.catalog_dir / 'catalog.yml'
         if master_file.exists():
             result = self.validate_file(master_file, 'master')
-            status_icon = "✓" if result['status'] == 'PASS' else "✗"
-            print(f"{status_icon} Master catalog: {result['status']}")
-            if result['errors']:
-                for error in result['errors']:
-                    print(f"    Error: {error}")
+            self.print_result("Master catalog", result)
         else:
             print("⚠️ Master catalog not found")
     
@@ -98,13 +180,9 @@ class CatalogValidator:
             return
         
         print("\nValidating provider catalogs:")
-        for provider_file in providers_dir.glob('*.yml'):
-            result = self.validate_file(provider_file, 'provider')
-            status_icon = "✓" if result['status'] == 'PASS' else "✗"
-            print(f"{status_icon} {provider_file.name}: {result['status']}")
-            if result['errors']:
-                for error in result['errors']:
-                    print(f"    Error: {error}")
+        provider_files = sorted(providers_dir.glob('*.yml'))
+        for provider_file, result in zip(provider_files, self.validate_files(provider_files, 'provider')):
+            self.print_result(provider_file.name, result)
     
     def validate_category_catalogs(self):
         """Validate all category catalogs"""
@@ -114,14 +192,61 @@ class CatalogValidator:
             return
         
         print("\nValidating category catalogs:")
-        for category_file in categories_dir.glob('*.yml'):
-            result = self.validate_file(category_file, 'category')
-            status_icon = "✓" if result['status'] == 'PASS' else "✗"
-            print(f"{status_icon} {category_file.name}: {result['status']}")
-            if result['errors']:
-                for error in result['errors']:
-                    print(f"    Error: {error}")
+        category_files = sorted(categories_dir.glob('*.yml'))
+        for category_file, result in zip(category_files, self.validate_files(category_files, 'category')):
+            self.print_result(category_file.name, result)
     
+    def load_document(self, file_path):
+        """Parsed catalog file, reusing what schema validation parsed or read
+
+        Documents validated in this run (serially or in the pool) are reused
+        as parsed; cached or skipped files are parsed once from the bytes
+        already read for hashing. Only files validation never saw are read.
+        """
+        key = str(file_path)
+        if key not in self.documents:
+            try:
+                content = self.contents.pop(key, None)
+                if content is None:
+                    with open(file_path, 'rb') as f:
+                        content = f.read()
+                self.documents[key] = load_yaml(content)
+            except Exception as e:
+                print(f"✗ Cannot read {file_path}: {e}")
+                self.documents[key] = None
+        return self.documents[key]
+
+    def snapshot_paths(self):
+        """Record every path under solutions/ and the catalog directory in one scan
+
+        Paths are stored relative to the repository root, so each reference
+        check is a set lookup instead of a stat call.
+        """
+        if self.existing_paths is not None:
+            return self.existing_paths
+
+        paths = set()
+        tree = scan_solution_tree(self.repo_root / 'solutions', use_cache=True)
+        for provider_name, category_name in tree.categories:
+            paths.add(f"solutions/{provider_name}")
+            paths.add(f"solutions/{provider_name}/{category_name}")
+        for solution in tree.solutions:
+            paths.add(f"solutions/{solution.key}")
+
+        for dirpath, dirnames, filenames in os.walk(self.catalog_dir):
+            rel_dir = posixpath.join(self.catalog_rel, Path(dirpath).relative_to(self.catalog_dir).as_posix())
+            rel_dir = posixpath.normpath(rel_dir)
+            paths.add(rel_dir)
+            paths.update(posixpath.join(rel_dir, name) for name in dirnames + filenames)
+
+        self.existing_paths = paths
+        return paths
+
+    def reference_exists(self, reference):
+        """Whether a path written relative to the catalog directory exists"""
+        rel_path = posixpath.normpath(posixpath.join(self.catalog_rel, reference))
+        return rel_path in self.snapshot_paths()
+
     def validate_cross_references(self):
         """Validate cross-references between catalogs"""
         print("\nValidating cross-references:")
@@ -132,14 +257,14 @@ class CatalogValidator:
             print("✗ Cannot validate cross-references: master catalog missing")
             return
         
-        with open(master_file, 'r') as f:
-            master_data = yaml.safe_load(f)
+        master_data = self.load_document(master_file)
+        if not isinstance(master_data, dict):
+            return
         
         # Check provider catalog references
         provider_catalogs = master_data.get('provider_catalogs', {})
         for provider, catalog_path in provider_catalogs.items():
-            full_path = self.catalog_dir / catalog_path.lstrip('./')
-            if full_path.exists():
+            if self.reference_exists(catalog_path):
                 print(f"✓ Provider catalog reference valid: {provider}")
             else:
                 print(f"✗ Provider catalog reference broken: {provider} -> {catalog_path}")
@@ -147,8 +272,7 @@ class CatalogValidator:
         # Check category catalog references
         category_catalogs = master_data.get('category_catalogs', {})
         for category, catalog_path in category_catalogs.items():
-            full_path = self.catalog_dir / catalog_path.lstrip('./')
-            if full_path.exists():
+            if self.reference_exists(catalog_path):
                 print(f"✓ Category catalog reference valid: {category}")
             else:
                 print(f"✗ Category catalog reference broken: {category} -> {catalog_path}")
@@ -161,20 +285,18 @@ class CatalogValidator:
         if not providers_dir.exists():
             return
         
-        base_providers_dir = self.catalog_dir.parent / 'providers'
-        
-        for provider_file in providers_dir.glob('*.yml'):
-            with open(provider_file, 'r') as f:
-                provider_data = yaml.safe_load(f)
+        for provider_file in sorted(providers_dir.glob('*.yml')):
+            provider_data = self.load_document(provider_file)
+            if not isinstance(provider_data, dict):
+                continue
             
             provider_name = provider_data.get('provider')
             for category_name, category_data in provider_data.get('categories', {}).items():
                 for solution_name, solution_data in category_data.get('solutions', {}).items():
                     solution_path = solution_data.get('solution_path', '')
                     if solution_path:
-                        # Convert relative path to absolute
-                        full_path = (self.catalog_dir / solution_path.lstrip('./')).resolve()
-                        if full_path.exists():
+                        # solution_path is relative to the catalog directory, e.g. ../../solutions/<p>/<c>/<s>/
+                        if self.reference_exists(solution_path):
                             print(f"✓ Solution path valid: {provider_name}/{category_name}/{solution_name}")
                         else:
                             print(f"✗ Solution path broken: {provider_name}/{category_name}/{solution_name} -> {solution_path}")
@@ -185,6 +307,7 @@ class CatalogValidator:
         passed_files = len([r for r in self.validation_results if r['status'] == 'PASS'])
         failed_files = len([r for r in self.validation_results if r['status'] == 'FAIL'])
         error_files = len([r for r in self.validation_results if r['status'] == 'ERROR'])
+        cached_files = len([r for r in self.validation_results if r.get('cached')])
         
         report = {
             'summary': {
@@ -192,15 +315,16 @@ class CatalogValidator:
                 'passed': passed_files,
                 'failed': failed_files,
                 'errors': error_files,
+                'cached': cached_files,
+                'validated': total_files - cached_files,
                 'success_rate': f"{(passed_files / max(total_files, 1)) * 100:.1f}%"
             },
             'results': self.validation_results
         }
         
         # Write report to file
-        reports_dir = self.catalog_dir.parent / 'reports'
-        reports_dir.mkdir(exist_ok=True)
-        report_file = reports_dir / 'validation-report.json'
+        self.reports_dir.mkdir(exist_ok=True)
+        report_file = self.reports_dir / 'validation-report.json'
         with open(report_file, 'w') as f:
             json.dump(report, f, indent=2)
         
@@ -209,6 +333,7 @@ class CatalogValidator:
         print(f"  Passed: {passed_files}")
         print(f"  Failed: {failed_files}")
         print(f"  Errors: {error_files}")
+        print(f"  From cache: {cached_files}")
         print(f"  Success rate: {report['summary']['success_rate']}")
         print(f"📄 Detailed report: {report_file}")
         
@@ -218,8 +343,9 @@ class CatalogValidator:
         """Run complete validation process"""
         print("🔍 Starting catalog validation...")
         
-        # Load schemas
+        # Load schemas and results of earlier runs
         self.load_schemas()
+        self.load_cache()
         
         # Validate all catalog types
         self.validate_master_catalog()
@@ -232,14 +358,20 @@ class CatalogValidator:
         
         # Generate report
         report = self.generate_validation_report()
+        self.save_cache()
         
         print("✅ Validation completed!")
         return report
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Validate catalog files against JSON schemas')
+    parser.add_argument('--jobs', type=int, help='Worker processes for schema validation (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help=f"Revalidate every file instead of reusing reports/{VALIDATION_CACHE_FILENAME}")
+    args = parser.parse_args()
+
     # Auto-detect path relative to script location
     script_dir = Path(__file__).parent
     catalog_dir = script_dir.parent / "catalog"
     
-    validator = CatalogValidator(catalog_dir)
+    validator = CatalogValidator(catalog_dir, jobs=args.jobs, use_cache=not args.no_cache)
     report = validator.run_full_validation()
\ No newline at end of file
@@ -8,19 +8,109 @@ Licensed under BSL 1.1 - see LICENSE file for details
 """
 
 import os
+import io
 import yaml
 import json
 from pathlib import Path
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from itertools import repeat
+
+from secret_scanner import OFFICE_SCAN_EXTENSIONS, SECRET_SCAN_EXTENSIONS, SecretScanner, scan_office_files
+from solution_discovery import changed_solutions, discover_solutions
+
+# Changes under these paths can affect every solution, so --changed-since validates all of them
+SHARED_VALIDATION_INPUTS = ('solution-template/', 'support/catalog/catalog.yml', 'support/tools/')
+
+# Script subdirectories and files are solution-specific: present in the template, but not required
+SCRIPT_SUBDIRS = frozenset({
+    'delivery/scripts/ansible', 'delivery/scripts/bash', 'delivery/scripts/powershell',
+    'delivery/scripts/python', 'delivery/scripts/terraform'
+})
+SCRIPT_FILES = frozenset({
+    'delivery/scripts/ansible/playbook.yml',
+    'delivery/scripts/bash/deploy.sh',
+    'delivery/scripts/powershell/Deploy-Solution.ps1',
+    'delivery/scripts/python/requirements.txt',
+    'delivery/scripts/python/deploy.py',
+    'delivery/scripts/terraform/main.tf',
+    'delivery/scripts/terraform/outputs.tf',
+    'delivery/scripts/terraform/terraform.tfvars.example',
+    'delivery/scripts/terraform/variables.tf'
+})
+
+# Extra directories allowed in solutions, together with everything below them
+ALLOWED_EXTRA_DIRS = frozenset({
+    'delivery/scripts/terraform/modules',
+    'delivery/scripts/terraform/scripts',
+    'delivery/scripts/ansible/group_vars',
+    'delivery/scripts/ansible/inventory'
+})
+ALLOWED_EXTRA_DIR_PREFIXES = tuple(sorted(f"{allowed_dir}/" for allowed_dir in ALLOWED_EXTRA_DIRS))
+
+
+@dataclass(frozen=True)
+class TemplateStructure:
+    """Files and directories of the reference solution-template, relative to its root"""
+    files: frozenset
+    dirs: frozenset
+
+    @property
+    def required_files(self):
+        return self.files - SCRIPT_FILES
+
+    @property
+    def required_dirs(self):
+        return self.dirs - SCRIPT_SUBDIRS
+
+
+@dataclass(frozen=True)
+class TemplateResult:
+    """Outcome of validating one solution, with the report it printed"""
+    path: Path
+    errors: tuple
+    warnings: tuple
+    log: str
+
+    @property
+    def passed(self):
+        return not self.errors
+
+
+def walk_structure(root_path):
+    """Relative paths of the files and directories below root_path, as frozensets
+
+    Hidden entries and .pptx files are skipped.
+    """
+    files = set()
+    dirs = set()
+    for root, dirnames, filenames in os.walk(root_path):
+        rel_root = Path(root).relative_to(root_path).as_posix()
+        prefix = '' if rel_root == '.' else f"{rel_root}/"
+
+        # Skip .git and other hidden directories
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        dirs.update(f"{prefix}{d}" for d in dirnames)
+
+        # Record files (excluding .pptx as specified)
+        files.update(f"{prefix}{f}" for f in filenames if not f.startswith('.') and not f.endswith('.pptx'))
+    return frozenset(files), frozenset(dirs)
+
 
 class EnhancedTemplateValidator:
-    def __init__(self):
+    def __init__(self, scan_jobs=1):
         self.repo_root = Path(__file__).parent.parent.parent
         self.solution_template_path = self.repo_root / "solution-template" / "sample-provider" / "sample-category" / "sample-solution"
         self.errors = []
         self.warnings = []
         self.authorized_providers = []
         self.authorized_categories = []
+        self._template_structure = None
+        self.secret_scanner = SecretScanner()
+        # Worker processes for scanning Office documents within one solution
+        self.scan_jobs = scan_jobs
         self._load_authorized_lists()
 
     def _load_authorized_lists(self):
@@ -42,151 +132,55 @@ class EnhancedTemplateValidator:
             self.errors.append(f"Could not load authorization lists: {e}")
 
     def _get_template_file_structure(self):
-        """Get the complete file structure from solution-template"""
-        if not self.solution_template_path.exists():
-            self.errors.append(f"Solution template not found at: {self.solution_template_path}")
-            return {}, {}
-
-        template_files = {}
-        template_dirs = {}
-
-        # Walk through solution-template to get structure
-        for root, dirs, files in os.walk(self.solution_template_path):
-            rel_root = Path(root).relative_to(self.solution_template_path)
-
-            # Skip .git and other hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-            # Record directories
-            if rel_root != Path('.'):
-                template_dirs[str(rel_root)] = True
-
-            # Record files (excluding .pptx as specified)
-            for file in files:
-                if not file.startswith('.') and not file.endswith('.pptx'):
-                    if rel_root == Path('.'):
-                        file_path = file
-                    else:
-                        file_path = str(rel_root / file)
-                    template_files[file_path] = True
-
-        return template_files, template_dirs
+        """Get the complete file structure from solution-template, walked once per validator"""
+        if self._template_structure is None:
+            if not self.solution_template_path.exists():
+                return None
+            files, dirs = walk_structure(self.solution_template_path)
+            self._template_structure = TemplateStructure(files=files, dirs=dirs)
+        return self._template_structure
 
     def validate_folder_structure(self, template_path):
         """Validate that solution matches solution-template folder structure"""
-        template_files, template_dirs = self._get_template_file_structure()
+        template = self._get_template_file_structure()
 
-        if not template_files:
-            return  # Error already recorded in _get_template_file_structure
+        if template is None or not template.files:
+            self.errors.append(f"Solution template not found at: {self.solution_template_path}")
+            return
 
         print(f"🔍 Checking folder structure against solution-template...")
-        print(f"   Expected {len(template_files)} files and {len(template_dirs)} directories")
+        print(f"   Expected {len(template.files)} files and {len(template.dirs)} directories")
 
-        # Check directories - exclude script subdirectories as they are solution-specific
-        missing_dirs = []
-        script_subdirs = ['delivery/scripts/ansible', 'delivery/scripts/bash', 'delivery/scripts/powershell', 'delivery/scripts/python', 'delivery/scripts/terraform']
-
-        for expected_dir in template_dirs:
-            # Skip script subdirectories - they are solution-specific
-            if expected_dir in script_subdirs:
-                continue
-
-            dir_path = template_path / expected_dir
-            if not dir_path.exists() or not dir_path.is_dir():
-                missing_dirs.append(expected_dir)
+        solution_files, solution_dirs = walk_structure(template_path)
 
+        # Script subdirectories and files are solution-specific, so they are not required
+        missing_dirs = template.required_dirs - solution_dirs
         if missing_dirs:
-            self.errors.append(f"Missing required directories: {', '.join(missing_dirs)}")
-
-        # Check files - exclude script files as they are solution-specific
-        missing_files = []
-        script_files = [
-            'delivery/scripts/ansible/playbook.yml',
-            'delivery/scripts/bash/deploy.sh',
-            'delivery/scripts/powershell/Deploy-Solution.ps1',
-            'delivery/scripts/python/requirements.txt',
-            'delivery/scripts/python/deploy.py',
-            'delivery/scripts/terraform/main.tf',
-            'delivery/scripts/terraform/outputs.tf',
-            'delivery/scripts/terraform/terraform.tfvars.example',
-            'delivery/scripts/terraform/variables.tf'
-        ]
-
-        for expected_file in template_files:
-            # Skip script files - they are solution-specific
-            if expected_file in script_files:
-                continue
-
-            file_path = template_path / expected_file
-            if not file_path.exists() or not file_path.is_file():
-                missing_files.append(expected_file)
+            self.errors.append(f"Missing required directories: {', '.join(sorted(missing_dirs))}")
 
+        missing_files = template.required_files - solution_files
         if missing_files:
-            self.errors.append(f"Missing required files: {', '.join(missing_files)}")
+            self.errors.append(f"Missing required files: {', '.join(sorted(missing_files))}")
 
         # Check that at least one script subdirectory exists (solution must use at least one technology)
-        scripts_path = template_path / "delivery" / "scripts"
-        if scripts_path.exists():
-            script_subdirs_present = [
-                subdir for subdir in script_subdirs
-                if (template_path / subdir).exists() and (template_path / subdir).is_dir()
-            ]
-            if not script_subdirs_present:
+        if 'delivery/scripts' in solution_dirs:
+            if not SCRIPT_SUBDIRS & solution_dirs:
                 self.errors.append("At least one script subdirectory must exist in delivery/scripts/ (ansible, bash, powershell, python, or terraform)")
         else:
             self.errors.append("Missing required directory: delivery/scripts")
 
-        # Check for extra files and directories
-        solution_files = set()
-        solution_dirs = set()
-
-        for root, dirs, files in os.walk(template_path):
-            rel_root = Path(root).relative_to(template_path)
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-            # Record directories
-            for dir_name in dirs:
-                if rel_root == Path('.'):
-                    dir_path = dir_name
-                else:
-                    dir_path = str(rel_root / dir_name)
-                solution_dirs.add(dir_path)
-
-            # Record files
-            for file in files:
-                if not file.startswith('.') and not file.endswith('.pptx'):
-                    if rel_root == Path('.'):
-                        file_path = file
-                    else:
-                        file_path = str(rel_root / file)
-                    solution_files.add(file_path)
-
         # Check for extra files
-        extra_files = solution_files - set(template_files.keys())
+        extra_files = solution_files - template.files
         if extra_files:
             self.warnings.append(f"Extra files not in solution-template: {', '.join(sorted(extra_files))}")
 
-        # Check for extra directories - allow common script subdirectories
-        extra_dirs = solution_dirs - set(template_dirs.keys())
-        allowed_extra_dirs = {
-            'delivery/scripts/terraform/modules',
-            'delivery/scripts/terraform/scripts',
-            'delivery/scripts/ansible/group_vars',
-            'delivery/scripts/ansible/inventory'
+        # Check for extra directories - allowed script subdirectories may contain anything
+        extra_dirs = {
+            extra_dir for extra_dir in solution_dirs - template.dirs
+            if extra_dir not in ALLOWED_EXTRA_DIRS and not extra_dir.startswith(ALLOWED_EXTRA_DIR_PREFIXES)
         }
-        # Filter out allowed extra directories and their subdirectories
-        filtered_extra_dirs = []
-        for extra_dir in extra_dirs:
-            is_allowed = False
-            for allowed_dir in allowed_extra_dirs:
-                if extra_dir == allowed_dir or extra_dir.startswith(allowed_dir + '/'):
-                    is_allowed = True
-                    break
-            if not is_allowed:
-                filtered_extra_dirs.append(extra_dir)
-
-        if filtered_extra_dirs:
-            self.errors.append(f"Extra directories not in solution-template: {', '.join(sorted(filtered_extra_dirs))}")
+        if extra_dirs:
+            self.errors.append(f"Extra directories not in solution-template: {', '.join(sorted(extra_dirs))}")
 
         print(f"   ✅ Structure validation completed")
 
@@ -309,37 +303,62 @@ class EnhancedTemplateValidator:
 
         print(f"   ✅ Metadata validation completed")
 
-    def validate_security(self, template_path):
-        """Scan for potential security issues"""
-        print(f"🔍 Scanning for security issues...")
+    def validate_security(self, template_path, scan_office=True):
+        """Scan for potential security issues
 
-        # List of patterns that might indicate secrets
-        secret_patterns = [
-            'password=', 'secret=', 'key=', 'token=', 'credential=',
-            'aws_access_key=', 'aws_secret_key=', 'api_key='
-        ]
+        Office documents are only opened when scan_office is set; they cost
+        several times more than every other check together.
+        """
+        print(f"🔍 Scanning for security issues...")
 
         security_issues = 0
+        office_files = []
         for root, dirs, files in os.walk(template_path):
             dirs[:] = [d for d in dirs if not d.startswith('.')]
             for file in files:
-                if file.endswith(('.py', '.sh', '.ps1', '.yml', '.yaml', '.json', '.tf')):
+                if file.endswith(SECRET_SCAN_EXTENSIONS):
                     file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read().lower()
-                            for pattern in secret_patterns:
-                                if pattern in content:
-                                    rel_path = file_path.relative_to(template_path)
-                                    self.warnings.append(f"Potential secret in {rel_path}: contains '{pattern}'")
-                                    security_issues += 1
-                    except Exception:
-                        continue
+                    rel_path = file_path.relative_to(template_path)
+                    for hit in self.secret_scanner.scan_file(file_path, display_path=rel_path):
+                        self.warnings.append(f"Potential secret in {hit}")
+                        security_issues += 1
+                elif file.endswith(OFFICE_SCAN_EXTENSIONS) and not file.startswith('~$'):
+                    file_path = Path(root) / file
+                    office_files.append((file_path, file_path.relative_to(template_path)))
+
+        if not scan_office:
+            print(f"   ✅ Security scan completed ({security_issues} potential issues found, "
+                  f"{len(office_files)} Office documents not scanned - use --scan-office)")
+            return
+
+        # Office documents are where customer data most often leaks
+        for hits, problems in scan_office_files(office_files, jobs=self.scan_jobs):
+            for hit in hits:
+                self.warnings.append(f"Potential {hit.kind} in {hit}")
+                security_issues += 1
+            for problem in problems:
+                self.warnings.append(f"Could not scan {problem}")
 
-        print(f"   ✅ Security scan completed ({security_issues} potential issues found)")
+        print(f"   ✅ Security scan completed ({security_issues} potential issues found, {len(office_files)} Office documents scanned)")
 
     def validate_template(self, template_path):
         """Validate a single template with enhanced checks"""
+        result = self.check_template(template_path)
+        print(result.log, end='')
+        self.errors = list(result.errors)
+        self.warnings = list(result.warnings)
+        return result.passed
+
+    def check_template(self, template_path, scan_office=True):
+        """Validate a single template, capturing its report in an immutable result"""
+        log = io.StringIO()
+        with redirect_stdout(log):
+            self._run_checks(template_path, scan_office)
+        return TemplateResult(path=template_path, errors=tuple(self.errors),
+                              warnings=tuple(self.warnings), log=log.getvalue())
+
+    def _run_checks(self, template_path, scan_office=True):
+        """Run every check on a template, recording into self.errors and self.warnings"""
         self.errors = []
         self.warnings = []
 
@@ -348,13 +367,13 @@ class EnhancedTemplateValidator:
 
         if not template_path.exists():
             self.errors.append(f"Template path does not exist: {template_path}")
-            return False
+            return
 
         # Enhanced validation steps
         self.validate_folder_structure(template_path)
         self.validate_provider_category_authorization(template_path)
         self.validate_metadata(template_path)
-        self.validate_security(template_path)
+        self.validate_security(template_path, scan_office)
 
         # Report results
         print("\n📊 VALIDATION RESULTS:")
@@ -375,37 +394,82 @@ class EnhancedTemplateValidator:
         elif not self.errors:
             print("⚠️  Validation PASSED with warnings")
 
-        return len(self.errors) == 0
+    def validate_all_templates(self, jobs=1, scan_office=False):
+        """Validate all templates in repository
 
-    def validate_all_templates(self):
-        """Validate all templates in repository"""
+        With jobs > 1 solutions are validated in a process pool; reports are
+        still printed in sorted solution order. Office documents are only
+        scanned with scan_office.
+        """
         print("🚀 Enhanced Template Validation Starting...")
         print("=" * 80)
 
-        success_count = 0
-        total_count = 0
-        failed_solutions = []
-
         # Find all template directories in solutions folder
         solutions_path = self.repo_root / "solutions"
         if not solutions_path.exists():
             print(f"❌ Solutions directory not found: {solutions_path}")
             return False
 
-        for provider_path in sorted(solutions_path.iterdir()):
-            if provider_path.is_dir() and not provider_path.name.startswith('.'):
-                for category_path in sorted(provider_path.iterdir()):
-                    if category_path.is_dir() and not category_path.name.startswith('.'):
-                        for solution_path in sorted(category_path.iterdir()):
-                            if solution_path.is_dir() and not solution_path.name.startswith('.'):
-                                total_count += 1
-                                if self.validate_template(solution_path):
-                                    success_count += 1
-                                    print("✅ PASSED")
-                                else:
-                                    failed_solutions.append(str(solution_path.relative_to(self.repo_root)))
-                                    print("❌ FAILED")
-                                print()
+        solution_paths = [solution.path for solution in discover_solutions(solutions_path, require_metadata=False, use_cache=True)]
+        return self._validate_templates(solution_paths, jobs, scan_office)
+
+    def validate_changed_templates(self, ref, jobs=1, scan_office=False):
+        """Validate only the solutions with files changed since a git ref
+
+        Changes to shared inputs (the solution template, catalog.yml or the
+        validator itself) can affect every solution and trigger a full run,
+        as does a ref git cannot diff against. Office documents of changed
+        solutions are always scanned; a full run only scans them with scan_office.
+        """
+        try:
+            changes = changed_solutions(self.repo_root, ref, shared_paths=SHARED_VALIDATION_INPUTS)
+        except RuntimeError as e:
+            print(f"⚠️ Could not determine changes since {ref}: {e}")
+            print("🌐 Falling back to validating all templates")
+            return self.validate_all_templates(jobs, scan_office)
+
+        if changes.full_run:
+            print(f"🌐 Shared input changed since {ref}: {changes.full_run_trigger} - validating all templates")
+            return self.validate_all_templates(jobs, scan_office)
+
+        print(f"🚀 Enhanced Template Validation Starting (changed since {ref})...")
+        print("=" * 80)
+
+        solution_paths = []
+        for key in changes.solutions:
+            solution_path = self.repo_root / "solutions" / key
+            if solution_path.is_dir():
+                solution_paths.append(solution_path)
+            else:
+                print(f"⏭️  Skipping removed solution: {key}")
+
+        if not solution_paths:
+            print(f"ℹ️ No changed solutions to validate since {ref}")
+            return True
+
+        print(f"🎯 {len(solution_paths)} changed solution(s):")
+        for solution_path in solution_paths:
+            print(f"   - {solution_path.relative_to(self.repo_root / 'solutions')}")
+        print()
+
+        return self._validate_templates(solution_paths, jobs, scan_office=True)
+
+    def _validate_templates(self, solution_paths, jobs=1, scan_office=True):
+        """Validate the given solutions in order and print the final summary"""
+        success_count = 0
+        total_count = 0
+        failed_solutions = []
+
+        for result in self.check_templates(solution_paths, jobs, scan_office):
+            total_count += 1
+            print(result.log, end='')
+            if result.passed:
+                success_count += 1
+                print("✅ PASSED")
+            else:
+                failed_solutions.append(str(result.path.relative_to(self.repo_root)))
+                print("❌ FAILED")
+            print()
 
         # Final summary
         print("🎯 FINAL VALIDATION SUMMARY:")
@@ -423,23 +487,56 @@ class EnhancedTemplateValidator:
 
         return success_count == total_count
 
+    def check_templates(self, template_paths, jobs=1, scan_office=True):
+        """Yield a TemplateResult per template, in the order given"""
+        if jobs > 1 and len(template_paths) > 1:
+            chunksize = max(1, len(template_paths) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+                yield from executor.map(_check_template, template_paths, repeat(scan_office), chunksize=chunksize)
+        else:
+            for template_path in template_paths:
+                yield self.check_template(template_path, scan_office)
+
+
+# Validator owned by each pool worker, so no state is shared between processes
+_worker_validator = None
+
+
+def _init_worker():
+    """Process pool initializer: load the authorized lists once per worker, quietly"""
+    global _worker_validator
+    with redirect_stdout(io.StringIO()):
+        _worker_validator = EnhancedTemplateValidator()
+
+
+def _check_template(template_path, scan_office):
+    return _worker_validator.check_template(template_path, scan_office)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Enhanced EO Framework™ Template Validator')
     parser.add_argument('--path', help='Specific template path to validate')
     parser.add_argument('--all', action='store_true', help='Validate all templates')
+    parser.add_argument('--changed-since', metavar='REF', help='Validate only solutions with files changed since a git ref')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for --all and --changed-since (default: 1)')
+    parser.add_argument('--scan-office', action='store_true', help='Also scan Office documents when validating all templates (always done for --path and changed solutions)')
 
     args = parser.parse_args()
-    validator = EnhancedTemplateValidator()
+    # Office documents of a single solution are scanned in parallel unless
+    # solutions themselves are spread over worker processes
+    validator = EnhancedTemplateValidator(scan_jobs=max(1, args.jobs))
 
     if args.path:
         path = Path(args.path)
         if not path.is_absolute():
             path = validator.repo_root / path
         success = validator.validate_template(path)
+    elif args.changed_since:
+        success = validator.validate_changed_templates(args.changed_since, jobs=max(1, args.jobs), scan_office=args.scan_office)
     elif args.all:
-        success = validator.validate_all_templates()
+        success = validator.validate_all_templates(jobs=max(1, args.jobs), scan_office=args.scan_office)
     else:
-        print("Please specify --path or --all")
+        print("Please specify --path, --changed-since or --all")
         print("Example: python validate-template-improved.py --all")
         print("Example: python validate-template-improved.py --path solutions/aws/ai/intelligent-document-processing")
         return 1